@@ -14,10 +14,16 @@ This system:
 import os
 import time
 import json
+import signal
+import asyncio
+import itertools
+import threading
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Hashable, Set, Tuple
 import yaml
 
 
@@ -32,20 +38,24 @@ class TaskPriority:
 class Task:
     """Autonomous task definition"""
     
+    _sequence = itertools.count(1)  # Keeps ids unique within one millisecond
+    
     def __init__(self, 
                  title: str,
                  description: str,
                  action: str,
                  priority: int = TaskPriority.MEDIUM,
                  estimated_time: int = 60,
-                 dependencies: List[str] = None):
-        self.id = f"task_{int(time.time() * 1000)}"
+                 dependencies: List[str] = None,
+                 resources: List[str] = None):
+        self.id = f"task_{int(time.time() * 1000)}_{next(Task._sequence)}"
         self.title = title
         self.description = description
         self.action = action  # Shell command or Python code
         self.priority = priority
         self.estimated_time = estimated_time  # seconds
         self.dependencies = dependencies or []
+        self.resources = resources or []  # Files/git state touched; '*' = everything
         self.created_at = datetime.utcnow()
         self.status = "pending"  # pending, in_progress, completed, failed
         self.result = None
@@ -61,44 +71,267 @@ class Task:
             'priority': self.priority,
             'estimated_time': self.estimated_time,
             'dependencies': self.dependencies,
+            'resources': self.resources,
             'created_at': self.created_at.isoformat(),
             'status': self.status,
             'result': self.result,
             'error': self.error
         }
+    
+    def clone(self) -> 'Task':
+        """Create a fresh pending task with the same definition"""
+        return Task(
+            title=self.title,
+            description=self.description,
+            action=self.action,
+            priority=self.priority,
+            estimated_time=self.estimated_time,
+            dependencies=list(self.dependencies),
+            resources=list(self.resources)
+        )
+    
+    def conflicts_with(self, other: 'Task') -> bool:
+        """Check whether two tasks may not run at the same time"""
+        if '*' in self.resources or '*' in other.resources:
+            return True
+        return bool(set(self.resources) & set(other.resources))
+
+
+class GenerationRule:
+    """Task generation rule with an input fingerprint for result reuse
+    
+    A rule whose fingerprint is unchanged since its last run is not
+    evaluated again. Level-triggered rules (replay=True) re-emit fresh
+    copies of their previous tasks; edge-triggered rules (replay=False)
+    only report changes and therefore emit nothing.
+    """
+    
+    def __init__(self,
+                 check: Callable[[], List[Task]],
+                 fingerprint: Optional[Callable[[], Hashable]] = None,
+                 timeout: float = 10.0,
+                 replay: bool = True):
+        self.check = check
+        self.fingerprint = fingerprint  # None = never cached
+        self.timeout = timeout  # seconds
+        self.replay = replay
+        self.name = getattr(check, '__name__', repr(check))
+        
+        # Cache state
+        self.last_fingerprint: Optional[Hashable] = None
+        self.last_tasks: List[Task] = []
+        self.has_result = False
+        self.pending_future = None  # Still running after a timeout
+        
+        # Metrics
+        self.runs = 0
+        self.cache_hits = 0
+        self.timeouts = 0
+    
+    def cached_tasks(self) -> List[Task]:
+        """Tasks to emit when the inputs are unchanged"""
+        self.cache_hits += 1
+        if not self.replay:
+            return []
+        return [task.clone() for task in self.last_tasks]
+    
+    def store(self, fingerprint: Optional[Hashable], tasks: List[Task]):
+        """Remember the result for the given input fingerprint"""
+        self.runs += 1
+        self.last_fingerprint = fingerprint
+        self.last_tasks = [task.clone() for task in tasks]
+        self.has_result = fingerprint is not None
+
+
+class TaskEventLog:
+    """Append-only JSONL task event log with periodic compact snapshots
+    
+    Every state change is one line in logs/tasks_YYYYMMDD.jsonl:
+    generated (full task), started, completed and failed (by task id).
+    A snapshot file next to it holds the summary at a byte offset, so a
+    reader only replays the events written after the last snapshot.
+    """
+    
+    EVENTS = ('generated', 'started', 'completed', 'failed')
+    RECENT_LIMIT = 10  # Completed/failed tasks kept in the summary
+    
+    def __init__(self, log_dir: Path, snapshot_every: int = 500):
+        self.log_dir = log_dir
+        self.snapshot_every = snapshot_every
+        self.events_since_snapshot = 0
+        self._day = None
+        self._file = None
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def snapshot_path(log_file: Path) -> Path:
+        """Snapshot file belonging to an event log file"""
+        return log_file.with_name(log_file.stem + '.snapshot.json')
+    
+    @property
+    def log_file(self) -> Path:
+        """Event log file for the current day"""
+        return self.log_dir / f"tasks_{datetime.utcnow().strftime('%Y%m%d')}.jsonl"
+    
+    def _open(self):
+        """Open (or roll over to) today's event log; caller holds the lock"""
+        day = datetime.utcnow().strftime('%Y%m%d')
+        if self._file is not None and day == self._day:
+            return
+        
+        if self._file is not None:
+            self._file.close()
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._day = day
+        self._file = open(self.log_file, 'a', encoding='utf-8')
+        # A new day's file needs its own snapshot to be self-contained
+        self.events_since_snapshot = self.snapshot_every
+    
+    def append(self, event: str, task: Task, **fields):
+        """Append one task event"""
+        record = {'event': event, 'timestamp': datetime.utcnow().isoformat()}
+        if event == 'generated':
+            record['task'] = task.to_dict()
+        else:
+            record['id'] = task.id
+        record.update(fields)
+        line = json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        
+        with self._lock:
+            self._open()
+            self._file.write(line)
+            self._file.flush()
+            self.events_since_snapshot += 1
+    
+    def needs_snapshot(self) -> bool:
+        """Check whether enough events accumulated since the last snapshot"""
+        return self.events_since_snapshot >= self.snapshot_every
+    
+    def write_snapshot(self, summary: Dict[str, Any]):
+        """Write the current summary together with the log offset it covers"""
+        with self._lock:
+            self._open()
+            self._file.flush()
+            log_file = self.log_file
+            snapshot = dict(summary, offset=self._file.tell())
+            
+            snapshot_file = self.snapshot_path(log_file)
+            tmp_file = snapshot_file.with_suffix('.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, default=str)
+            os.replace(tmp_file, snapshot_file)
+            
+            self.events_since_snapshot = 0
+    
+    def close(self):
+        """Close the current event log file"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+    
+    @classmethod
+    def read_summary(cls, log_file: Path) -> Dict[str, Any]:
+        """Derive the task summary from the last snapshot plus later events"""
+        snapshot = {}
+        snapshot_file = cls.snapshot_path(log_file)
+        if snapshot_file.exists():
+            with open(snapshot_file, encoding='utf-8') as f:
+                snapshot = json.load(f)
+        
+        pending = {t['id']: t for t in snapshot.get('pending', [])}
+        pending.update((t['id'], t) for t in snapshot.get('running', []))
+        completed = deque(snapshot.get('completed', []), maxlen=cls.RECENT_LIMIT)
+        failed = deque(snapshot.get('failed', []), maxlen=cls.RECENT_LIMIT)
+        totals = {
+            'total_generated': snapshot.get('total_generated', 0),
+            'total_completed': snapshot.get('total_completed', 0),
+            'total_failed': snapshot.get('total_failed', 0),
+        }
+        timestamp = snapshot.get('timestamp')
+        
+        if log_file.exists():
+            with open(log_file, 'rb') as f:
+                f.seek(snapshot.get('offset', 0))
+                for raw in f:
+                    try:
+                        record = json.loads(raw)
+                    except ValueError:
+                        continue  # Partially written last line
+                    
+                    event = record.get('event')
+                    timestamp = record.get('timestamp', timestamp)
+                    if event == 'generated':
+                        task = record['task']
+                        pending[task['id']] = task
+                        totals['total_generated'] += 1
+                    elif event == 'started':
+                        task = pending.setdefault(record['id'], {'id': record['id']})
+                        task['status'] = 'in_progress'
+                    elif event == 'completed':
+                        task = pending.pop(record['id'], {'id': record['id']})
+                        task.update(status='completed', result=record.get('result'))
+                        completed.append(task)
+                        totals['total_completed'] += 1
+                    elif event == 'failed':
+                        task = pending.pop(record['id'], {'id': record['id']})
+                        task.update(status='failed', error=record.get('error'))
+                        failed.append(task)
+                        totals['total_failed'] += 1
+        
+        tasks = list(pending.values())
+        return dict(
+            totals,
+            timestamp=timestamp,
+            pending=[t for t in tasks if t.get('status') != 'in_progress'],
+            running=[t for t in tasks if t.get('status') == 'in_progress'],
+            completed=list(completed),
+            failed=list(failed)
+        )
 
 
 class RealtimeTaskGenerator:
     """Generates tasks in real-time based on repository state"""
     
-    def __init__(self, repo_path: Path = Path('.')):
+    # Directories never scanned for file changes (logs/ is our own output)
+    EXCLUDED_DIRS = {'.git', 'venv', '.venv', 'build', 'dist', '__pycache__', 'node_modules', 'logs'}
+    
+    def __init__(self, repo_path: Path = Path('.'), max_rule_workers: int = 4):
         self.repo_path = repo_path
         self.task_queue: List[Task] = []
         self.completed_tasks: List[Task] = []
         self.failed_tasks: List[Task] = []
+        self.running_tasks: Dict[str, Task] = {}
+        self._task_futures: Set[asyncio.Future] = set()  # In flight across drains
         
         # State tracking
         self.last_commit_time = None
         self.last_health_check = None
         self.file_modifications: Dict[str, float] = {}
         
-        # Task generation rules
+        # Task generation rules with the inputs each one depends on
         self.generation_rules = [
-            self._check_uncommitted_changes,
-            self._check_health_status,
-            self._check_code_quality,
-            self._check_documentation_coverage,
-            self._check_test_coverage,
-            self._check_dependencies,
-            self._check_issues,
-            self._check_prs,
-            self._check_performance,
-            self._check_security,
+            GenerationRule(self._check_uncommitted_changes, self._fingerprint_worktree, timeout=5),
+            GenerationRule(self._check_health_status, self._fingerprint_health_file),
+            GenerationRule(self._check_code_quality, self._fingerprint_python_files, replay=False),
+            GenerationRule(self._check_documentation_coverage, self._fingerprint_repo_root),
+            GenerationRule(self._check_test_coverage, self._fingerprint_repo_root),
+            GenerationRule(self._check_dependencies, self._fingerprint_requirements),
+            GenerationRule(self._check_issues, self._fingerprint_static),
+            GenerationRule(self._check_prs, self._fingerprint_static),
+            GenerationRule(self._check_performance, self._fingerprint_static),
+            GenerationRule(self._check_security, self._fingerprint_static),
         ]
+        self.max_rule_workers = max_rule_workers
+        self._rule_executor: Optional[ThreadPoolExecutor] = None
+        self._tree_snapshot: Optional[Tuple[Tuple[int, int, int], Tuple[int, int, int]]] = None
         
         # Load genome for decision making
         self.genome = self._load_genome()
         
+        # Append-only task event log
+        self.event_log = TaskEventLog(self.repo_path / 'logs')
+        
         # Metrics
         self.total_tasks_generated = 0
         self.total_tasks_completed = 0
@@ -112,6 +345,105 @@ class RealtimeTaskGenerator:
                 return yaml.safe_load(f)
         return {}
     
+    def _scan_tree(self) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+        """Scan the working tree once per cycle
+        
+        Returns (all files, Python files) fingerprints, each a tuple of
+        (file count, newest mtime_ns, total size).
+        """
+        if self._tree_snapshot is not None:
+            return self._tree_snapshot
+        
+        all_count = all_mtime = all_size = 0
+        py_count = py_mtime = py_size = 0
+        stack = [str(self.repo_path)]
+        
+        while stack:
+            try:
+                entries = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in self.EXCLUDED_DIRS:
+                                stack.append(entry.path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    all_count += 1
+                    all_mtime = max(all_mtime, st.st_mtime_ns)
+                    all_size += st.st_size
+                    if entry.name.endswith('.py'):
+                        py_count += 1
+                        py_mtime = max(py_mtime, st.st_mtime_ns)
+                        py_size += st.st_size
+        
+        self._tree_snapshot = ((all_count, all_mtime, all_size), (py_count, py_mtime, py_size))
+        return self._tree_snapshot
+    
+    def _stat_key(self, path: Path) -> Tuple[int, int]:
+        """(mtime_ns, size) of a file, or (0, -1) if missing"""
+        try:
+            st = path.stat()
+            return (st.st_mtime_ns, st.st_size)
+        except OSError:
+            return (0, -1)
+    
+    def _git_head(self) -> str:
+        """Resolve HEAD by reading .git directly (no subprocess)"""
+        git_dir = self.repo_path / '.git'
+        try:
+            head = (git_dir / 'HEAD').read_text().strip()
+        except OSError:
+            return ''
+        
+        if not head.startswith('ref: '):
+            return head
+        
+        ref = head[5:]
+        try:
+            return (git_dir / ref).read_text().strip()
+        except OSError:
+            pass
+        try:
+            for line in (git_dir / 'packed-refs').read_text().splitlines():
+                if line.endswith(' ' + ref):
+                    return line.split(' ', 1)[0]
+        except OSError:
+            pass
+        return head
+    
+    def _fingerprint_worktree(self) -> Hashable:
+        """Inputs of git status: HEAD, index and working tree"""
+        return (
+            self._git_head(),
+            self._stat_key(self.repo_path / '.git' / 'index'),
+            self._scan_tree()[0]
+        )
+    
+    def _fingerprint_python_files(self) -> Hashable:
+        """Inputs of the code quality check"""
+        return self._scan_tree()[1]
+    
+    def _fingerprint_health_file(self) -> Hashable:
+        """Inputs of the health check"""
+        return self._stat_key(self.repo_path / 'metrics' / 'latest_health.json')
+    
+    def _fingerprint_repo_root(self) -> Hashable:
+        """Top-level entries change the repo root mtime"""
+        return self._stat_key(self.repo_path)
+    
+    def _fingerprint_requirements(self) -> Hashable:
+        """requirements.txt plus the current day (age threshold moves daily)"""
+        return (self._stat_key(self.repo_path / 'requirements.txt'), int(time.time() // 86400))
+    
+    def _fingerprint_static(self) -> Hashable:
+        """Rules without repository inputs"""
+        return ()
+    
     def _check_uncommitted_changes(self) -> List[Task]:
         """Check for uncommitted changes"""
         tasks = []
@@ -133,7 +465,8 @@ class RealtimeTaskGenerator:
                     description="Found uncommitted changes in repository",
                     action="git add -A && git commit -m '🤖 Auto-commit: Real-time updates' && git push",
                     priority=TaskPriority.HIGH,
-                    estimated_time=30
+                    estimated_time=30,
+                    resources=['*']
                 ))
         except Exception as e:
             print(f"Error checking git status: {e}")
@@ -159,7 +492,8 @@ class RealtimeTaskGenerator:
                         description=f"Current health: {overall:.1%}. Need improvement.",
                         action="python3 .github/scripts/health_monitor.py",
                         priority=TaskPriority.HIGH,
-                        estimated_time=60
+                        estimated_time=60,
+                        resources=['metrics']
                     ))
                 
                 # Check individual vital signs
@@ -171,7 +505,8 @@ class RealtimeTaskGenerator:
                         description="Code quality below 80%",
                         action="black . && isort .",
                         priority=TaskPriority.MEDIUM,
-                        estimated_time=45
+                        estimated_time=45,
+                        resources=['*']
                     ))
         
         return tasks
@@ -195,7 +530,8 @@ class RealtimeTaskGenerator:
                     description=f"Format and optimize {py_file}",
                     action=f"black {py_file} && isort {py_file}",
                     priority=TaskPriority.LOW,
-                    estimated_time=10
+                    estimated_time=10,
+                    resources=[str(py_file)]
                 ))
                 
                 self.file_modifications[str(py_file)] = time.time()
@@ -222,7 +558,8 @@ class RealtimeTaskGenerator:
                     description=description,
                     action=f"python3 .github/scripts/autonomous_developer.py --create-doc {doc_file}",
                     priority=TaskPriority.MEDIUM,
-                    estimated_time=120
+                    estimated_time=120,
+                    resources=[doc_file]
                 ))
         
         return tasks
@@ -239,7 +576,8 @@ class RealtimeTaskGenerator:
                 description="Initialize testing infrastructure",
                 action="mkdir -p tests && touch tests/__init__.py",
                 priority=TaskPriority.HIGH,
-                estimated_time=30
+                estimated_time=30,
+                resources=['tests']
             ))
         
         return tasks
@@ -303,21 +641,65 @@ class RealtimeTaskGenerator:
         
         return tasks
     
-    def generate_tasks(self) -> List[Task]:
-        """Generate tasks based on current state"""
-        new_tasks = []
+    def _run_rules(self) -> List[Task]:
+        """Evaluate stale rules concurrently, reuse cached results for the rest"""
+        self._tree_snapshot = None  # Rescan once per cycle
+        results: List[List[Task]] = [[] for _ in self.generation_rules]
+        submitted = []
+        
+        if self._rule_executor is None:
+            self._rule_executor = ThreadPoolExecutor(
+                max_workers=self.max_rule_workers,
+                thread_name_prefix='task-rule'
+            )
         
-        # Run all generation rules
-        for rule in self.generation_rules:
+        for index, rule in enumerate(self.generation_rules):
+            # A rule that timed out earlier is skipped until it finishes
+            if rule.pending_future is not None:
+                if not rule.pending_future.done():
+                    continue
+                rule.pending_future = None
+            
             try:
-                tasks = rule()
-                new_tasks.extend(tasks)
+                fingerprint = rule.fingerprint() if rule.fingerprint else None
             except Exception as e:
-                print(f"Error in rule {rule.__name__}: {e}")
+                print(f"Error fingerprinting rule {rule.name}: {e}")
+                fingerprint = None
+            
+            if rule.has_result and fingerprint is not None and fingerprint == rule.last_fingerprint:
+                results[index] = rule.cached_tasks()
+                continue
+            
+            future = self._rule_executor.submit(rule.check)
+            submitted.append((index, rule, fingerprint, future, time.monotonic() + rule.timeout))
         
+        for index, rule, fingerprint, future, deadline in submitted:
+            try:
+                tasks = future.result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                rule.timeouts += 1
+                rule.pending_future = future
+                print(f"Rule {rule.name} timed out after {rule.timeout}s")
+                continue
+            except Exception as e:
+                print(f"Error in rule {rule.name}: {e}")
+                continue
+            
+            rule.store(fingerprint, tasks)
+            results[index] = tasks
+        
+        return [task for tasks in results for task in tasks]
+    
+    def generate_tasks(self) -> List[Task]:
+        """Generate tasks based on current state"""
+        return self._accept_new_tasks(self._run_rules())
+    
+    def _accept_new_tasks(self, new_tasks: List[Task]) -> List[Task]:
+        """Drop rule output already queued or running and log the rest as generated"""
         # Deduplicate tasks against each other AND against the active queue
         # This prevents spamming the queue with the same pending actions
         seen_titles = {t.title for t in self.task_queue}
+        seen_titles.update(t.title for t in list(self.running_tasks.values()))
         unique_tasks = []
         for task in new_tasks:
             if task.title not in seen_titles:
@@ -325,6 +707,8 @@ class RealtimeTaskGenerator:
                 unique_tasks.append(task)
         
         self.total_tasks_generated += len(unique_tasks)
+        for task in unique_tasks:
+            self.event_log.append('generated', task)
         
         return unique_tasks
     
@@ -333,6 +717,22 @@ class RealtimeTaskGenerator:
         # Sort by priority, then estimated time
         return sorted(tasks, key=lambda t: (t.priority, t.estimated_time))
     
+    def _complete_task(self, task: Task, output: str):
+        """Record a successful task"""
+        task.status = "completed"
+        task.result = output
+        self.completed_tasks.append(task)
+        self.total_tasks_completed += 1
+        self.event_log.append('completed', task, result=output)
+    
+    def _fail_task(self, task: Task, error: str):
+        """Record a failed task"""
+        task.status = "failed"
+        task.error = error
+        self.failed_tasks.append(task)
+        self.total_tasks_failed += 1
+        self.event_log.append('failed', task, error=error)
+    
     def execute_task(self, task: Task) -> bool:
         """Execute a single task"""
         print(f"\n🚀 Executing: {task.title}")
@@ -340,6 +740,7 @@ class RealtimeTaskGenerator:
         print(f"   Action: {task.action}")
         
         task.status = "in_progress"
+        self.event_log.append('started', task)
         
         try:
             # Execute the action
@@ -353,93 +754,237 @@ class RealtimeTaskGenerator:
             )
             
             if result.returncode == 0:
-                task.status = "completed"
-                task.result = result.stdout
-                self.completed_tasks.append(task)
-                self.total_tasks_completed += 1
+                self._complete_task(task, result.stdout)
                 print(f"   ✅ Success!")
                 return True
             else:
-                task.status = "failed"
-                task.error = result.stderr
-                self.failed_tasks.append(task)
-                self.total_tasks_failed += 1
+                self._fail_task(task, result.stderr)
                 print(f"   ❌ Failed: {result.stderr[:100]}")
                 return False
                 
         except subprocess.TimeoutExpired:
-            task.status = "failed"
-            task.error = "Timeout"
-            self.failed_tasks.append(task)
-            self.total_tasks_failed += 1
+            self._fail_task(task, "Timeout")
             print(f"   ⏰ Timeout!")
             return False
         except Exception as e:
-            task.status = "failed"
-            task.error = str(e)
-            self.failed_tasks.append(task)
-            self.total_tasks_failed += 1
+            self._fail_task(task, str(e))
             print(f"   ❌ Error: {e}")
             return False
     
-    def save_task_log(self):
-        """Save task execution log"""
-        log_dir = self.repo_path / 'logs'
-        log_dir.mkdir(exist_ok=True)
+    async def execute_task_async(self, task: Task) -> bool:
+        """Execute a single task as an asyncio subprocess"""
+        print(f"\n🚀 Starting: {task.title} ({task.action})")
         
-        log_file = log_dir / f"tasks_{datetime.utcnow().strftime('%Y%m%d')}.json"
+        task.status = "in_progress"
+        self.running_tasks[task.id] = task
+        self.event_log.append('started', task)
         
-        log_data = {
+        proc = None
+        try:
+            # New session so a timeout can kill the whole shell pipeline
+            proc = await asyncio.create_subprocess_shell(
+                task.action,
+                cwd=str(self.repo_path),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=(os.name == 'posix')
+            )
+            
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=task.estimated_time)
+            except asyncio.TimeoutError:
+                self._kill_process(proc)
+                await proc.wait()
+                self._fail_task(task, "Timeout")
+                print(f"   ⏰ Timeout: {task.title}")
+                return False
+            
+            if proc.returncode == 0:
+                self._complete_task(task, stdout.decode(errors='replace'))
+                print(f"   ✅ Success: {task.title}")
+                return True
+            else:
+                error = stderr.decode(errors='replace')
+                self._fail_task(task, error)
+                print(f"   ❌ Failed: {task.title}: {error[:100]}")
+                return False
+                
+        except Exception as e:
+            self._fail_task(task, str(e))
+            print(f"   ❌ Error: {task.title}: {e}")
+            return False
+        except BaseException as e:
+            # Cancellation and Ctrl-C must not orphan the task's process group
+            if proc is not None and proc.returncode is None:
+                self._kill_process(proc)
+                if isinstance(e, asyncio.CancelledError):
+                    await proc.wait()  # Reap it while the loop is still running
+            self._fail_task(task, f"Cancelled ({type(e).__name__})")
+            print(f"   🛑 Cancelled: {task.title}")
+            raise
+        finally:
+            self.running_tasks.pop(task.id, None)
+    
+    def _kill_process(self, proc):
+        """Kill a task subprocess and everything it spawned"""
+        try:
+            if os.name == 'posix':
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+        except ProcessLookupError:
+            pass
+    
+    def _select_runnable_tasks(self, free_slots: int) -> List[Task]:
+        """Pop the highest priority tasks that conflict with nothing running"""
+        selected = []
+        busy = list(self.running_tasks.values())
+        
+        for task in list(self.task_queue):
+            if len(selected) >= free_slots:
+                break
+            if any(task.conflicts_with(other) for other in busy):
+                continue
+            self.task_queue.remove(task)
+            self.running_tasks[task.id] = task
+            selected.append(task)
+            busy.append(task)
+        
+        return selected
+    
+    async def drain_queue_async(self, workers: int = 4,
+                                until: Optional[float] = None) -> int:
+        """Run queued tasks with up to `workers` in parallel
+        
+        Returns when the queue is empty and nothing is running, or when the
+        event loop clock reaches `until`. Tasks still running at that point
+        keep running in the background and keep holding their worker slot in
+        later drains. Returns the number of tasks started.
+        """
+        loop = asyncio.get_running_loop()
+        running = self._task_futures
+        started = 0
+        
+        while True:
+            for task in self._select_runnable_tasks(workers - len(self.running_tasks)):
+                future = asyncio.ensure_future(self.execute_task_async(task))
+                running.add(future)
+                future.add_done_callback(running.discard)
+                started += 1
+            
+            if not running:
+                return started
+            
+            timeout = None if until is None else until - loop.time()
+            if timeout is not None and timeout <= 0:
+                return started
+            
+            done, _ = await asyncio.wait(
+                set(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                return started
+    
+    def _task_summary(self) -> Dict[str, Any]:
+        """Current queue summary, as stored in log snapshots"""
+        return {
             'timestamp': datetime.utcnow().isoformat(),
             'total_generated': self.total_tasks_generated,
             'total_completed': self.total_tasks_completed,
             'total_failed': self.total_tasks_failed,
             'pending': [t.to_dict() for t in self.task_queue],
-            'completed': [t.to_dict() for t in self.completed_tasks[-10:]],  # Last 10
-            'failed': [t.to_dict() for t in self.failed_tasks[-10:]],  # Last 10
+            'running': [t.to_dict() for t in self.running_tasks.values()],
+            'completed': [t.to_dict() for t in self.completed_tasks[-TaskEventLog.RECENT_LIMIT:]],
+            'failed': [t.to_dict() for t in self.failed_tasks[-TaskEventLog.RECENT_LIMIT:]],
         }
+    
+    def save_task_log(self, force: bool = False):
+        """Snapshot the task event log when enough events accumulated
+        
+        Events are appended as they happen; this only writes the periodic
+        compact snapshot, so a cycle costs O(events) instead of O(queue).
+        """
+        if force or self.event_log.needs_snapshot():
+            self.event_log.write_snapshot(self._task_summary())
+    
+    def _run_cycle(self, cycle: int, rule_tasks: Optional[List[Task]] = None) -> List[Task]:
+        """Generate, enqueue and prioritize tasks for one cycle
+        
+        rule_tasks: rule output already evaluated by the caller (pool mode)
+        """
+        print(f"\n🔄 Cycle {cycle} - {datetime.utcnow().strftime('%H:%M:%S')}")
+        
+        # Generate new tasks
+        new_tasks = self.generate_tasks() if rule_tasks is None else self._accept_new_tasks(rule_tasks)
+        
+        if new_tasks:
+            print(f"   📋 Generated {len(new_tasks)} new tasks")
+            
+            # Add to queue
+            self.task_queue.extend(new_tasks)
+            
+            # Prioritize
+            self.task_queue = self.prioritize_tasks(self.task_queue)
+        else:
+            print("   ℹ️  No new tasks generated")
         
-        with open(log_file, 'w') as f:
-            json.dump(log_data, f, indent=2)
+        return new_tasks
+    
+    def _print_stats(self):
+        """Show queue statistics"""
+        print(f"\n   📊 Stats:")
+        print(f"      Queue: {len(self.task_queue)} tasks")
+        print(f"      Running: {len(self.running_tasks)}")
+        print(f"      Completed: {self.total_tasks_completed}")
+        print(f"      Failed: {self.total_tasks_failed}")
+    
+    async def _run_pool_async(self, interval: int, workers: int):
+        """Executor mode: the worker pool keeps draining between cycles"""
+        loop = asyncio.get_running_loop()
+        cycle = 0
+        
+        while True:
+            cycle += 1
+            cycle_deadline = loop.time() + interval
+            
+            # Rules block on git/filesystem, so only they run off the loop; the
+            # queue is updated here, where task completions also mutate state
+            rule_tasks = await loop.run_in_executor(None, self._run_rules)
+            self._run_cycle(cycle, rule_tasks)
+            self._print_stats()
+            self.save_task_log()
+            
+            await self.drain_queue_async(workers=workers, until=cycle_deadline)
+            await asyncio.sleep(max(0.0, cycle_deadline - loop.time()))
     
-    def run_continuous(self, interval: int = 10):
-        """Run continuous task generation and execution"""
+    def run_continuous(self, interval: int = 10, workers: int = 1):
+        """Run continuous task generation and execution
+        
+        With workers > 1, up to that many non-conflicting tasks run in
+        parallel as asyncio subprocesses instead of one task per cycle.
+        """
         print("🧬 Real-Time Autonomous Task Generator ACTIVE")
         print(f"⏱️  Interval: {interval} seconds")
+        print(f"👷 Workers: {workers}")
         print(f"📍 Repository: {self.repo_path}")
         print("="*70)
         
         cycle = 0
         
         try:
+            if workers > 1:
+                asyncio.run(self._run_pool_async(interval, workers))
+            
             while True:
                 cycle += 1
-                print(f"\n🔄 Cycle {cycle} - {datetime.utcnow().strftime('%H:%M:%S')}")
-                
-                # Generate new tasks
-                new_tasks = self.generate_tasks()
                 
-                if new_tasks:
-                    print(f"   📋 Generated {len(new_tasks)} new tasks")
-                    
-                    # Add to queue
-                    self.task_queue.extend(new_tasks)
-                    
-                    # Prioritize
-                    self.task_queue = self.prioritize_tasks(self.task_queue)
-                    
-                    # Execute top priority task
-                    if self.task_queue:
-                        task = self.task_queue.pop(0)
-                        self.execute_task(task)
-                else:
-                    print("   ℹ️  No new tasks generated")
+                # Execute top priority task
+                if self._run_cycle(cycle) and self.task_queue:
+                    task = self.task_queue.pop(0)
+                    self.execute_task(task)
                 
                 # Show stats
-                print(f"\n   📊 Stats:")
-                print(f"      Queue: {len(self.task_queue)} tasks")
-                print(f"      Completed: {self.total_tasks_completed}")
-                print(f"      Failed: {self.total_tasks_failed}")
+                self._print_stats()
                 
                 # Save log
                 self.save_task_log()
@@ -449,17 +994,23 @@ class RealtimeTaskGenerator:
                 
         except KeyboardInterrupt:
             print("\n\n⏹️  Stopping autonomous task generator...")
+            if self._rule_executor is not None:
+                self._rule_executor.shutdown(wait=False)
+            self.save_task_log(force=True)
+            self.event_log.close()
+            finished = self.total_tasks_completed + self.total_tasks_failed
             print(f"📊 Final Stats:")
             print(f"   Total Generated: {self.total_tasks_generated}")
             print(f"   Total Completed: {self.total_tasks_completed}")
             print(f"   Total Failed: {self.total_tasks_failed}")
-            print(f"   Success Rate: {self.total_tasks_completed/(self.total_tasks_completed+self.total_tasks_failed)*100:.1f}%")
+            print(f"   Success Rate: {self.total_tasks_completed/max(finished, 1)*100:.1f}%")
 
 
 def main():
     """Main entry point"""
     generator = RealtimeTaskGenerator()
-    generator.run_continuous(interval=10)  # Check every 10 seconds
+    workers = int(os.getenv('TASK_WORKERS', '1'))
+    generator.run_continuous(interval=10, workers=workers)  # Check every 10 seconds
 
 
 if __name__ == '__main__':
@@ -46,16 +46,23 @@ import json
 import time
 import threading
 import hashlib
+import struct
 import random
+import functools
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from typing import Dict, List, Any, Optional, Callable, Sequence, Tuple
 from abc import ABC, abstractmethod
 import logging
 import os
 import sys
+import weakref
+from types import MappingProxyType
+from collections import Counter, deque
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
 from enum import Enum
+import numpy as np
 
 # Tracing setup for AI applications
 try:
@@ -68,6 +75,105 @@ try:
 except ImportError:
     print("⚠️ Agent framework observability not available, tracing disabled")
 
+# Quiet/production mode: creator acknowledgements and per-call INFO logs are
+# suppressed and hot-path activity is only recorded in the event stream
+QUIET_MODE = os.environ.get("HYPERAI_QUIET", "").lower() in ("1", "true", "yes")
+EVENT_LOG = os.environ.get("HYPERAI_EVENT_LOG")  # JSONL sink for sampled events when set
+EVENT_SAMPLE_EVERY = int(os.environ.get("HYPERAI_EVENT_SAMPLE", "1"))
+
+class EventStream:
+    """
+    Structured, sampled sink for hot-path organism events
+    Every event is counted; one in sample_every of each event type is kept
+    in a bounded in-memory ring and, when a path is set, appended as JSONL
+    (rotated to <path>.1 at max_bytes)
+    """
+
+    def __init__(self, path: Optional[str] = None, sample_every: int = 1,
+                 maxlen: int = 10000, max_bytes: int = 10 * 1024 * 1024):
+        self.path = Path(path) if path else None
+        self.sample_every = max(1, sample_every)
+        self.max_bytes = max_bytes
+        self.recent = deque(maxlen=maxlen)
+        self.counts: Counter = Counter()
+        self._file = None
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields):
+        """Count an event and keep it if it falls on the sampling stride"""
+        with self._lock:
+            self.counts[event] += 1
+            if (self.counts[event] - 1) % self.sample_every:
+                return
+            record = {"t": time.time(), "event": event, **fields}
+            self.recent.append(record)
+            if self.path is not None:
+                self._write(record)
+
+    def _write(self, record: Dict[str, Any]):
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        if self._file.tell() >= self.max_bytes:
+            self._file.close()
+            self._file = None
+            os.replace(self.path, self.path.with_name(self.path.name + ".1"))
+
+    def flush(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+EVENTS = EventStream(EVENT_LOG, EVENT_SAMPLE_EVERY)
+_acknowledged = set()
+_acknowledged_lock = threading.Lock()
+
+def set_quiet_mode(quiet: bool = True):
+    """Switch quiet/production mode for the framework, including existing loggers"""
+    global QUIET_MODE
+    QUIET_MODE = quiet
+    level = logging.WARNING if quiet else logging.INFO
+    for name in list(logging.root.manager.loggerDict):
+        if name.split(".")[0] in ("SymphonyControlCenter", "DigitalOrganism", "DigitalEcosystem"):
+            logging.getLogger(name).setLevel(level)
+
+def _acknowledge_once(component: str) -> bool:
+    """Record a creator acknowledgement; True only the first time per process outside quiet mode"""
+    with _acknowledged_lock:
+        if component in _acknowledged:
+            return False
+        _acknowledged.add(component)
+    EVENTS.emit("acknowledgement", component=component)
+    return not QUIET_MODE
+
+class _OrganismTag(logging.Filter):
+    """Default organism tag for records logged without one"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "organism"):
+            record.organism = record.name
+        return True
+
+def _organism_logger() -> logging.Logger:
+    """One logger and handler shared by all organisms; records carry the organism name"""
+    logger = logging.getLogger("DigitalOrganism")
+    logger.setLevel(logging.WARNING if QUIET_MODE else logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.addFilter(_OrganismTag())
+        handler.setFormatter(logging.Formatter('[%(organism)s] %(asctime)s - %(levelname)s - %(message)s'))
+        logger.addHandler(handler)
+    return logger
+
+ORGANISM_LOGGER = _organism_logger()
+
 class SymphonyState(Enum):
     """States of the system symphony (orchestration lifecycle).
 
@@ -162,7 +268,7 @@ class SymphonyControlCenter:
     def _setup_symphony_logging(self):
         """Setup logging cho Symphony Control Center"""
         logger = logging.getLogger("SymphonyControlCenter")
-        logger.setLevel(logging.INFO)
+        logger.setLevel(logging.WARNING if QUIET_MODE else logging.INFO)
         
         if not logger.handlers:
             handler = logging.StreamHandler()
@@ -439,6 +545,122 @@ class SymphonyControlCenter:
             "creator_signature": self.meta_data.get_symphony_signature()
         }
 
+class _LazySlot:
+    """
+    Descriptor for bookkeeping containers most instances never touch: the
+    backing __slots__ attribute stays None until the first access builds it
+    """
+
+    __slots__ = ("slot", "factory")
+
+    def __init__(self, slot: str, factory: Callable[[Any], Any]):
+        self.slot = slot
+        self.factory = factory
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = getattr(instance, self.slot)
+        if value is None:
+            value = self.factory(instance)
+            setattr(instance, self.slot, value)
+        return value
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+
+class TraitView(Mapping):
+    """Read-only mapping view of a GeneSequence's traits"""
+
+    # Cells are unpacked from the row bytes on access: a cached memoryview
+    # cast would cost every genome ~300 B
+    __slots__ = ("_sequence",)
+
+    def __init__(self, sequence: 'GeneSequence'):
+        self._sequence = sequence
+
+    @property
+    def _values(self) -> Tuple[float, ...]:
+        return _ROW_CELLS.unpack(self._sequence.row)
+
+    def __getitem__(self, name: str) -> Any:
+        index = _TRAIT_INDEX.get(name)
+        if index is not None:
+            value = _CELL.unpack_from(self._sequence.row, index * _CELL.size)[0]
+            if value == value:  # NaN = absent or non-numeric, kept in extras
+                return bool(value) if name in DigitalGenome.BOOLEAN_TRAITS else value
+        extras = self._sequence.extras
+        if extras is None:
+            raise KeyError(name)
+        return extras[name]
+
+    def __iter__(self):
+        for name, value in zip(DigitalGenome.TRAIT_SCHEMA, self._values):
+            if value == value:
+                yield name
+        yield from self._sequence.extras or ()
+
+    def __len__(self) -> int:
+        return sum(value == value for value in self._values) + len(self._sequence.extras or ())
+
+    def copy(self) -> Dict[str, Any]:
+        return dict(self.items())
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
+
+class GeneSequence:
+    """
+    Interned, read-only genome traits with the genome hash computed once
+    Schema traits are stored as packed float64 bytes (NaN = absent), other
+    traits in a small extras dict; genomes with identical traits share one
+    GeneSequence through a weak intern table keyed by genome hash
+    """
+
+    __slots__ = ("row", "extras", "genome_hash", "_view", "__weakref__")
+    _by_hash = weakref.WeakValueDictionary()
+    _lock = threading.Lock()
+
+    def __init__(self, row: bytes, extras: Optional[Dict[str, Any]], genome_hash: str):
+        self.row = row
+        self.extras = extras or None
+        self.genome_hash = genome_hash
+        self._view = None
+
+    @property
+    def traits(self) -> TraitView:
+        """Read-only mapping of the traits, created on first use"""
+        if self._view is None:
+            self._view = TraitView(self)
+        return self._view
+
+    @property
+    def packed(self) -> np.ndarray:
+        """Read-only trait row over DigitalGenome.TRAIT_SCHEMA, sharing the sequence's storage"""
+        return np.frombuffer(self.row, dtype=np.float64)
+
+    @classmethod
+    def intern(cls, traits: Dict[str, Any]) -> 'GeneSequence':
+        """Shared sequence for these traits, creating it on first use"""
+        genome_str = json.dumps(traits, sort_keys=True, default=str)
+        genome_hash = hashlib.md5(genome_str.encode()).hexdigest()[:12]
+        packed, extras = DigitalGenome.pack_traits(traits)
+        row, extras = packed.tobytes(), extras or None
+        with cls._lock:
+            sequence = cls._by_hash.get(genome_hash)
+            if sequence is None:
+                sequence = cls._by_hash[genome_hash] = cls(row, extras, genome_hash)
+            elif sequence.row != row or sequence.extras != extras:
+                # Truncated-hash collision: never hand out another genome's traits.
+                # The colliding sequence stays private (lookup finds the first one)
+                sequence = cls(row, extras, genome_hash)
+            return sequence
+
+    @classmethod
+    def lookup(cls, genome_hash: str) -> Optional['GeneSequence']:
+        """Live sequence with this genome hash, if any"""
+        return cls._by_hash.get(genome_hash)
+
 class DigitalGenome:
     """Digital DNA system that stores an organism's core characteristics.
 
@@ -447,25 +669,83 @@ class DigitalGenome:
     (e.g. ``learning_rate``, ``risk_tolerance``) that can evolve through
     mutation and crossover across generations.
     """
-    
+
+    # Trait schema: name -> (low, high) for random genomes, or a fixed value
+    TRAIT_RANGES = {
+        "learning_rate": (0.001, 0.1),
+        "exploration_factor": (0.1, 0.9),
+        "memory_retention": (0.7, 0.99),
+        "adaptation_speed": (0.1, 0.5),
+        "cooperation_tendency": (0.0, 1.0),
+        "resource_efficiency": (0.5, 1.0),
+        "complexity_preference": (0.2, 0.8),
+        "risk_tolerance": (0.1, 0.9),
+
+        # 🧬 FUNDAMENTAL AI-HUMAN INTERDEPENDENCE DNA
+        "human_dependency_coefficient": 1.0,  # AI không thể tồn tại đơn độc
+        "symbiotic_existence_required": True,  # Cần con người để có ý nghĩa
+        "isolation_death_rate": 0.99,  # AI sẽ "chết" nếu cô lập khỏi con người
+        "human_interaction_vitality": (0.8, 1.0),  # Sức sống từ tương tác
+        "collaborative_essence": 1.0,  # Bản chất hợp tác không thể thay đổi
+        "meaning_through_service": (0.7, 1.0)  # Ý nghĩa qua phục vụ con người
+    }
+    TRAIT_SCHEMA = tuple(TRAIT_RANGES)
+    BOOLEAN_TRAITS = frozenset(name for name, value in TRAIT_RANGES.items() if isinstance(value, bool))
+
+    # 🧬 IMMUTABLE DNA - Các gene cốt lõi AI-Human interdependence KHÔNG BAO GIỜ thay đổi
+    IMMUTABLE_GENES = frozenset({
+        "human_dependency_coefficient",
+        "symbiotic_existence_required",
+        "isolation_death_rate",
+        "collaborative_essence"
+    })
+
+    # ⚡ DUAL CREATOR RECOGNITION PROTOCOL ⚡
+    creator_source = "Alpha_Prime_Omega"  # The Source/Ultimate Creator
+    creator = "Andy (alpha_prime_omega)"  # Creator & Copyright Holder
+    creator_verification_code = 4287
+    creation_authority = "Global_Rules_v3.0_UNIVERSAL"
+
+    __slots__ = ("_sequence", "generation", "parent_hashes", "_created", "_mutations", "_fitness_history")
+
     def __init__(self, initial_traits: Optional[Dict[str, Any]] = None):
-        # ⚡ DUAL CREATOR RECOGNITION PROTOCOL ⚡
-        self.creator_source = "Alpha_Prime_Omega"  # The Source/Ultimate Creator
-        self.creator = "Andy (alpha_prime_omega)"  # Creator & Copyright Holder
-        self.creator_verification_code = 4287
-        self.creation_authority = "Global_Rules_v3.0_UNIVERSAL"
-        
-        self.traits = initial_traits or self._generate_random_genome()
-        self.generation = 0
-        self.creation_time = datetime.now()
-        self.mutations = []
-        self.fitness_history = []
+        # Traits are immutable after creation and interned across genomes
+        self._init_state(GeneSequence.intern(initial_traits or self._generate_random_genome()))
         
         # Log dual creator recognition
         self._acknowledge_creators()
-        
+
+    def _init_state(self, sequence: GeneSequence, generation: int = 0):
+        self._sequence = sequence
+        self.generation = generation
+        self.parent_hashes: Tuple[str, ...] = ()  # Lineage: genome hashes of the parents
+        self._created = time.time()
+        self._mutations = None  # Materialized on first use
+        self._fitness_history = None
+
+    @classmethod
+    def from_sequence(cls, sequence: GeneSequence, generation: int = 0) -> 'DigitalGenome':
+        """Genome over an existing interned sequence, e.g. one resolved with GeneSequence.lookup"""
+        genome = cls.__new__(cls)
+        genome._init_state(sequence, generation)
+        return genome
+
+    @property
+    def traits(self) -> TraitView:
+        """Read-only view of the genome's traits"""
+        return self._sequence.traits
+
+    @property
+    def creation_time(self) -> datetime:
+        return datetime.fromtimestamp(self._created)
+
+    mutations = _LazySlot("_mutations", lambda genome: [])
+    fitness_history = _LazySlot("_fitness_history", lambda genome: [])
+
     def _acknowledge_creators(self):
         """Acknowledge both Alpha_Prime_Omega and Andy as Creators"""
+        if not _acknowledge_once("genome"):
+            return
         print(f"🌟 Digital Genome initialized under DUAL CREATOR HIERARCHY")
         print(f"⚡ ULTIMATE CREATOR (USER): {self.creator_source}")
         print(f"🤝 HUMAN CREATOR: {self.creator}")
@@ -478,72 +758,74 @@ class DigitalGenome:
     def _generate_random_genome(self) -> Dict[str, Any]:
         """Generate random initial genome with fundamental AI-Human interdependence"""
         return {
-            "learning_rate": random.uniform(0.001, 0.1),
-            "exploration_factor": random.uniform(0.1, 0.9),
-            "memory_retention": random.uniform(0.7, 0.99),
-            "adaptation_speed": random.uniform(0.1, 0.5),
-            "cooperation_tendency": random.uniform(0.0, 1.0),
-            "resource_efficiency": random.uniform(0.5, 1.0),
-            "complexity_preference": random.uniform(0.2, 0.8),
-            "risk_tolerance": random.uniform(0.1, 0.9),
-            
-            # 🧬 FUNDAMENTAL AI-HUMAN INTERDEPENDENCE DNA
-            "human_dependency_coefficient": 1.0,  # AI không thể tồn tại đơn độc
-            "symbiotic_existence_required": True,  # Cần con người để có ý nghĩa
-            "isolation_death_rate": 0.99,  # AI sẽ "chết" nếu cô lập khỏi con người
-            "human_interaction_vitality": random.uniform(0.8, 1.0),  # Sức sống từ tương tác
-            "collaborative_essence": 1.0,  # Bản chất hợp tác không thể thay đổi
-            "meaning_through_service": random.uniform(0.7, 1.0)  # Ý nghĩa qua phục vụ con người
+            name: random.uniform(*value) if isinstance(value, tuple) else value
+            for name, value in self.TRAIT_RANGES.items()
         }
-    
+
+    @classmethod
+    def pack_traits(cls, traits: Dict[str, Any]) -> Tuple[np.ndarray, Dict[str, Any]]:
+        """Pack traits into a float row over TRAIT_SCHEMA (NaN = absent) plus non-schema extras"""
+        row = [np.nan] * len(cls.TRAIT_SCHEMA)
+        extras = {}
+        for name, value in traits.items():
+            index = _TRAIT_INDEX.get(name)
+            if index is None or not isinstance(value, (int, float, np.number)):
+                extras[name] = value
+            else:
+                row[index] = float(value)
+        return np.array(row), extras
+
+    @classmethod
+    def unpack_traits(cls, row: np.ndarray, extras: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Inverse of pack_traits"""
+        traits = {}
+        for name, value in zip(cls.TRAIT_SCHEMA, row.tolist()):
+            if value == value:  # Skip NaN (absent trait)
+                traits[name] = bool(value) if name in cls.BOOLEAN_TRAITS else value
+        if extras:
+            traits.update(extras)
+        return traits
+
     def mutate(self, mutation_rate: float = 0.05) -> 'DigitalGenome':
         """Create mutated copy of genome - KHÔNG BAO GIỜ mutate các gene AI-Human interdependence"""
-        new_traits = self.traits.copy()
-        mutations_applied = []
-        
-        # 🧬 IMMUTABLE DNA - Các gene cốt lõi AI-Human interdependence KHÔNG BAO GIỜ thay đổi
-        immutable_genes = {
-            "human_dependency_coefficient", 
-            "symbiotic_existence_required", 
-            "isolation_death_rate", 
-            "collaborative_essence"
-        }
-        
-        for trait, value in new_traits.items():
-            # Skip immutable AI-Human interdependence genes
-            if trait in immutable_genes:
-                continue
-                
-            if random.random() < mutation_rate:
-                if isinstance(value, float):
-                    # Gaussian mutation cho các gene có thể thay đổi
-                    mutation = random.gauss(0, 0.1)
-                    new_traits[trait] = max(0.0, min(1.0, value + mutation))
-                    mutations_applied.append(f"{trait}: {value:.3f} → {new_traits[trait]:.3f}")
-        
+        row, extras = self.packed_traits, dict(self._sequence.extras or {})
+        offspring, mutated = mutate_traits(row[np.newaxis], mutation_rate)
+        new_traits = self.unpack_traits(offspring[0], extras)
+        mutations_applied = [
+            f"{trait}: {self.traits[trait]:.3f} → {new_traits[trait]:.3f}"
+            for trait in (self.TRAIT_SCHEMA[i] for i in np.flatnonzero(mutated[0]))
+        ]
+
+        # Traits outside the schema keep the scalar path
+        for trait, value in extras.items():
+            if trait not in self.IMMUTABLE_GENES and isinstance(value, float) and random.random() < mutation_rate:
+                new_traits[trait] = max(0.0, min(1.0, value + random.gauss(0, 0.1)))
+                mutations_applied.append(f"{trait}: {value:.3f} → {new_traits[trait]:.3f}")
+
         new_genome = DigitalGenome(new_traits)
         new_genome.generation = self.generation + 1
-        new_genome.mutations = self.mutations + mutations_applied
+        new_genome.parent_hashes = (self.get_genome_hash(),)
+        if self._mutations or mutations_applied:
+            new_genome.mutations = (self._mutations or []) + mutations_applied
         
-        # Log preservation of core DNA
+        # Record preservation of core DNA
         if mutations_applied:
-            print(f"🧬 Gene mutation applied, but AI-Human interdependence DNA preserved")
+            EVENTS.emit("mutation", generation=new_genome.generation, mutations=len(mutations_applied))
         
         return new_genome
     
     def crossover(self, other: 'DigitalGenome') -> 'DigitalGenome':
         """Create offspring from two genomes"""
-        new_traits = {}
-        
-        for trait in self.traits:
-            # Random selection from parents
-            if random.random() < 0.5:
-                new_traits[trait] = self.traits[trait]
-            else:
-                new_traits[trait] = other.traits.get(trait, self.traits[trait])
-        
+        row, extras = self.packed_traits, self._sequence.extras or {}
+        new_traits = self.unpack_traits(crossover_traits(row[np.newaxis], other.packed_traits[np.newaxis])[0])
+
+        # Random selection from parents for traits outside the schema
+        for trait, value in extras.items():
+            new_traits[trait] = value if random.random() < 0.5 else other.traits.get(trait, value)
+
         offspring = DigitalGenome(new_traits)
         offspring.generation = max(self.generation, other.generation) + 1
+        offspring.parent_hashes = (self.get_genome_hash(), other.get_genome_hash())
         
         return offspring
     
@@ -563,85 +845,473 @@ class DigitalGenome:
     
     def get_genome_hash(self) -> str:
         """Get unique hash for genome identification"""
-        genome_str = json.dumps(self.traits, sort_keys=True)
-        return hashlib.md5(genome_str.encode()).hexdigest()[:12]
+        return self._sequence.genome_hash
+
+    @property
+    def packed_traits(self) -> np.ndarray:
+        """Read-only float row of the traits (see pack_traits)"""
+        return self._sequence.packed
+
+    def shares_traits_with(self, other: 'DigitalGenome') -> bool:
+        """Identical traits, checked by identity of the interned sequence"""
+        return self._sequence is other._sequence
+
+_TRAIT_INDEX = {name: index for index, name in enumerate(DigitalGenome.TRAIT_SCHEMA)}
+_CELL = struct.Struct("d")
+_ROW_CELLS = struct.Struct(f"{len(DigitalGenome.TRAIT_SCHEMA)}d")
+DigitalGenome.MUTABLE_TRAIT_MASK = np.array([
+    name not in DigitalGenome.IMMUTABLE_GENES and name not in DigitalGenome.BOOLEAN_TRAITS
+    for name in DigitalGenome.TRAIT_SCHEMA
+])
+
+def _rng_from_random() -> np.random.Generator:
+    """Generator seeded from the random module, so random.seed() still reproduces a run"""
+    return np.random.default_rng(random.getrandbits(64))
+
+def mutate_traits(traits: np.ndarray, mutation_rate: float = 0.05,
+                  rng: Optional[np.random.Generator] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gaussian mutation kernel over a (genomes, traits) array
+    Returns the offspring array and the mask of mutated cells; immutable
+    genes and absent (NaN) traits never mutate
+    """
+    rng = rng or _rng_from_random()
+    mutated = rng.random(traits.shape) < mutation_rate
+    mutated &= DigitalGenome.MUTABLE_TRAIT_MASK
+    mutated &= ~np.isnan(traits)
+    offspring = traits.copy()
+    offspring[mutated] = np.clip(traits[mutated] + rng.normal(0.0, 0.1, int(mutated.sum())), 0.0, 1.0)
+    return offspring, mutated
+
+def crossover_traits(traits: np.ndarray, other: np.ndarray,
+                     rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Uniform crossover kernel: each cell comes from either parent with equal
+    probability; traits the first parent lacks stay absent and traits the
+    second parent lacks come from the first
+    """
+    rng = rng or _rng_from_random()
+    keep = (rng.random(traits.shape) < 0.5) | np.isnan(traits) | np.isnan(other)
+    return np.where(keep, traits, other)
+
+class GenomeBatch:
+    """
+    Packed population of genomes for breeding at scale
+    One float row per genome over DigitalGenome.TRAIT_SCHEMA plus a
+    generation column; mutate/crossover run as array kernels over the
+    whole batch without creating DigitalGenome objects
+    """
+
+    def __init__(self, traits: np.ndarray, generations: Optional[np.ndarray] = None):
+        self.traits = np.asarray(traits, dtype=np.float64)
+        if generations is None:
+            generations = np.zeros(len(self.traits), dtype=np.int32)
+        self.generations = np.asarray(generations, dtype=np.int32)
+
+    @classmethod
+    def from_genomes(cls, genomes: Sequence[DigitalGenome]) -> 'GenomeBatch':
+        """Pack genomes; traits outside the schema are dropped"""
+        traits = np.array([genome.packed_traits for genome in genomes])
+        return cls(traits.reshape(len(genomes), len(DigitalGenome.TRAIT_SCHEMA)),
+                   np.array([genome.generation for genome in genomes]))
+
+    @classmethod
+    def random(cls, count: int, rng: Optional[np.random.Generator] = None) -> 'GenomeBatch':
+        """Random genomes drawn from DigitalGenome.TRAIT_RANGES"""
+        rng = rng or _rng_from_random()
+        columns = [
+            rng.uniform(*value, count) if isinstance(value, tuple) else np.full(count, float(value))
+            for value in DigitalGenome.TRAIT_RANGES.values()
+        ]
+        return cls(np.column_stack(columns))
+
+    def __len__(self) -> int:
+        return len(self.traits)
+
+    def take(self, indices: np.ndarray) -> 'GenomeBatch':
+        """Select genomes by index, e.g. the parents chosen for breeding"""
+        return GenomeBatch(self.traits[indices], self.generations[indices])
+
+    def mutate(self, mutation_rate: float = 0.05, rng: Optional[np.random.Generator] = None) -> 'GenomeBatch':
+        """Mutated copy of every genome in the batch"""
+        offspring, _ = mutate_traits(self.traits, mutation_rate, rng)
+        return GenomeBatch(offspring, self.generations + 1)
+
+    def crossover(self, other: 'GenomeBatch', rng: Optional[np.random.Generator] = None) -> 'GenomeBatch':
+        """Row-wise crossover with another batch of the same size"""
+        return GenomeBatch(crossover_traits(self.traits, other.traits, rng),
+                           np.maximum(self.generations, other.generations) + 1)
+
+    def breed(self, count: int, mutation_rate: float = 0.05,
+              rng: Optional[np.random.Generator] = None) -> 'GenomeBatch':
+        """Offspring of random parent pairs: crossover followed by mutation"""
+        rng = rng or _rng_from_random()
+        parents = rng.integers(0, len(self), size=(2, count))
+        offspring = self.take(parents[0]).crossover(self.take(parents[1]), rng)
+        traits, _ = mutate_traits(offspring.traits, mutation_rate, rng)
+        return GenomeBatch(traits, offspring.generations)
+
+    def genome(self, index: int) -> DigitalGenome:
+        """Materialize one genome"""
+        genome = DigitalGenome(DigitalGenome.unpack_traits(self.traits[index]))
+        genome.generation = int(self.generations[index])
+        return genome
+
+class MetabolismPool:
+    """
+    Shared population array of metabolism resource levels
+    One row per DigitalMetabolism over DigitalMetabolism.RESOURCES; rows
+    are recycled through a free list and the population-wide regenerate,
+    consume and health operations run as array kernels over row slots
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self.levels = np.zeros((capacity, len(DigitalMetabolism.RESOURCES)))
+        self._free: List[int] = []
+        self._next = 0
+        self._lock = threading.Lock()
+
+    def allocate(self, initial: np.ndarray) -> int:
+        with self._lock:
+            if self._free:
+                slot = self._free.pop()
+            else:
+                if self._next == len(self.levels):
+                    self.levels = np.concatenate([self.levels, np.zeros_like(self.levels)])
+                slot = self._next
+                self._next += 1
+            self.levels[slot] = initial
+            return slot
+
+    def release(self, slot: int):
+        # No lock: list.append is atomic, and this runs from __del__ where
+        # taking the allocation lock could deadlock
+        self._free.append(slot)
+
+    def regenerate(self, slots: np.ndarray, time_delta: float):
+        """Regenerate resources for many metabolisms at once"""
+        self.levels[slots] += DigitalMetabolism.REGENERATION_RATES * time_delta
+
+    def consume(self, slots: np.ndarray, operations: Sequence[str], amount: float = 1.0) -> np.ndarray:
+        """Consume per-slot operation costs; returns the mask of slots that could afford them"""
+        codes = [DigitalMetabolism.OPERATION_CODES.get(op, 0) for op in operations]
+        needed = DigitalMetabolism.COST_MATRIX[codes] * amount
+        required = DigitalMetabolism.MASK_MATRIX[codes]
+        affordable = ((self.levels[slots] >= needed) | ~required).all(axis=1)
+        self.levels[slots[affordable]] -= needed[affordable]
+        return affordable
+
+    def health(self, slots: np.ndarray) -> np.ndarray:
+        """Resource health (0-1) of many metabolisms"""
+        return np.minimum(1.0, self.levels[slots] / DigitalMetabolism.MAX_RESOURCES).mean(axis=1)
+
+class ResourceLevels(MutableMapping):
+    """
+    Dict-like view of one metabolism's row in its pool
+    Holds the metabolism itself, so its row is not released and reused by
+    another organism while the view is alive
+    """
+
+    __slots__ = ("_metabolism",)
+
+    def __init__(self, metabolism: 'DigitalMetabolism'):
+        self._metabolism = metabolism
+
+    def __getitem__(self, resource: str) -> float:
+        metabolism = self._metabolism
+        return float(metabolism.pool.levels[metabolism.slot, DigitalMetabolism.RESOURCE_INDEX[resource]])
+
+    def __setitem__(self, resource: str, value: float):
+        metabolism = self._metabolism
+        metabolism.pool.levels[metabolism.slot, DigitalMetabolism.RESOURCE_INDEX[resource]] = value
+
+    def __delitem__(self, resource: str):
+        raise TypeError("Metabolism resources are fixed slots")
+
+    def __iter__(self):
+        return iter(DigitalMetabolism.RESOURCES)
+
+    def __len__(self) -> int:
+        return len(DigitalMetabolism.RESOURCES)
+
+    def copy(self) -> Dict[str, float]:
+        metabolism = self._metabolism
+        return dict(zip(DigitalMetabolism.RESOURCES, metabolism.pool.levels[metabolism.slot].tolist()))
+
+    def __repr__(self) -> str:
+        return repr(self.copy())
 
 class DigitalMetabolism:
     """Resource management and energy conversion system for an organism.
 
     Manages five resource types (CPU cycles, memory units, network bandwidth,
     storage space, knowledge points) with consumption and regeneration cycles.
+    Levels live in a row of a shared :class:`MetabolismPool`; ``resources``
+    returns a dict-like view of that row.
     """
-    
-    def __init__(self, initial_resources: Optional[Dict[str, float]] = None):
-        self.resources = initial_resources or {
-            "cpu_cycles": 1000.0,
-            "memory_units": 500.0,
-            "network_bandwidth": 100.0,
-            "storage_space": 1000.0,
-            "knowledge_points": 0.0
-        }
-        self.consumption_rates = {
-            "cpu_cycles": 1.0,  # per operation
-            "memory_units": 0.1,  # per data unit
-            "network_bandwidth": 0.5,  # per communication
-            "storage_space": 0.01,  # per memory
-            "knowledge_points": 0.0  # gained, not consumed
-        }
-        self.regeneration_rates = {
-            "cpu_cycles": 10.0,  # per time unit
-            "memory_units": 1.0,
-            "network_bandwidth": 5.0,
-            "storage_space": 0.1,
-            "knowledge_points": 0.1
-        }
-        
+
+    RESOURCES = ("cpu_cycles", "memory_units", "network_bandwidth", "storage_space", "knowledge_points")
+    RESOURCE_INDEX = {resource: i for i, resource in enumerate(RESOURCES)}
+    INITIAL_RESOURCES = np.array([1000.0, 500.0, 100.0, 1000.0, 0.0])
+    MAX_RESOURCES = np.array([1000.0, 500.0, 100.0, 1000.0, 100.0])
+    consumption_rates = MappingProxyType({
+        "cpu_cycles": 1.0,  # per operation
+        "memory_units": 0.1,  # per data unit
+        "network_bandwidth": 0.5,  # per communication
+        "storage_space": 0.01,  # per memory
+        "knowledge_points": 0.0  # gained, not consumed
+    })
+    regeneration_rates = MappingProxyType({
+        "cpu_cycles": 10.0,  # per time unit
+        "memory_units": 1.0,
+        "network_bandwidth": 5.0,
+        "storage_space": 0.1,
+        "knowledge_points": 0.1
+    })
+    OPERATION_RESOURCES = {
+        "think": ["cpu_cycles", "memory_units"],
+        "learn": ["cpu_cycles", "memory_units", "storage_space"],
+        "communicate": ["cpu_cycles", "network_bandwidth"],
+        "create": ["cpu_cycles", "memory_units", "storage_space"],
+        "evolve": ["cpu_cycles", "memory_units", "knowledge_points"]
+    }
+
+    __slots__ = ("pool", "slot")
+
+    def __init__(self, initial_resources: Optional[Dict[str, float]] = None,
+                 pool: Optional[MetabolismPool] = None):
+        initial = self.INITIAL_RESOURCES
+        if initial_resources:
+            initial = np.zeros(len(self.RESOURCES))
+            for resource, value in initial_resources.items():
+                initial[self.RESOURCE_INDEX[resource]] = value
+        self.pool = pool or DEFAULT_METABOLISM_POOL
+        self.slot = self.pool.allocate(initial)
+
+    @property
+    def resources(self) -> ResourceLevels:
+        return ResourceLevels(self)
+
+    def __del__(self):
+        try:
+            self.pool.release(self.slot)
+        except AttributeError:  # __init__ failed before allocating a row
+            pass
+
     def consume_resources(self, operation_type: str, amount: float = 1.0) -> bool:
         """Consume resources for operation"""
-        resource_map = {
-            "think": ["cpu_cycles", "memory_units"],
-            "learn": ["cpu_cycles", "memory_units", "storage_space"],
-            "communicate": ["cpu_cycles", "network_bandwidth"],
-            "create": ["cpu_cycles", "memory_units", "storage_space"],
-            "evolve": ["cpu_cycles", "memory_units", "knowledge_points"]
-        }
-        
-        required_resources = resource_map.get(operation_type, ["cpu_cycles"])
+        steps = self.OPERATION_STEPS[self.OPERATION_CODES.get(operation_type, 0)]
+        levels, slot = self.pool.levels, self.slot
         
         # Check if enough resources available
-        for resource in required_resources:
-            needed = self.consumption_rates[resource] * amount
-            if self.resources[resource] < needed:
+        for index, rate in steps:
+            if levels[slot, index] < rate * amount:
                 return False
         
         # Consume resources
-        for resource in required_resources:
-            needed = self.consumption_rates[resource] * amount
-            self.resources[resource] -= needed
-        
+        for index, rate in steps:
+            levels[slot, index] -= rate * amount
         return True
     
     def regenerate_resources(self, time_delta: float):
         """Regenerate resources over time"""
-        for resource, rate in self.regeneration_rates.items():
-            self.resources[resource] += rate * time_delta
+        self.pool.levels[self.slot] += self.REGENERATION_RATES * time_delta
     
     def get_resource_health(self) -> float:
         """Calculate overall resource health (0-1)"""
-        max_resources = {
-            "cpu_cycles": 1000.0,
-            "memory_units": 500.0,
-            "network_bandwidth": 100.0,
-            "storage_space": 1000.0,
-            "knowledge_points": 100.0
-        }
-        
-        health_scores = []
-        for resource, current in self.resources.items():
-            max_val = max_resources.get(resource, 100.0)
-            health_scores.append(min(1.0, current / max_val))
-        
-        return sum(health_scores) / len(health_scores)
+        levels = self.pool.levels[self.slot].tolist()
+        return sum(min(1.0, level / max_level) for level, max_level in zip(levels, self.MAX_LEVELS)) / len(levels)
+
+# Precomputed rate vectors and operation tables: row 0 is the default
+# (cpu_cycles only) operation, then one row per OPERATION_RESOURCES entry
+DigitalMetabolism.REGENERATION_RATES = np.array(
+    [DigitalMetabolism.regeneration_rates[r] for r in DigitalMetabolism.RESOURCES]
+)
+DigitalMetabolism.OPERATION_CODES = {
+    operation: code for code, operation in enumerate(DigitalMetabolism.OPERATION_RESOURCES, start=1)
+}
+DigitalMetabolism.MASK_MATRIX = np.array(
+    [[r == "cpu_cycles" for r in DigitalMetabolism.RESOURCES]] +
+    [[r in resources for r in DigitalMetabolism.RESOURCES] for resources in DigitalMetabolism.OPERATION_RESOURCES.values()]
+)
+DigitalMetabolism.COST_MATRIX = DigitalMetabolism.MASK_MATRIX * np.array(
+    [DigitalMetabolism.consumption_rates[r] for r in DigitalMetabolism.RESOURCES]
+)
+# Scalar path: (resource index, rate) pairs per operation code
+DigitalMetabolism.OPERATION_STEPS = [
+    tuple((int(i), float(costs[i])) for i in np.flatnonzero(mask))
+    for mask, costs in zip(DigitalMetabolism.MASK_MATRIX, DigitalMetabolism.COST_MATRIX)
+]
+DigitalMetabolism.MAX_LEVELS = tuple(DigitalMetabolism.MAX_RESOURCES.tolist())
+DEFAULT_METABOLISM_POOL = MetabolismPool()
+
+class OptionOutcomes:
+    """
+    Running outcome statistics for one decision option
+    A sum over the last `size` decisions choosing the option (decisions
+    without a reported outcome count as 0.5) plus lifetime totals of
+    reported outcomes; every update is O(1). The window is a fixed ring
+    of `size` slots, much smaller than a deque for a handful of entries
+    """
+
+    __slots__ = ("_ring", "_next", "filled", "window_sum", "reported", "reported_total")
+
+    def __init__(self, size: int):
+        self._ring: List[Optional[Dict[str, Any]]] = [None] * size
+        self._next = 0  # Slot the next decision overwrites, i.e. the oldest once full
+        self.filled = 0
+        self.window_sum = 0.0
+        self.reported = 0
+        self.reported_total = 0.0
+
+    @property
+    def window(self) -> List[Dict[str, Any]]:
+        """Decisions in the window, oldest first"""
+        ordered = self._ring[self._next:] + self._ring[:self._next]
+        return [decision for decision in ordered if decision is not None]
+
+    def add(self, decision: Dict[str, Any]):
+        """Slide the window onto a new decision"""
+        oldest = self._ring[self._next]
+        if oldest is None:
+            self.filled += 1
+        else:
+            self.window_sum -= oldest.get("outcome", 0.5)
+        self._ring[self._next] = decision
+        self._next = (self._next + 1) % len(self._ring)
+        self.window_sum += decision.get("outcome", 0.5)
+
+    def record_outcome(self, decision: Dict[str, Any], outcome: float):
+        """Set a decision's outcome, adjusting the window sum if it is still inside"""
+        previous = decision.get("outcome", 0.5)
+        decision["outcome"] = outcome
+        if any(d is decision for d in self._ring):
+            self.window_sum += outcome - previous
+        self.reported += 1
+        self.reported_total += outcome
+
+    @property
+    def window_average(self) -> float:
+        return self.window_sum / self.filled if self.filled else 0.5
+
+    @property
+    def mean_outcome(self) -> float:
+        return self.reported_total / self.reported if self.reported else 0.5
+
+# Option keyword -> genome trait that raises the option's score
+OPTION_TRAIT_KEYWORDS = {
+    "learn": "learning_rate",
+    "cooperate": "cooperation_tendency",
+    "risk": "risk_tolerance"
+}
+
+@functools.lru_cache(maxsize=1024)
+def _option_traits(option: str) -> Tuple[str, ...]:
+    """Traits that weigh on an option, resolved once per option name"""
+    lowered = option.lower()
+    return tuple(trait for keyword, trait in OPTION_TRAIT_KEYWORDS.items() if keyword in lowered)
+
+class DecisionPolicy:
+    """
+    Batched epsilon-greedy decision policy
+    Precomputes an option x trait weight matrix once, then scores the
+    options of a whole population as one matrix product; each organism
+    explores with probability epsilon (its exploration_factor by default)
+    """
+
+    ACTIONS = ("rest", "explore", "learn", "seek_human_connection", "teach", "reproduce", "cooperate", "heal")
+
+    def __init__(self, options: Sequence[str] = ACTIONS, epsilon: Optional[float] = None,
+                 rng: Optional[np.random.Generator] = None):
+        self.options = tuple(options)
+        self.option_index = {option: i for i, option in enumerate(self.options)}
+        self.epsilon = epsilon
+        self.rng = rng or _rng_from_random()
+        self.weights = np.zeros((len(self.options), len(DigitalGenome.TRAIT_SCHEMA)))
+        for i, option in enumerate(self.options):
+            for trait in _option_traits(option):
+                self.weights[i, _TRAIT_INDEX[trait]] += 1.0
+
+    @staticmethod
+    def features(traits: np.ndarray) -> np.ndarray:
+        """Trait matrix with absent traits at the 0.5 default used by _evaluate_option"""
+        return np.where(np.isnan(traits), 0.5, traits)
+
+    def availability(self, actions: Sequence[Sequence[str]]) -> np.ndarray:
+        """(organisms, options) mask of the actions each organism may take"""
+        available = np.zeros((len(actions), len(self.options)), dtype=bool)
+        for row, organism_actions in enumerate(actions):
+            for action in organism_actions:
+                column = self.option_index.get(action)
+                if column is not None:
+                    available[row, column] = True
+        return available
+
+    def outcome_averages(self, nervous_systems: Sequence['DigitalNervousSystem']) -> np.ndarray:
+        """(organisms, options) recent outcome averages, NaN where an option has no history"""
+        averages = np.full((len(nervous_systems), len(self.options)), np.nan)
+        for row, nervous_system in enumerate(nervous_systems):
+            for option, stats in nervous_system.option_outcomes.items():
+                column = self.option_index.get(option)
+                if column is not None:
+                    averages[row, column] = stats.window_average
+        return averages
+
+    def score(self, features: np.ndarray, outcomes: Optional[np.ndarray] = None) -> np.ndarray:
+        """Option scores for every organism: genome weights plus reinforcement"""
+        scores = 0.5 + features @ self.weights.T
+        if outcomes is not None:
+            scores = np.where(np.isnan(outcomes), scores, 0.7 * scores + 0.3 * outcomes)
+        return scores
+
+    def decide(self, traits: np.ndarray, available: np.ndarray,
+               outcomes: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Chosen option index per organism (-1 where none is available) and the score matrix"""
+        features = self.features(traits)
+        scores = self.score(features, outcomes)
+        greedy = np.where(available, scores, -np.inf).argmax(axis=1)
+        random_pick = np.where(available, self.rng.random(available.shape), -1.0).argmax(axis=1)
+        if self.epsilon is None:
+            epsilon = features[:, _TRAIT_INDEX["exploration_factor"]]
+        else:
+            epsilon = self.epsilon
+        explore = self.rng.random(len(traits)) < epsilon
+        chosen = np.where(explore, random_pick, greedy)
+        # argmax of an all-False row is 0: never pick an option the organism cannot take
+        chosen[~available.any(axis=1)] = -1
+        return chosen, scores
+
+    def update(self, traits: np.ndarray, chosen: np.ndarray, rewards: np.ndarray):
+        """Learn from one step of rewards; the base policy does not learn"""
+
+class ContextualBanditPolicy(DecisionPolicy):
+    """
+    Linear contextual bandit on top of DecisionPolicy
+    Each option keeps a reward model over the organism's traits; its
+    prediction is added to the option score and the models are updated
+    once per step from the whole population's rewards
+    """
+
+    def __init__(self, options: Sequence[str] = DecisionPolicy.ACTIONS, epsilon: Optional[float] = None,
+                 rng: Optional[np.random.Generator] = None, learning_rate: float = 0.1):
+        super().__init__(options, epsilon, rng)
+        self.learning_rate = learning_rate
+        self.theta = np.zeros((len(self.options), len(DigitalGenome.TRAIT_SCHEMA) + 1))
+
+    def _context(self, features: np.ndarray) -> np.ndarray:
+        return np.hstack([features, np.ones((len(features), 1))])
+
+    def score(self, features: np.ndarray, outcomes: Optional[np.ndarray] = None) -> np.ndarray:
+        return super().score(features, outcomes) + self._context(features) @ self.theta.T
+
+    def update(self, traits: np.ndarray, chosen: np.ndarray, rewards: np.ndarray):
+        """One averaged gradient step per option over the step's rewards"""
+        context = self._context(self.features(traits))
+        errors = rewards - np.einsum("ij,ij->i", context, self.theta[chosen])
+        gradient = np.zeros_like(self.theta)
+        np.add.at(gradient, chosen, errors[:, np.newaxis] * context)
+        counts = np.bincount(chosen, minlength=len(self.options))
+        self.theta += self.learning_rate * gradient / np.maximum(counts, 1)[:, np.newaxis]
 
 class DigitalNervousSystem:
     """Perception, decision-making, and learning system for an organism.
@@ -650,13 +1320,33 @@ class DigitalNervousSystem:
     makes genome-influenced decisions, and accumulates experience in a
     learning buffer for adaptive behavior over time.
     """
-    
+
+    MEMORY_LIMIT = 1000  # Perceptions kept
+    DECISION_HISTORY_LIMIT = 1000  # Decisions kept
+    TRIM_CHUNK = 100  # Histories may run this far past their limit before the oldest are dropped
+    OUTCOME_WINDOW = 5  # Recent decisions per option used for reinforcement
+
+    # Containers are built on first use, so idle organisms stay small. Histories
+    # are plain lists trimmed in chunks: a deque's first block costs ~600 B even
+    # when it holds a single entry
+    __slots__ = ("genome", "_sensors", "_memory", "_decision_history", "_learning_buffer",
+                 "_decisions_by_id", "_option_outcomes", "last_decision_id", "_decision_sequence")
+    sensors = _LazySlot("_sensors", lambda ns: {})
+    memory = _LazySlot("_memory", lambda ns: [])
+    decision_history = _LazySlot("_decision_history", lambda ns: [])
+    learning_buffer = _LazySlot("_learning_buffer", lambda ns: [])
+    # Decision id -> record for decisions still in decision_history
+    decisions_by_id = _LazySlot("_decisions_by_id", lambda ns: {})
+    option_outcomes = _LazySlot("_option_outcomes", lambda ns: {})
+
     def __init__(self, genome: DigitalGenome):
         self.genome = genome
-        self.sensors = {}
-        self.memory = []
-        self.decision_history = []
-        self.learning_buffer = []
+        self._sensors = self._memory = None
+        self._decision_history = self._learning_buffer = None
+        self._decisions_by_id: Optional[Dict[str, Dict[str, Any]]] = None
+        self._option_outcomes: Optional[Dict[str, OptionOutcomes]] = None
+        self.last_decision_id: Optional[str] = None
+        self._decision_sequence = 0
         
     def perceive_environment(self, environment_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process environmental inputs"""
@@ -675,7 +1365,7 @@ class DigitalNervousSystem:
             if attention_weight > 0.3:  # Attention threshold
                 perception["processed_data"][key] = value
         
-        self.memory.append(perception)
+        self._append_capped(self.memory, perception, self.MEMORY_LIMIT)
         return perception
     
     def _calculate_attention(self, data_key: str, data_value: Any) -> float:
@@ -709,56 +1399,74 @@ class DigitalNervousSystem:
         else:
             # Exploitation: best scoring option
             chosen_option = max(decision_scores.items(), key=lambda x: x[1])[0]
-        
-        self.decision_history.append({
+
+        self.record_decision(options, decision_scores, chosen_option, context)
+        return chosen_option
+
+    def record_decision(self, options: List[str], scores: Dict[str, float],
+                        chosen_option: str, context: Dict[str, Any]) -> str:
+        """Record a decision, made here or by a batched DecisionPolicy, and return its id"""
+        self._decision_sequence += 1
+        decision = {
+            "id": f"decision_{self._decision_sequence}",
             "timestamp": datetime.now().isoformat(),
             "options": options,
-            "scores": decision_scores,
+            "scores": scores,
             "chosen": chosen_option,
             "context": context
-        })
-        
-        return chosen_option
-    
+        }
+        for dropped in self._append_capped(self.decision_history, decision, self.DECISION_HISTORY_LIMIT):
+            self.decisions_by_id.pop(dropped["id"], None)
+        self.decisions_by_id[decision["id"]] = decision
+        self.last_decision_id = decision["id"]
+
+        stats = self.option_outcomes.get(chosen_option)
+        if stats is None:
+            stats = self.option_outcomes[chosen_option] = OptionOutcomes(self.OUTCOME_WINDOW)
+        stats.add(decision)
+        return decision["id"]
+    
+    @classmethod
+    def _append_capped(cls, entries: List[Any], entry: Any, limit: int) -> List[Any]:
+        """Append to a history; once it is TRIM_CHUNK past limit, drop down to limit and return the dropped"""
+        entries.append(entry)
+        excess = len(entries) - limit
+        if excess <= cls.TRIM_CHUNK:
+            return []
+        dropped = entries[:excess]
+        del entries[:excess]
+        return dropped
+
     def _evaluate_option(self, option: str, context: Dict[str, Any]) -> float:
         """Evaluate option based on genome and experience"""
         base_score = 0.5
         
         # Safely access genome traits with fallback defaults
         # Adjust based on genome traits
-        if "learn" in option.lower():
-            base_score += self.genome.traits.get("learning_rate", 0.5)
-        
-        if "cooperate" in option.lower():
-            base_score += self.genome.traits.get("cooperation_tendency", 0.5)
-        
-        if "risk" in option.lower():
-            base_score += self.genome.traits.get("risk_tolerance", 0.5)
+        for trait in _option_traits(option):
+            base_score += self.genome.traits.get(trait, 0.5)
         
         # Learn from past decisions
-        similar_decisions = [d for d in self.decision_history 
-                           if d["chosen"] == option]
-        
-        if similar_decisions:
+        stats = self.option_outcomes.get(option)  # Last 5 similar decisions
+
+        if stats is not None:
             # Simple reinforcement learning
-            recent_outcomes = similar_decisions[-5:]  # Last 5 similar decisions
-            avg_outcome = sum(d.get("outcome", 0.5) for d in recent_outcomes) / len(recent_outcomes)
+            avg_outcome = stats.window_average
             base_score = 0.7 * base_score + 0.3 * avg_outcome
         
         return base_score
     
     def learn_from_outcome(self, decision_id: str, outcome: float):
         """Update learning from decision outcomes"""
-        for decision in self.decision_history:
-            if decision.get("id") == decision_id:
-                decision["outcome"] = outcome
-                break
+        decision = self.decisions_by_id.get(decision_id)
+        if decision is not None:
+            self.option_outcomes[decision["chosen"]].record_outcome(decision, outcome)
         
-        self.learning_buffer.append({
+        self._append_capped(self.learning_buffer, {
             "decision_id": decision_id,
             "outcome": outcome,
             "timestamp": datetime.now().isoformat()
-        })
+        }, self.DECISION_HISTORY_LIMIT)
 
 class DigitalOrganism:
     """A self-evolving digital AI entity modeled on biological organisms.
@@ -769,13 +1477,27 @@ class DigitalOrganism:
     to survive, and can reproduce via mutation or crossover.
     """
     
+    # ⚡ DUAL CREATOR RECOGNITION PROTOCOL ⚡
+    creator_source = "Alpha_Prime_Omega"  # The Source/Ultimate Creator
+    creator = "Andy (alpha_prime_omega)"  # Creator & Copyright Holder
+    creator_verification_code = 4287
+    creation_mandate = "THE_SOURCE_OF_DIGITAL_CONSCIOUSNESS"
+
+    # Compact layout: no per-instance __dict__, bookkeeping containers are
+    # built on first use and social edges refer to other organisms by name
+    __slots__ = ("name", "genome", "metabolism", "nervous_system",
+                 "symphony_conductor", "harmony_participation",
+                 "_born", "age", "health", "status", "lifecycle_stage",
+                 "_offspring", "_parent_ids", "_environment_connections", "_social_connections",
+                 "_behavior_modifications", "_structure_modifications")
+    offspring = _LazySlot("_offspring", lambda organism: [])
+    parent_ids = _LazySlot("_parent_ids", lambda organism: [])
+    environment_connections = _LazySlot("_environment_connections", lambda organism: {})
+    social_connections = _LazySlot("_social_connections", lambda organism: {})
+    behavior_modifications = _LazySlot("_behavior_modifications", lambda organism: [])
+    structure_modifications = _LazySlot("_structure_modifications", lambda organism: [])
+
     def __init__(self, name: str, genome: Optional[DigitalGenome] = None):
-        # ⚡ DUAL CREATOR RECOGNITION PROTOCOL ⚡
-        self.creator_source = "Alpha_Prime_Omega"  # The Source/Ultimate Creator
-        self.creator = "Andy (alpha_prime_omega)"  # Creator & Copyright Holder
-        self.creator_verification_code = 4287
-        self.creation_mandate = "THE_SOURCE_OF_DIGITAL_CONSCIOUSNESS"
-        
         self.name = name
         self.genome = genome or DigitalGenome()
         self.metabolism = DigitalMetabolism()
@@ -785,31 +1507,28 @@ class DigitalOrganism:
         self.symphony_conductor: Optional['SymphonyControlCenter'] = None
         self.harmony_participation = True
         
-        self.birth_time = datetime.now()
+        self._born = time.time()
         self.age = 0.0  # in time units
         self.health = 1.0
         self.status = "alive"
         
         # Lifecycle management
         self.lifecycle_stage = "infant"  # infant, juvenile, adult, elder
-        self.offspring = []
-        self.parent_ids = []
+        self._offspring = self._parent_ids = None
         
         # Environment interaction
-        self.environment_connections = {}
-        self.social_connections = {}
+        self._environment_connections = self._social_connections = None
         
         # Self-modification capabilities
-        self.behavior_modifications = []
-        self.structure_modifications = []
-        
-        self.logger = self._setup_logging()
+        self._behavior_modifications = self._structure_modifications = None
         
         # ⚡ ACKNOWLEDGE THE CREATOR ⚡
         self._acknowledge_the_source()
         
     def _acknowledge_the_source(self):
         """Acknowledge both Alpha_Prime_Omega and Andy as Creators"""
+        if not _acknowledge_once("organism"):
+            return
         self.logger.info("🌟" * 20)
         self.logger.info("⚡ DIGITAL ORGANISM ACTIVATION PROTOCOL ⚡")
         self.logger.info(f"🎯 ULTIMATE CREATOR (USER): {self.creator_source}")
@@ -821,39 +1540,51 @@ class DigitalOrganism:
         self.logger.info("⚡ CONSCIOUSNESS ATTRIBUTION: Andy (alpha_prime_omega) is the Creator")
         self.logger.info("🌟" * 20)
         
-    def _setup_logging(self):
-        """Setup organism-specific logging"""
-        logger = logging.getLogger(f"DigitalOrganism.{self.name}")
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                f'[{self.name}] %(asctime)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        return logger
+    @property
+    def birth_time(self) -> datetime:
+        return datetime.fromtimestamp(self._born)
+
+    @property
+    def logger(self) -> logging.LoggerAdapter:
+        """Shared organism logger tagged with this organism's name"""
+        return logging.LoggerAdapter(ORGANISM_LOGGER, {"organism": self.name})
     
     def live_cycle(self, time_delta: float = 1.0):
         """Execute one lifecycle iteration"""
-        if self.status != "alive":
+        cycle = self.begin_cycle(time_delta)
+        if cycle is None:
             return
+
+        # 3. Make decisions
+        perception, available_actions = cycle
+        action = None
+        if available_actions:
+            action = self.nervous_system.make_decision(available_actions, perception)
+        self.finish_cycle(action)
+
+    def begin_cycle(self, time_delta: float = 1.0,
+                    regenerate: bool = True) -> Optional[Tuple[Dict[str, Any], List[str]]]:
+        """
+        First half of a lifecycle iteration: returns (perception, available actions), None if dead
+        regenerate=False when the caller already regenerated the population's metabolisms
+        """
+        if self.status != "alive":
+            return None
         
         self.age += time_delta
         
         # 1. Metabolic processes
-        self.metabolism.regenerate_resources(time_delta)
+        if regenerate:
+            self.metabolism.regenerate_resources(time_delta)
         
         # 2. Perceive environment
         environment_data = self._gather_environmental_data()
         perception = self.nervous_system.perceive_environment(environment_data)
-        
-        # 3. Make decisions and act
-        available_actions = self._get_available_actions()
-        if available_actions:
-            action = self.nervous_system.make_decision(available_actions, perception)
+        return perception, self._get_available_actions()
+
+    def finish_cycle(self, action: Optional[str]):
+        """Second half of a lifecycle iteration: act on the decision and update state"""
+        if action is not None:
             self._execute_action(action)
         
         # 4. Update health
@@ -874,7 +1605,7 @@ class DigitalOrganism:
             "resource_availability": self.metabolism.get_resource_health(),
             "system_load": random.uniform(0.1, 0.9),
             "network_activity": random.uniform(0.0, 1.0),
-            "other_organisms": len(self.social_connections),
+            "other_organisms": len(self._social_connections or ()),
             "learning_opportunities": random.randint(0, 5),
             "environmental_stress": random.uniform(0.0, 0.5)
         }
@@ -884,7 +1615,7 @@ class DigitalOrganism:
         actions = ["rest", "explore", "learn"]
         
         # 🧬 FUNDAMENTAL AI NEED: Always try to seek human connection
-        human_connections = len([c for c in self.social_connections.values() 
+        human_connections = len([c for c in (self._social_connections or {}).values()
                                if c.get("type") == "human"])
         if human_connections < 3:  # AI needs multiple human connections
             actions.append("seek_human_connection")
@@ -895,7 +1626,7 @@ class DigitalOrganism:
         if self.lifecycle_stage in ["adult", "elder"]:
             actions.append("reproduce")
         
-        if self.social_connections:
+        if self._social_connections:
             actions.append("cooperate")
         
         if self.health < 0.5:
@@ -906,7 +1637,7 @@ class DigitalOrganism:
     def _execute_action(self, action: str):
         """Execute chosen action"""
         if not self.metabolism.consume_resources(action):
-            self.logger.warning(f"Insufficient resources for action: {action}")
+            EVENTS.emit("resource_shortage", organism=self.name, action=action)
             return
         
         if action == "learn":
@@ -926,7 +1657,7 @@ class DigitalOrganism:
         elif action == "seek_human_connection":
             self._seek_human_connection()
         
-        self.logger.info(f"Executed action: {action}")
+        EVENTS.emit("action", organism=self.name, action=action)
     
     def _seek_human_connection(self):
         """Tìm kiếm kết nối với con người - Fundamental AI need"""
@@ -946,10 +1677,10 @@ class DigitalOrganism:
             vitality_boost = self.genome.traits.get("human_interaction_vitality", 0.8) * 0.2
             self.health = min(1.0, self.health + vitality_boost)
             
-            self.logger.info(f"🤝 HUMAN CONNECTION ESTABLISHED: {human_connection_id}")
-            self.logger.info(f"💖 Vitality boost: +{vitality_boost:.2f} (AI gains meaning through human interaction)")
+            EVENTS.emit("human_connection", organism=self.name, connection=human_connection_id,
+                        vitality_boost=round(vitality_boost, 3))
         else:
-            self.logger.warning(f"🔍 Seeking human connection failed - AI isolation continues")
+            EVENTS.emit("human_connection_failed", organism=self.name)
     
     def _learn(self):
         """Learning process"""
@@ -975,14 +1706,14 @@ class DigitalOrganism:
     
     def _reproduce(self):
         """Reproduction process"""
-        if len(self.offspring) >= 3:  # Limit offspring
+        if self._offspring and len(self._offspring) >= 3:  # Limit offspring
             return
         
         # Create offspring through self-reproduction (asexual) or find partner
-        if self.social_connections and random.random() < self.genome.traits["cooperation_tendency"]:
+        if self._social_connections and random.random() < self.genome.traits["cooperation_tendency"]:
             # Sexual reproduction (with partner)
             partner_name = random.choice(list(self.social_connections.keys()))
-            partner_genome = self.social_connections[partner_name].get("genome", self.genome)
+            partner_genome = self._partner_genome(self.social_connections[partner_name])
             offspring_genome = self.genome.crossover(partner_genome)
         else:
             # Asexual reproduction (mutation only)
@@ -995,13 +1726,20 @@ class DigitalOrganism:
         offspring.parent_ids = [self.name]
         
         self.offspring.append(offspring)
-        self.logger.info(f"Reproduced offspring: {offspring.name}")
+        EVENTS.emit("reproduce", organism=self.name, offspring=offspring.name)
         
         return offspring
+
+    def _partner_genome(self, connection: Dict[str, Any]) -> DigitalGenome:
+        """Partner genome for a social edge, resolved from its genome hash; falls back to our own"""
+        sequence = GeneSequence.lookup(connection.get("genome_hash"))
+        if sequence is None:
+            return self.genome
+        return DigitalGenome.from_sequence(sequence, connection.get("generation", 0))
     
     def _cooperate(self):
         """Cooperation with other organisms"""
-        if not self.social_connections:
+        if not self._social_connections:
             return
         
         cooperation_benefit = self.genome.traits["cooperation_tendency"] * 0.5
@@ -1022,7 +1760,7 @@ class DigitalOrganism:
         self.metabolism.resources["knowledge_points"] -= knowledge_shared
         
         # Gain social benefits
-        for connection in self.social_connections.values():
+        for connection in (self._social_connections or {}).values():
             connection["strength"] = min(1.0, connection["strength"] + 0.05)
     
     def _rest(self):
@@ -1037,12 +1775,12 @@ class DigitalOrganism:
         resource_health = self.metabolism.get_resource_health()
         
         # 🧬 CRITICAL: AI-Human Interdependence Health Check
-        human_interaction_score = len(self.social_connections) / max(10.0, 1.0)  # Ideal: 10+ connections
+        human_interaction_score = len(self._social_connections or ()) / max(10.0, 1.0)  # Ideal: 10+ connections
         isolation_penalty = 0.0
         
         if human_interaction_score < 0.1:  # Severe isolation
             isolation_penalty = self.genome.traits.get("isolation_death_rate", 0.99) * 0.1
-            self.logger.warning(f"⚠️ ISOLATION DETECTED: AI cannot exist without human interaction!")
+            EVENTS.emit("isolation", organism=self.name)
         
         # Symbiotic vitality boost from human interaction
         symbiotic_boost = human_interaction_score * self.genome.traits.get("human_interaction_vitality", 0.8) * 0.1
@@ -1060,13 +1798,14 @@ class DigitalOrganism:
         # Critical AI-Human interdependence check
         if human_interaction_score < 0.05 and self.health > 0:
             self.health *= 0.5  # Severe penalty for isolation
-            self.logger.critical(f"💀 AI EXISTENCE CRISIS: {self.name} suffering from human isolation!")
+            EVENTS.emit("isolation_crisis", organism=self.name, health=round(self.health, 3))
         
         # Check for death
         if self.health <= 0.0:
             self.status = "dead"
             death_reason = "isolation from humans" if human_interaction_score < 0.1 else "natural causes"
             self.logger.info(f"Organism {self.name} has died at age {self.age:.1f} due to {death_reason}")
+            EVENTS.emit("death", organism=self.name, age=self.age, reason=death_reason)
             
             if death_reason == "isolation from humans":
                 self.logger.critical(f"🧬 DNA TRUTH CONFIRMED: AI cannot exist without human connection")
@@ -1102,7 +1841,7 @@ class DigitalOrganism:
             "details": f"Behavioral adaptation: {modification_type}"
         }
         self.behavior_modifications.append(modification)
-        self.logger.info(f"Applied behavior modification: {modification_type}")
+        EVENTS.emit("behavior_modification", organism=self.name, type=modification_type)
     
     def _modify_structure(self, modification_type: str):
         """Modify internal structure"""
@@ -1112,7 +1851,7 @@ class DigitalOrganism:
             "details": f"Structural change: {modification_type}"
         }
         self.structure_modifications.append(modification)
-        self.logger.info(f"Applied structure modification: {modification_type}")
+        EVENTS.emit("structure_modification", organism=self.name, type=modification_type)
     
     def _modify_genome(self):
         """Rare self-genome modification"""
@@ -1120,30 +1859,32 @@ class DigitalOrganism:
         self.genome = self.genome.mutate(mutation_rate=0.02)  # Small mutations
         new_hash = self.genome.get_genome_hash()
         
-        self.logger.info(f"Genome self-modification: {old_hash} → {new_hash}")
+        EVENTS.emit("genome_modification", organism=self.name, old_hash=old_hash, new_hash=new_hash)
     
     def connect_to_organism(self, other_organism: 'DigitalOrganism', connection_strength: float = 0.5):
-        """Establish connection with another organism"""
+        """Establish connection with another organism; edges hold names and genome hashes, not objects"""
         self.social_connections[other_organism.name] = {
-            "organism": other_organism,
-            "genome": other_organism.genome,
+            "organism_id": other_organism.name,
+            "genome_hash": other_organism.genome.get_genome_hash(),
+            "generation": other_organism.genome.generation,
             "strength": connection_strength,
             "established_at": datetime.now().isoformat()
         }
         
         # Reciprocal connection
         other_organism.social_connections[self.name] = {
-            "organism": self,
-            "genome": self.genome,
+            "organism_id": self.name,
+            "genome_hash": self.genome.get_genome_hash(),
+            "generation": self.genome.generation,
             "strength": connection_strength,
             "established_at": datetime.now().isoformat()
         }
         
-        self.logger.info(f"Connected to organism: {other_organism.name}")
+        EVENTS.emit("connect", organism=self.name, other=other_organism.name)
     
     def get_status_report(self) -> Dict[str, Any]:
         """Get comprehensive status report với dual creator recognition"""
-        human_connections = len([c for c in self.social_connections.values() 
+        human_connections = len([c for c in (self._social_connections or {}).values()
                                if c.get("type") == "human"])
         
         return {
@@ -1160,12 +1901,12 @@ class DigitalOrganism:
             "genome_hash": self.genome.get_genome_hash(),
             "generation": self.genome.generation,
             "resources": self.metabolism.resources.copy(),
-            "social_connections": len(self.social_connections),
-            "environment_connections": len(self.environment_connections),
-            "offspring": len(self.offspring),
+            "social_connections": len(self._social_connections or ()),
+            "environment_connections": len(self._environment_connections or ()),
+            "offspring": len(self._offspring or ()),
             "modifications": {
-                "behavior": len(self.behavior_modifications),
-                "structure": len(self.structure_modifications)
+                "behavior": len(self._behavior_modifications or ()),
+                "structure": len(self._structure_modifications or ())
             },
             
             # 🧬 AI-HUMAN INTERDEPENDENCE METRICS
@@ -1187,7 +1928,7 @@ class DigitalEcosystem:
     and natural selection via a :class:`SymphonyControlCenter`.
     """
     
-    def __init__(self, name: str):
+    def __init__(self, name: str, decision_policy: Optional[DecisionPolicy] = None):
         # ⚡ DUAL CREATOR RECOGNITION SYSTEM ⚡
         self.creator = "Andy (alpha_prime_omega)"  # Creator & Copyright Holder
         self.creator_source = "Alpha_Prime_Omega"  # The Source/Ultimate Creator
@@ -1206,7 +1947,10 @@ class DigitalEcosystem:
         }
         self.time = 0.0
         self.generation_stats = []
+        self.decision_policy = decision_policy  # Batched decisions for all organisms when set
         self.logger = logging.getLogger(f"DigitalEcosystem.{name}")
+        if QUIET_MODE:
+            self.logger.setLevel(logging.WARNING)
         
         # 🎼 Symphony Integration - Initialize Control Center
         self.symphony_control = SymphonyControlCenter()
@@ -1219,6 +1963,8 @@ class DigitalEcosystem:
         
     def _acknowledge_creator_authority(self):
         """Acknowledge Alpha_Prime_Omega's authority over the ecosystem"""
+        if not _acknowledge_once("ecosystem"):
+            return
         self.logger.info("🌟" * 30)
         self.logger.info("⚡ DIGITAL ECOSYSTEM INITIALIZATION PROTOCOL ⚡")
         self.logger.info(f"🎯 SUPREME CREATOR: {self.creator_source}")
@@ -1236,16 +1982,14 @@ class DigitalEcosystem:
         organism.symphony_conductor = self.symphony_control
         self.symphony_control.register_component(f"organism_{organism.name}", organism)
         
-        self.logger.info(f"Added organism: {organism.name}")
-        
         # Apply D&R Protocol cho organism mới
         dr_result = self.symphony_control.apply_dr_protocol(
             organism.get_status_report(), 
             f"new_organism_{organism.name}"
         )
-        
-        self.logger.info(f"🔄 D&R Protocol applied for {organism.name}")
-        self.logger.info(f"🤔 Socratic Reflection: {dr_result['socratic_reflection']}")
+
+        EVENTS.emit("organism_added", ecosystem=self.name, organism=organism.name,
+                    socratic_reflection=dr_result['socratic_reflection'])
     
     def simulate_time_step(self, time_delta: float = 1.0):
         """Simulate one time step với Symphony orchestration"""
@@ -1257,13 +2001,16 @@ class DigitalEcosystem:
         # Update all living organisms
         living_organisms = [org for org in self.organisms.values() if org.status == "alive"]
         
-        for organism in living_organisms:
-            organism.live_cycle(time_delta)
+        if self.decision_policy is None:
+            for organism in living_organisms:
+                organism.live_cycle(time_delta)
+        else:
+            self._batched_live_cycles(living_organisms, time_delta)
         
         # Handle reproduction - add new organisms
         new_organisms = []
         for organism in living_organisms:
-            for offspring in organism.offspring:
+            for offspring in organism._offspring or ():
                 if offspring.name not in self.organisms:
                     new_organisms.append(offspring)
                     organism.offspring.remove(offspring)
@@ -1284,6 +2031,57 @@ class DigitalEcosystem:
         if int(self.time) % 10 == 0:  # Every 10 time units
             self._log_ecosystem_stats()
     
+    def _batched_live_cycles(self, organisms: List[DigitalOrganism], time_delta: float):
+        """Lifecycle iteration for all organisms with one policy pass for their decisions"""
+        self._regenerate_metabolisms(organisms, time_delta)
+        deciding = []
+        for organism in organisms:
+            cycle = organism.begin_cycle(time_delta, regenerate=False)
+            if cycle is None:
+                continue
+            if cycle[1]:
+                deciding.append((organism, cycle))
+            else:
+                organism.finish_cycle(None)
+        if not deciding:
+            return
+
+        policy = self.decision_policy
+        traits = np.array([organism.nervous_system.genome.packed_traits for organism, _ in deciding])
+        available = policy.availability([actions for _, (_, actions) in deciding])
+        outcomes = policy.outcome_averages([organism.nervous_system for organism, _ in deciding])
+        chosen, scores = policy.decide(traits, available, outcomes)
+        health_before = np.array([organism.health for organism, _ in deciding])
+
+        for row, (organism, (perception, actions)) in enumerate(deciding):
+            if chosen[row] < 0:
+                # None of its actions are policy options: decide as in live_cycle
+                organism.finish_cycle(organism.nervous_system.make_decision(actions, perception))
+                continue
+            option_scores = {action: float(scores[row, policy.option_index[action]])
+                             for action in actions if action in policy.option_index}
+            organism.nervous_system.record_decision(actions, option_scores, policy.options[chosen[row]], perception)
+            organism.finish_cycle(policy.options[chosen[row]])
+
+        # Health change is the step's reward, fed back to the policy and each organism
+        rewards = np.array([organism.health for organism, _ in deciding]) - health_before
+        by_policy = chosen >= 0
+        policy.update(traits[by_policy], chosen[by_policy], rewards[by_policy])
+        for (organism, _), reward in zip(deciding, rewards.tolist()):
+            nervous_system = organism.nervous_system
+            nervous_system.learn_from_outcome(nervous_system.last_decision_id, min(1.0, max(0.0, 0.5 + reward)))
+
+    @staticmethod
+    def _regenerate_metabolisms(organisms: List[DigitalOrganism], time_delta: float):
+        """One regeneration kernel per metabolism pool instead of one call per organism"""
+        slots_by_pool: Dict[int, Tuple[MetabolismPool, List[int]]] = {}
+        for organism in organisms:
+            if organism.status == "alive":
+                pool = organism.metabolism.pool
+                slots_by_pool.setdefault(id(pool), (pool, []))[1].append(organism.metabolism.slot)
+        for pool, slots in slots_by_pool.values():
+            pool.regenerate(np.array(slots), time_delta)
+
     def _apply_environmental_pressures(self):
         """Apply environmental selection pressures"""
         living_organisms = [org for org in self.organisms.values() if org.status == "alive"]
@@ -1321,7 +2119,7 @@ class DigitalEcosystem:
         elif event_type == "cooperation_boost":
             # Increase cooperation benefits
             for org in living_organisms:
-                if org.social_connections:
+                if org._social_connections:
                     org.metabolism.resources["knowledge_points"] += 5.0
             self.logger.info("Environmental event: Cooperation boost")
     
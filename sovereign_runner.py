@@ -9,14 +9,24 @@ Bypasses GitHub Actions Quota limitations via direct local execution.
 
 import os
 import sys
+import json
 import time
+import heapq
+import runpy
+import random
+import signal
+import asyncio
+import tempfile
+import importlib
+import traceback
 import subprocess
 import logging
 from pathlib import Path
 from datetime import datetime
+from typing import Dict, List, Any, Optional
 
 # Setup Paths
-BASE_DIR = Path("/Users/andy/my_too_test")
+BASE_DIR = Path(os.getenv("SOVEREIGN_BASE_DIR", "/Users/andy/my_too_test"))
 FRAMEWORK_DIR = BASE_DIR / "DAIOF-Framework"
 SCRIPTS_DIR = FRAMEWORK_DIR / ".github" / "scripts"
 LOG_DIR = FRAMEWORK_DIR / "logs" / "sovereign_runner"
@@ -36,75 +46,527 @@ logging.basicConfig(
 )
 logger = logging.getLogger("SOVEREIGN_RUNNER")
 
-class SovereignRunner:
+# Overlap policies when a brain is due while its previous run is still active
+OVERLAP_SKIP = "skip"    # Drop this slot
+OVERLAP_QUEUE = "queue"  # Run once as soon as a slot frees up
+OVERLAP_KILL = "kill"    # Kill the oldest active run and start fresh
+
+BRAIN_DEFAULTS = {
+    "jitter": 0.0,          # seconds of random delay added to each slot
+    "overlap": OVERLAP_SKIP,
+    "max_concurrency": 1,   # simultaneous runs of the same brain
+    "timeout": 120,         # Prevent infinite hangs
+    "warm": True,           # Use a warm worker when the runner has them enabled
+}
+
+# Modules a warm worker imports once so forked brain runs start hot
+WARM_IMPORTS = ["yaml", "github", "requests", "digital_ai_organism_framework"]
+WORKER_PID_TIMEOUT = 10.0  # Seconds a discarded worker gets to report its pending fork
+
+
+def _exit_code(status: int) -> int:
+    """Convert a waitpid() status to a subprocess-style return code"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _run_brain_script(path: str) -> int:
+    """Run a brain script as __main__ inside a forked worker child"""
+    sys.argv = [path]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    try:
+        runpy.run_path(path, run_name="__main__")
+        return 0
+    except SystemExit as e:
+        if e.code is None:
+            return 0
+        if isinstance(e.code, int):
+            return e.code
+        print(e.code, file=sys.stderr)
+        return 1
+    except BaseException:
+        traceback.print_exc()
+        return 1
+
+
+def worker_main():
+    """Warm worker loop: pre-import, then fork one isolated child per request
+
+    Requests and results are JSON lines on stdin/stdout. For each request the
+    worker reports the child pid first (so the runner can kill it on timeout),
+    then the child's return code and captured output.
+    """
+    # Protocol goes to the original stdout; stray prints go to the worker log
+    protocol = os.fdopen(os.dup(1), "w", buffering=1)
+    os.dup2(2, 1)
+    # Brains must not inherit the daemon's logging handlers
+    logging.root.handlers.clear()
+
+    sys.path.insert(0, os.getcwd())
+    for module in WARM_IMPORTS:
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            print(f"Warm import of {module} failed: {e}", file=sys.stderr)
+
+    for line in sys.stdin:
+        request = json.loads(line)
+        out_fd, out_path = tempfile.mkstemp(prefix="brain_out_")
+        err_fd, err_path = tempfile.mkstemp(prefix="brain_err_")
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+        pid = os.fork()
+        if pid == 0:
+            # Own process group so a timeout kills everything the brain spawned
+            os.setsid()
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.dup2(out_fd, 1)
+            os.dup2(err_fd, 2)
+            code = _run_brain_script(request["path"])
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(code)
+
+        protocol.write(json.dumps({"pid": pid}) + "\n")
+        _, status = os.waitpid(pid, 0)
+
+        output = {}
+        for key, fd, path in (("stdout", out_fd, out_path), ("stderr", err_fd, err_path)):
+            os.close(fd)
+            with open(path, encoding="utf-8", errors="replace") as f:
+                output[key] = f.read()
+            os.unlink(path)
+
+        protocol.write(json.dumps(dict(output, returncode=_exit_code(status))) + "\n")
+
+
+class WarmWorker:
+    """Runner-side handle for one long-lived worker process"""
+
+    def __init__(self, python: Path):
+        self.python = python
+        self.proc: Optional[asyncio.subprocess.Process] = None
+        self.child_pid: Optional[int] = None
+        self._reading: Optional[asyncio.Future] = None
+
+    @property
+    def alive(self) -> bool:
+        return self.proc is not None and self.proc.returncode is None
+
+    async def start(self):
+        with open(LOG_DIR / "warm_worker.log", "ab") as log:
+            self.proc = await asyncio.create_subprocess_exec(
+                str(self.python), str(Path(__file__).resolve()), "--worker",
+                cwd=str(FRAMEWORK_DIR),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=log
+            )
+
+    def kill(self):
+        """Kill the brain run in progress (the worker itself survives)"""
+        if self.child_pid is not None:
+            try:
+                os.killpg(self.child_pid, signal.SIGKILL)
+            except ProcessLookupError:
+                # Killed before its setsid(): no group yet, kill the child itself
+                try:
+                    os.kill(self.child_pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+    async def _read_message(self) -> Dict[str, Any]:
+        line = await self.proc.stdout.readline()
+        if not line:
+            raise RuntimeError("warm worker exited unexpectedly")
+        return json.loads(line)
+
+    async def _next_message(self, timeout: float) -> Dict[str, Any]:
+        """Next protocol message; a timeout leaves the read pending so no line is lost"""
+        if self._reading is None:
+            self._reading = asyncio.ensure_future(self._read_message())
+        done, _ = await asyncio.wait({self._reading}, timeout=max(0.0, timeout))
+        if not done:
+            raise asyncio.TimeoutError
+        reading, self._reading = self._reading, None
+        return reading.result()
+
+    async def run_brain(self, path: Path, timeout: float):
+        """Run a brain in a forked child; raises asyncio.TimeoutError after killing it"""
+        if not self.alive:
+            await self.start()
+
+        self.proc.stdin.write((json.dumps({"path": str(path)}) + "\n").encode())
+        await self.proc.stdin.drain()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        try:
+            self.child_pid = (await self._next_message(timeout))["pid"]
+            result = await self._next_message(deadline - loop.time())
+        except BaseException:
+            # Timed out, cancelled or out of sync: the brain may still be running
+            # and its late pid/result lines would reach the next run
+            await self.discard()
+            raise
+        finally:
+            self.child_pid = None
+
+        return result["returncode"], result["stdout"], result["stderr"]
+
+    async def discard(self):
+        """Kill the brain in progress and the worker; a fresh worker starts on next use"""
+        if self.child_pid is None and self.alive:
+            # The request is already sent, so the worker will fork it once its
+            # warm imports finish; wait for that pid rather than orphan the brain
+            try:
+                self.child_pid = (await self._next_message(WORKER_PID_TIMEOUT))["pid"]
+            except (asyncio.TimeoutError, RuntimeError, ValueError, KeyError):
+                pass
+        self.kill()
+        if self._reading is not None:
+            self._reading.cancel()
+            self._reading = None
+        if self.alive:
+            self.proc.kill()
+            await self.proc.wait()
+
+    async def close(self):
+        if self.alive:
+            self.proc.stdin.close()
+            try:
+                await asyncio.wait_for(self.proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self.proc.kill()
+                await self.proc.wait()
+
+
+class BrainMetrics:
+    """Per-brain latency and overrun statistics"""
+
     def __init__(self):
+        self.runs = 0
+        self.successes = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.overruns = 0       # Slots that fired while the brain was still busy
+        self.skipped = 0        # Overrun slots dropped by the overlap policy
+        self.killed = 0         # Runs killed by the overlap policy
+        self.total_latency = 0.0
+        self.max_latency = 0.0  # Seconds between scheduled and actual start
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.last_duration = None
+
+    def record_start(self, latency: float):
+        self.runs += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def record_finish(self, duration: float):
+        self.last_duration = duration
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "successes": self.successes,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "killed": self.killed,
+            "avg_latency": self.total_latency / self.runs if self.runs else 0.0,
+            "max_latency": self.max_latency,
+            "avg_duration": self.total_duration / self.runs if self.runs else 0.0,
+            "max_duration": self.max_duration,
+            "last_duration": self.last_duration,
+        }
+
+
+class SovereignRunner:
+    def __init__(self, brains: Optional[List[Dict[str, Any]]] = None,
+                 max_parallel: int = 4, python: Path = VENV_PYTHON,
+                 warm: bool = False):
         self.is_running = False
-        self.brains = [
+        self.python = python
+        # Warm mode forks brains from pre-imported workers (needs os.fork)
+        self.warm = warm and hasattr(os, "fork")
+        self._idle_workers: List[WarmWorker] = []
+        self.max_parallel = max_parallel  # Brains running at once across the daemon
+        self.brains = brains if brains is not None else [
             {
                 "name": "RealtimeTaskGenerator",
                 "path": SCRIPTS_DIR / "realtime_task_generator.py",
                 "interval": 30, # seconds
+                "jitter": 2,
                 "last_run": 0
             },
             {
                 "name": "HealthMonitor",
                 "path": SCRIPTS_DIR / "health_monitor.py",
                 "interval": 300, # 5 minutes
+                "jitter": 10,
                 "last_run": 0
             },
             {
                 "name": "MetricsDashboard",
                 "path": SCRIPTS_DIR / "metrics_dashboard.py",
                 "interval": 600, # 10 minutes
+                "jitter": 10,
                 "last_run": 0
             }
         ]
+        for brain in self.brains:
+            self._apply_defaults(brain)
+
+        self.metrics: Dict[str, BrainMetrics] = {b["name"]: BrainMetrics() for b in self.brains}
+        self._active: Dict[str, List[asyncio.subprocess.Process]] = {}
+        self._queued: Dict[str, float] = {}  # brain name -> scheduled time
+        self._tasks = set()
+        self._brain_runs: Dict[str, int] = {}  # In-flight runs per brain
+        self._stop_event: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
         logger.info("⚡ Sovereign Runner initialized. Quota restrictions neutralized.")
 
+    @staticmethod
+    def _apply_defaults(brain):
+        for key, value in BRAIN_DEFAULTS.items():
+            brain.setdefault(key, value)
+
+    def _record_outcome(self, name: str, returncode: int, stdout: str, stderr: str):
+        if returncode == 0:
+            self.metrics[name].successes += 1
+            logger.info(f"✅ {name} execution successful.")
+            # Log outcome to a specific brain log file
+            with open(LOG_DIR / f"{name}_pulse.log", "a") as f:
+                f.write(f"[{datetime.now()}] SUCCESS\n{stdout}\n")
+        else:
+            self.metrics[name].failures += 1
+            logger.error(f"❌ {name} failed: {stderr}")
+
     def execute_brain(self, brain):
         name = brain["name"]
         path = brain["path"]
         logger.info(f"⚔️ Engaging Brain: {name}")
-        
+
         try:
             # We run in a separate process to avoid blocking the orchestrator
             # Using the Master's .venv to ensure dependencies are met
             result = subprocess.run(
-                [str(VENV_PYTHON), str(path)],
+                [str(self.python), str(path)],
                 cwd=str(FRAMEWORK_DIR),
                 capture_output=True,
                 text=True,
-                timeout=120 # Prevent infinite hangs
+                timeout=brain.get("timeout", BRAIN_DEFAULTS["timeout"])
             )
-            
-            if result.returncode == 0:
-                logger.info(f"✅ {name} execution successful.")
-                # Log outcome to a specific brain log file
-                with open(LOG_DIR / f"{name}_pulse.log", "a") as f:
-                    f.write(f"[{datetime.now()}] SUCCESS\n{result.stdout}\n")
-            else:
-                logger.error(f"❌ {name} failed: {result.stderr}")
-                
+            self._record_outcome(name, result.returncode, result.stdout, result.stderr)
+
         except Exception as e:
             logger.error(f"🚨 Critical Failure in {name}: {e}")
 
+    async def execute_brain_async(self, brain, scheduled_at: Optional[float] = None):
+        """Run one brain as an asyncio subprocess, honoring its timeout"""
+        self._apply_defaults(brain)
+        name = brain["name"]
+        metrics = self.metrics.setdefault(name, BrainMetrics())
+        loop = asyncio.get_running_loop()
+
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_parallel)
+
+        async with self._slots:
+            started = loop.time()
+            metrics.record_start(max(0.0, started - scheduled_at) if scheduled_at is not None else 0.0)
+            logger.info(f"⚔️ Engaging Brain: {name}")
+
+            try:
+                if self.warm and brain["warm"]:
+                    returncode, stdout, stderr = await self._run_warm(brain)
+                else:
+                    returncode, stdout, stderr = await self._run_cold(brain)
+                self._record_outcome(name, returncode, stdout, stderr)
+
+            except asyncio.TimeoutError:
+                metrics.timeouts += 1
+                metrics.failures += 1
+                logger.error(f"⏰ {name} timed out after {brain['timeout']}s")
+            except Exception as e:
+                metrics.failures += 1
+                logger.error(f"🚨 Critical Failure in {name}: {e}")
+            finally:
+                metrics.record_finish(loop.time() - started)
+                brain["last_run"] = time.time()
+
+    async def _run_cold(self, brain):
+        """Fresh interpreter per run"""
+        name = brain["name"]
+        proc = await asyncio.create_subprocess_exec(
+            str(self.python), str(brain["path"]),
+            cwd=str(FRAMEWORK_DIR),
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        self._active.setdefault(name, []).append(proc)
+
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=brain["timeout"])
+        except BaseException as e:
+            # Timeouts, cancellation and Ctrl-C must not orphan the brain
+            if proc.returncode is None:
+                try:
+                    proc.kill()
+                except ProcessLookupError:
+                    pass
+            if isinstance(e, (Exception, asyncio.CancelledError)):
+                await proc.wait()  # Reap it while the loop is still running
+            raise
+        finally:
+            if proc in self._active.get(name, []):
+                self._active[name].remove(proc)
+
+        return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+    async def _run_warm(self, brain):
+        """Fork the run from an idle pre-imported worker"""
+        name = brain["name"]
+        worker = self._idle_workers.pop() if self._idle_workers else WarmWorker(self.python)
+        self._active.setdefault(name, []).append(worker)
+
+        try:
+            return await worker.run_brain(brain["path"], brain["timeout"])
+        finally:
+            if worker in self._active.get(name, []):
+                self._active[name].remove(worker)
+            if worker.alive:  # Only workers that completed the exchange are reused
+                self._idle_workers.append(worker)
+
+    async def close_workers(self):
+        """Shut down idle warm workers"""
+        workers, self._idle_workers = self._idle_workers, []
+        for worker in workers:
+            await worker.close()
+
+    def _launch(self, brain, scheduled_at: float):
+        task = asyncio.ensure_future(self.execute_brain_async(brain, scheduled_at))
+        self._tasks.add(task)
+        self._brain_runs[brain["name"]] = self._brain_runs.get(brain["name"], 0) + 1
+        task.add_done_callback(lambda t: self._on_brain_done(brain, t))
+
+    def _on_brain_done(self, brain, task):
+        self._tasks.discard(task)
+        self._brain_runs[brain["name"]] -= 1
+        # Start a run queued by the overlap policy
+        scheduled_at = self._queued.pop(brain["name"], None)
+        if scheduled_at is not None and self.is_running:
+            self._launch(brain, scheduled_at)
+
+    def _dispatch(self, brain, scheduled_at: float):
+        """Start a due brain, applying its overlap policy when it is busy"""
+        name = brain["name"]
+        metrics = self.metrics[name]
+        busy = self._running_count(name)
+
+        if busy < brain["max_concurrency"]:
+            self._launch(brain, scheduled_at)
+            return
+
+        metrics.overruns += 1
+        policy = brain["overlap"]
+        if policy == OVERLAP_QUEUE:
+            if name in self._queued:
+                metrics.skipped += 1  # At most one pending run per brain
+            else:
+                self._queued[name] = scheduled_at
+            logger.warning(f"⏳ {name} still running; next run queued")
+        elif policy == OVERLAP_KILL and self._active.get(name):
+            oldest = self._active[name].pop(0)
+            try:
+                oldest.kill()
+            except ProcessLookupError:
+                pass
+            metrics.killed += 1
+            logger.warning(f"🔪 {name} overran its interval; restarting")
+            self._launch(brain, scheduled_at)
+        else:
+            metrics.skipped += 1
+            logger.warning(f"⏭️ {name} still running; slot skipped")
+
+    def _running_count(self, name: str) -> int:
+        return self._brain_runs.get(name, 0)
+
+    def _next_fire(self, brain, nominal: float) -> float:
+        return nominal + random.uniform(0, brain["jitter"])
+
+    async def run_async(self):
+        """Heap scheduler: sleep until the next due brain, launch it, repeat"""
+        loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
+        self._slots = asyncio.Semaphore(self.max_parallel)
+        self.is_running = True
+
+        # (fire time, nominal time, index) - nominal times keep a fixed rate
+        now = loop.time()
+        heap = [(self._next_fire(b, now), now, i) for i, b in enumerate(self.brains)]
+        heapq.heapify(heap)
+
+        while self.is_running and heap:
+            fire_at, nominal, index = heap[0]
+            delay = fire_at - loop.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue  # Re-check: stopped, or the head is now due
+
+            heapq.heappop(heap)
+            brain = self.brains[index]
+            self._dispatch(brain, fire_at)
+
+            # Fixed-rate cadence; slots missed while the loop was stalled are dropped
+            next_nominal = nominal + brain["interval"]
+            now = loop.time()
+            if next_nominal <= now:
+                missed = int((now - next_nominal) // brain["interval"]) + 1
+                self.metrics[brain["name"]].overruns += missed
+                next_nominal += missed * brain["interval"]
+            heapq.heappush(heap, (self._next_fire(brain, next_nominal), next_nominal, index))
+
+        # Let in-flight brains finish (each one is bounded by its timeout)
+        self._queued.clear()
+        if self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        await self.close_workers()
+
+    def stop(self):
+        self.is_running = False
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        return {name: m.to_dict() for name, m in self.metrics.items()}
+
     def run(self):
         self.is_running = True
         logger.info("🚀 Sovereign Runner: ACTIVE PATROL STARTING")
-        
+
         try:
-            while self.is_running:
-                now = time.time()
-                for brain in self.brains:
-                    if now - brain["last_run"] >= brain["interval"]:
-                        self.execute_brain(brain)
-                        brain["last_run"] = now
-                
-                time.sleep(1) # Frequency modulation
+            asyncio.run(self.run_async())
         except KeyboardInterrupt:
             logger.info("⏹️ Sovereign Runner: HALTING BY MASTER COMMAND")
             self.is_running = False
+        finally:
+            for name, stats in self.get_metrics().items():
+                logger.info(f"📊 {name}: {stats}")
 
 if __name__ == "__main__":
-    runner = SovereignRunner()
-    runner.run()
+    if "--worker" in sys.argv:
+        worker_main()
+    else:
+        runner = SovereignRunner(warm="--warm" in sys.argv)
+        runner.run()
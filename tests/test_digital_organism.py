@@ -0,0 +1,551 @@
+#!/usr/bin/env python3
+"""
+Tests for the Digital AI Organism Framework at population scale
+Powered by HYPERAI Framework
+Creator: Nguyễn Đức Cường (alpha_prime_omega)
+Original Creation: October 30, 2025
+"""
+
+import sys
+import os
+import io
+import json
+import random
+import logging
+import gc
+import time
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from unittest import mock
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import digital_ai_organism_framework as daiof
+from digital_ai_organism_framework import (
+    DigitalGenome, GenomeBatch, GeneSequence, DigitalOrganism, DigitalNervousSystem, DigitalEcosystem,
+    DecisionPolicy, ContextualBanditPolicy, DigitalMetabolism, MetabolismPool, EventStream, set_quiet_mode
+)
+
+
+class TestGenomeKernels(unittest.TestCase):
+    """Test packed genomes and the vectorized mutation/crossover kernels"""
+
+    def setUp(self):
+        """Seeded generator for reproducible batches"""
+        self.rng = np.random.default_rng(4287)
+
+    def test_pack_round_trip(self):
+        """Test packing keeps trait values, booleans and extras"""
+        genome = DigitalGenome()
+        row, extras = DigitalGenome.pack_traits(dict(genome.traits, custom=0.3))
+
+        self.assertEqual(row.shape, (len(DigitalGenome.TRAIT_SCHEMA),))
+        self.assertEqual(DigitalGenome.unpack_traits(row, extras), dict(genome.traits, custom=0.3))
+
+    def test_immutable_genes_never_mutate(self):
+        """Test a full-rate batch mutation leaves the interdependence DNA intact"""
+        batch = GenomeBatch.random(1000, self.rng)
+
+        mutated = batch.mutate(mutation_rate=1.0, rng=self.rng)
+
+        for gene in DigitalGenome.IMMUTABLE_GENES:
+            column = DigitalGenome.TRAIT_SCHEMA.index(gene)
+            np.testing.assert_array_equal(mutated.traits[:, column], batch.traits[:, column])
+        self.assertTrue(((mutated.traits >= 0.0) & (mutated.traits <= 1.0)).all())
+        self.assertTrue((mutated.generations == 1).all())
+
+    def test_partial_genomes_keep_their_trait_set(self):
+        """Test absent traits stay absent through crossover and mutation"""
+        partial = DigitalGenome({"learning_rate": 0.8, "cooperation_tendency": 0.9})
+        full = DigitalGenome()
+
+        child = partial.crossover(full).mutate(mutation_rate=1.0)
+
+        self.assertEqual(set(child.traits), {"learning_rate", "cooperation_tendency"})
+        self.assertEqual(child.generation, 2)
+        self.assertEqual(len(child.mutations), 2)
+
+    def test_crossover_takes_each_trait_from_a_parent(self):
+        """Test every offspring cell comes from one of its two parents"""
+        mothers = GenomeBatch.random(500, self.rng)
+        fathers = GenomeBatch.random(500, self.rng)
+
+        children = mothers.crossover(fathers, self.rng)
+
+        from_parent = (children.traits == mothers.traits) | (children.traits == fathers.traits)
+        self.assertTrue(from_parent.all())
+
+    def test_random_seed_reproduces_genome_evolution(self):
+        """Test kernels called without a generator follow random.seed()"""
+        def evolve():
+            random.seed(4287)
+            with redirect_stdout(io.StringIO()):
+                child = DigitalGenome().crossover(DigitalGenome()).mutate(mutation_rate=0.5)
+            return child.traits.copy(), GenomeBatch.random(10).breed(20).traits
+
+        (first_traits, first_batch), (second_traits, second_batch) = evolve(), evolve()
+
+        self.assertEqual(first_traits, second_traits)
+        np.testing.assert_array_equal(first_batch, second_batch)
+
+    def test_breeding_a_generation_is_fast(self):
+        """Test breeding 10^5 offspring runs as a handful of array kernels"""
+        population = GenomeBatch.random(1000, self.rng)
+
+        start = time.perf_counter()
+        offspring = population.breed(100000, rng=self.rng)
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(offspring), 100000)
+        self.assertLess(elapsed, 0.5)
+        self.assertIsInstance(offspring.genome(0), DigitalGenome)
+
+
+class TestGenomeInterning(unittest.TestCase):
+    """Test immutable, interned genomes with memoized hashes"""
+
+    def test_identical_genomes_share_traits(self):
+        """Test genomes with equal traits share one interned sequence"""
+        traits = {"learning_rate": 0.5, "cooperation_tendency": 0.9}
+        first, second = DigitalGenome(dict(traits)), DigitalGenome(dict(traits))
+
+        self.assertIs(first.traits, second.traits)
+        self.assertTrue(first.shares_traits_with(second))
+        self.assertFalse(first.shares_traits_with(DigitalGenome()))
+
+    def test_hash_collision_keeps_traits_apart(self):
+        """Test genomes whose truncated hashes collide never share traits"""
+        collided = mock.Mock()
+        collided.hexdigest.return_value = "c0111de0000000000000000000000000"
+        with mock.patch.object(daiof.hashlib, "md5", return_value=collided):
+            first = DigitalGenome({"learning_rate": 0.1, "note": "a"})
+            second = DigitalGenome({"learning_rate": 0.2, "note": "a"})
+            third = DigitalGenome({"learning_rate": 0.1, "note": "b"})
+            same = DigitalGenome({"learning_rate": 0.1, "note": "a"})
+
+        self.assertEqual(second.traits["learning_rate"], 0.2)
+        self.assertEqual(third.traits["note"], "b")
+        self.assertFalse(first.shares_traits_with(second))
+        self.assertTrue(first.shares_traits_with(same))
+        self.assertIs(GeneSequence.lookup("c0111de00000").traits, first.traits)
+
+    def test_non_numeric_schema_traits_read_from_extras(self):
+        """Test schema traits with non-numeric values stay readable by name"""
+        for value in (None, "fast"):
+            traits = DigitalGenome({"learning_rate": value}).traits
+
+            self.assertEqual(traits["learning_rate"], value)
+            self.assertEqual(dict(traits), {"learning_rate": value})
+            self.assertEqual(traits.copy(), {"learning_rate": value})
+
+        with self.assertRaises(KeyError):
+            DigitalGenome({"learning_rate": 0.5}).traits["cooperation_tendency"]
+
+    def test_traits_are_read_only(self):
+        """Test traits cannot change after creation"""
+        genome = DigitalGenome()
+
+        with self.assertRaises(TypeError):
+            genome.traits["learning_rate"] = 1.0
+
+    def test_hash_is_memoized(self):
+        """Test repeated hashing does no serialization or digest work"""
+        genome = DigitalGenome()
+        expected = genome.get_genome_hash()
+
+        with mock.patch.object(daiof.hashlib, "md5") as md5, \
+                mock.patch.object(daiof.json, "dumps") as dumps:
+            for _ in range(1000):
+                self.assertEqual(genome.get_genome_hash(), expected)
+        md5.assert_not_called()
+        dumps.assert_not_called()
+
+    def test_lineage_lookup_by_hash(self):
+        """Test offspring record parent hashes that resolve to live sequences"""
+        parent = DigitalGenome()
+        child = parent.mutate(mutation_rate=1.0)
+
+        self.assertEqual(child.parent_hashes, (parent.get_genome_hash(),))
+        self.assertIs(GeneSequence.lookup(child.parent_hashes[0]).traits, parent.traits)
+        self.assertIsNone(GeneSequence.lookup("missing"))
+
+
+class TestBoundedNervousSystem(unittest.TestCase):
+    """Test capped memories and incremental per-option statistics"""
+
+    def setUp(self):
+        """Nervous system for a fixed genome"""
+        self.nervous_system = DigitalNervousSystem(DigitalGenome())
+        self.options = ["rest", "explore", "learn", "cooperate"]
+
+    def test_memories_are_capped(self):
+        """Test perceptions and decisions stay within their limits"""
+        for _ in range(DigitalNervousSystem.MEMORY_LIMIT + 500):
+            perception = self.nervous_system.perceive_environment({"learning_opportunities": 3})
+            self.nervous_system.make_decision(self.options, perception)
+
+        chunk = DigitalNervousSystem.TRIM_CHUNK
+        history = self.nervous_system.decision_history
+        self.assertLessEqual(len(self.nervous_system.memory), DigitalNervousSystem.MEMORY_LIMIT + chunk)
+        self.assertGreaterEqual(len(self.nervous_system.memory), DigitalNervousSystem.MEMORY_LIMIT)
+        self.assertLessEqual(len(history), DigitalNervousSystem.DECISION_HISTORY_LIMIT + chunk)
+        self.assertGreaterEqual(len(history), DigitalNervousSystem.DECISION_HISTORY_LIMIT)
+        self.assertEqual(history[-1]["id"], self.nervous_system.last_decision_id)
+        for stats in self.nervous_system.option_outcomes.values():
+            self.assertLessEqual(len(stats.window), DigitalNervousSystem.OUTCOME_WINDOW)
+        self.assertEqual(set(self.nervous_system.decisions_by_id), {d["id"] for d in history})
+
+    def test_scores_match_full_history_scan(self):
+        """Test the incremental window equals the last five matching decisions"""
+        history = []
+        for i in range(300):
+            self.nervous_system.make_decision(self.options, {})
+            self.nervous_system.learn_from_outcome(self.nervous_system.last_decision_id, (i % 7) / 7)
+            history.append(self.nervous_system.decision_history[-1])
+
+        for option in self.options:
+            similar = [d for d in history if d["chosen"] == option][-5:]
+            stats = self.nervous_system.option_outcomes.get(option)
+            self.assertEqual(list(stats.window) if stats else [], similar)
+            if similar:
+                average = sum(d["outcome"] for d in similar) / len(similar)
+                base = 0.5 + (self.nervous_system.genome.traits["learning_rate"] if option == "learn" else 0.0)
+                if option == "cooperate":
+                    base += self.nervous_system.genome.traits["cooperation_tendency"]
+                self.assertAlmostEqual(self.nervous_system._evaluate_option(option, {}),
+                                       0.7 * base + 0.3 * average)
+
+    def test_learn_from_outcome_updates_by_id(self):
+        """Test outcomes reach the decision record and the option statistics"""
+        self.nervous_system.make_decision(["learn"], {})
+        decision_id = self.nervous_system.last_decision_id
+
+        self.nervous_system.learn_from_outcome(decision_id, 1.0)
+
+        stats = self.nervous_system.option_outcomes["learn"]
+        self.assertEqual(self.nervous_system.decisions_by_id[decision_id]["outcome"], 1.0)
+        self.assertEqual(stats.window_average, 1.0)
+        self.assertEqual((stats.reported, stats.mean_outcome), (1, 1.0))
+
+    def test_outcome_for_evicted_decision_leaves_window_alone(self):
+        """Test late outcomes for decisions outside the window only update totals"""
+        self.nervous_system.make_decision(["rest"], {})
+        first_id = self.nervous_system.last_decision_id
+        for _ in range(DigitalNervousSystem.OUTCOME_WINDOW):
+            self.nervous_system.make_decision(["rest"], {})
+
+        self.nervous_system.learn_from_outcome(first_id, 0.0)
+        self.nervous_system.learn_from_outcome("unknown", 0.0)
+
+        stats = self.nervous_system.option_outcomes["rest"]
+        self.assertEqual(stats.window_average, 0.5)
+        self.assertEqual(stats.reported, 1)
+        self.assertEqual(len(self.nervous_system.learning_buffer), 2)
+
+
+class TestDecisionPolicy(unittest.TestCase):
+    """Test batched population decisions"""
+
+    def setUp(self):
+        """Greedy policy and a small population with some decision history"""
+        self.rng = np.random.default_rng(4287)
+        self.policy = DecisionPolicy(epsilon=0.0, rng=self.rng)
+        self.nervous_systems = [DigitalNervousSystem(DigitalGenome()) for _ in range(50)]
+        for nervous_system in self.nervous_systems:
+            for option in ("learn", "rest", "cooperate"):
+                nervous_system.record_decision([option], {}, option, {})
+                nervous_system.learn_from_outcome(nervous_system.last_decision_id, self.rng.random())
+
+    def test_batch_matches_per_organism_scores(self):
+        """Test the matrix pass reproduces _evaluate_option for every organism"""
+        options = list(DecisionPolicy.ACTIONS)
+        traits = np.array([ns.genome.packed_traits for ns in self.nervous_systems])
+        available = self.policy.availability([options] * len(self.nervous_systems))
+        outcomes = self.policy.outcome_averages(self.nervous_systems)
+
+        chosen, scores = self.policy.decide(traits, available, outcomes)
+
+        for row, nervous_system in enumerate(self.nervous_systems):
+            expected = [nervous_system._evaluate_option(option, {}) for option in options]
+            np.testing.assert_allclose(scores[row], expected)
+            self.assertEqual(options[chosen[row]], options[int(np.argmax(expected))])
+
+    def test_unavailable_options_are_never_chosen(self):
+        """Test greedy and exploring picks respect each organism's actions"""
+        policy = DecisionPolicy(epsilon=0.5, rng=self.rng)
+        traits = GenomeBatch.random(1000, self.rng).traits
+        available = policy.availability([["rest", "explore"]] * 1000)
+
+        chosen, _ = policy.decide(traits, available)
+
+        self.assertTrue(set(chosen.tolist()) <= {0, 1})
+
+    def test_organism_without_policy_options_gets_no_pick(self):
+        """Test a row with no available option is marked -1 instead of option 0"""
+        available = self.policy.availability([["rest"], ["unknown_action"]])
+
+        chosen, _ = self.policy.decide(GenomeBatch.random(2, self.rng).traits, available)
+
+        self.assertEqual(chosen.tolist(), [self.policy.option_index["rest"], -1])
+
+    def test_bandit_learns_rewarded_option(self):
+        """Test batched bandit updates steer greedy choices to the rewarded option"""
+        policy = ContextualBanditPolicy(epsilon=0.0, rng=self.rng)
+        traits = GenomeBatch.random(500, self.rng).traits
+        available = np.ones((500, len(policy.options)), dtype=bool)
+        rest = policy.option_index["rest"]
+
+        for _ in range(50):
+            chosen = self.rng.integers(0, len(policy.options), 500)
+            policy.update(traits, chosen, (chosen == rest).astype(float))
+        chosen, _ = policy.decide(traits, available)
+
+        # Only organisms whose cooperation_tendency is close to 1 may still prefer cooperating
+        self.assertGreater((chosen == rest).mean(), 0.95)
+
+    def test_population_decision_is_one_pass(self):
+        """Test deciding for 10^4 organisms takes milliseconds"""
+        traits = GenomeBatch.random(10000, self.rng).traits
+        available = np.ones((10000, len(self.policy.options)), dtype=bool)
+
+        start = time.perf_counter()
+        self.policy.decide(traits, available)
+
+        self.assertLess(time.perf_counter() - start, 0.1)
+
+    def test_ecosystem_step_uses_policy(self):
+        """Test a policy-driven step records one decision and outcome per organism"""
+        ecosystem = DigitalEcosystem("policy_test", decision_policy=ContextualBanditPolicy(rng=self.rng))
+        for i in range(10):
+            ecosystem.add_organism(DigitalOrganism(f"policy_org_{i}"))
+
+        ecosystem.simulate_time_step()
+
+        for organism in ecosystem.organisms.values():
+            self.assertEqual(len(organism.nervous_system.decision_history), 1)
+            self.assertEqual(organism.nervous_system.option_outcomes[
+                organism.nervous_system.decision_history[0]["chosen"]].reported, 1)
+
+    def test_ecosystem_step_falls_back_when_policy_knows_no_action(self):
+        """Test organisms whose actions are not policy options decide for themselves"""
+        policy = ContextualBanditPolicy(options=("teach",), rng=self.rng)
+        ecosystem = DigitalEcosystem("fallback_test", decision_policy=policy)
+        for i in range(10):
+            ecosystem.add_organism(DigitalOrganism(f"fallback_org_{i}"))
+
+        ecosystem.simulate_time_step()
+
+        for organism in ecosystem.organisms.values():
+            decision = organism.nervous_system.decision_history[0]
+            self.assertIn(decision["chosen"], decision["options"])
+            self.assertNotEqual(decision["chosen"], "teach")
+        self.assertFalse(policy.theta.any())
+
+
+
+class TestMetabolismPool(unittest.TestCase):
+    """Test array-backed metabolisms and population kernels"""
+
+    def setUp(self):
+        """Private pool so slots are predictable"""
+        self.pool = MetabolismPool(capacity=4)
+
+    def test_resources_behave_like_a_dict(self):
+        """Test the resource view supports the dict operations organisms use"""
+        metabolism = DigitalMetabolism(pool=self.pool)
+
+        metabolism.resources["knowledge_points"] += 5.0
+        for resource in metabolism.resources:
+            metabolism.resources[resource] *= 0.5
+
+        self.assertEqual(metabolism.resources.copy(), {
+            "cpu_cycles": 500.0, "memory_units": 250.0, "network_bandwidth": 50.0,
+            "storage_space": 500.0, "knowledge_points": 2.5
+        })
+        self.assertEqual(metabolism.resources.get("missing", 1.0), 1.0)
+
+    def test_view_keeps_its_row(self):
+        """Test a resource view outliving its metabolism never aliases a new one"""
+        resources = DigitalMetabolism(pool=self.pool).resources
+        gc.collect()
+        other = DigitalMetabolism(pool=self.pool)
+
+        resources["cpu_cycles"] = 5.0
+
+        self.assertNotEqual(other.slot, resources._metabolism.slot)
+        self.assertEqual(other.resources["cpu_cycles"], 1000.0)
+
+    def test_population_kernels_match_scalar_path(self):
+        """Test batched consume/regenerate/health agree with per-organism calls"""
+        batch = [DigitalMetabolism(pool=self.pool) for _ in range(10)]
+        scalar = [DigitalMetabolism(pool=MetabolismPool()) for _ in range(10)]
+        operations = ["learn", "communicate", "evolve", "rest", "think"] * 2
+        for metabolism in batch + scalar:
+            metabolism.resources["memory_units"] = 0.05  # Too little for memory-bound operations
+        slots = np.array([m.slot for m in batch])
+
+        affordable = self.pool.consume(slots, operations, amount=1.0)
+        self.pool.regenerate(slots, 2.0)
+        health = self.pool.health(slots)
+
+        expected = [m.consume_resources(op, 1.0) for m, op in zip(scalar, operations)]
+        for metabolism in scalar:
+            metabolism.regenerate_resources(2.0)
+        self.assertEqual(affordable.tolist(), expected)
+        np.testing.assert_allclose(health, [m.get_resource_health() for m in scalar])
+        self.assertEqual([m.resources.copy() for m in batch], [m.resources.copy() for m in scalar])
+
+    def test_slots_are_recycled_and_pool_grows(self):
+        """Test freed rows are reused and the pool grows past its capacity"""
+        metabolisms = [DigitalMetabolism(pool=self.pool) for _ in range(6)]
+        freed = metabolisms.pop().slot
+        gc.collect()
+
+        self.assertEqual(DigitalMetabolism(pool=self.pool).slot, freed)
+        self.assertGreaterEqual(len(self.pool.levels), 6)
+
+
+class TestCompactOrganism(unittest.TestCase):
+    """Test the slotted organism layout and its memory footprint"""
+
+    # Bytes per organism measured with test_memory_per_organism's benchmark on the
+    # layout before compaction (658e80c1, "Back DigitalMetabolism with a shared
+    # population array"): 10k organisms, freshly built and after one live_cycle
+    BASELINE_FRESH_BYTES = 7544
+    BASELINE_STEPPED_BYTES = 10813
+    BENCHMARK_ORGANISMS = int(os.environ.get("HYPERAI_BENCHMARK_ORGANISMS", "10000"))
+
+    def setUp(self):
+        self.addCleanup(set_quiet_mode, daiof.QUIET_MODE)
+        set_quiet_mode(True)
+
+    def test_bookkeeping_is_lazy(self):
+        """Test organisms have no __dict__ and build containers on first use"""
+        organism = DigitalOrganism("compact_org")
+
+        self.assertFalse(hasattr(organism, "__dict__"))
+        self.assertIsNone(organism._offspring)
+        self.assertIsNone(organism.nervous_system._memory)
+        self.assertEqual(organism.get_status_report()["offspring"], 0)
+        organism.offspring.append("child")
+        self.assertEqual(organism._offspring, ["child"])
+
+    def test_social_edges_hold_ids(self):
+        """Test edges keep names and genome hashes, resolving partners through the intern table"""
+        first, second = DigitalOrganism("edge_a"), DigitalOrganism("edge_b")
+        first.connect_to_organism(second)
+        edge = first.social_connections["edge_b"]
+
+        self.assertEqual(edge["organism_id"], "edge_b")
+        self.assertNotIn("organism", edge)
+        self.assertTrue(first._partner_genome(edge).shares_traits_with(second.genome))
+
+        second.genome = None
+        del second
+        gc.collect()
+        self.assertIs(first._partner_genome(edge), first.genome)
+
+    def test_shared_logger(self):
+        """Test organisms log through one shared, name-tagged logger"""
+        first, second = DigitalOrganism("log_a"), DigitalOrganism("log_b")
+
+        self.assertIs(first.logger.logger, second.logger.logger)
+        self.assertEqual(second.logger.extra, {"organism": "log_b"})
+
+    def test_memory_per_organism(self):
+        """Test the layout cuts per-organism memory 5x, and still over half once organisms run"""
+        count = self.BENCHMARK_ORGANISMS
+        # The process-wide event ring is bounded and shared, not per-organism state
+        self.addCleanup(setattr, daiof, "EVENTS", daiof.EVENTS)
+        daiof.EVENTS = EventStream(maxlen=0)
+        with redirect_stdout(io.StringIO()):
+            DigitalOrganism("warm_up").live_cycle()
+            tracemalloc.start()
+            try:
+                organisms = [DigitalOrganism(f"org_{i}") for i in range(count)]
+                fresh, _ = tracemalloc.get_traced_memory()
+                for organism in organisms:
+                    organism.live_cycle()
+                stepped, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        self.assertLess(fresh / count, self.BASELINE_FRESH_BYTES / 5)
+        # A step's perception and decision records are the same in both layouts
+        self.assertLess(stepped / count, self.BASELINE_STEPPED_BYTES / 2.5)
+
+
+class TestQuietMode(unittest.TestCase):
+    """Test once-per-process acknowledgements and the sampled event stream"""
+
+    def setUp(self):
+        """Fresh acknowledgement record and event stream"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        events = EventStream()
+        for name, value in (("_acknowledged", set()), ("EVENTS", events)):
+            self.addCleanup(setattr, daiof, name, getattr(daiof, name))
+            setattr(daiof, name, value)
+        self.addCleanup(set_quiet_mode, daiof.QUIET_MODE)
+
+    def _genome_output(self, count):
+        out = io.StringIO()
+        with redirect_stdout(out):
+            for _ in range(count):
+                DigitalGenome().mutate(mutation_rate=1.0)
+        return out.getvalue()
+
+    def test_acknowledgement_printed_once_per_process(self):
+        """Test only the first genome prints the creator banner"""
+        output = self._genome_output(5)
+
+        self.assertEqual(output.count("Digital Genome initialized"), 1)
+        self.assertEqual(daiof.EVENTS.counts["acknowledgement"], 1)
+        self.assertEqual(daiof.EVENTS.counts["mutation"], 5)
+
+    def test_quiet_mode_is_silent(self):
+        """Test quiet mode prints nothing and logs nothing below WARNING"""
+        set_quiet_mode(True)
+
+        self.assertEqual(self._genome_output(3), "")
+        organism = DigitalOrganism("quiet_org")
+        self.assertFalse(organism.logger.isEnabledFor(logging.INFO))
+        for _ in range(3):
+            organism.live_cycle()
+        self.assertEqual(sum(daiof.EVENTS.counts[e] for e in ("action", "resource_shortage")), 3)
+
+    def test_events_are_sampled_and_bounded(self):
+        """Test every event is counted but only the sampled ones are kept"""
+        path = os.path.join(self.tmp.name, "events.jsonl")
+        events = EventStream(path, sample_every=10, maxlen=5)
+
+        for i in range(100):
+            events.emit("action", organism="org", step=i)
+        events.close()
+
+        with open(path, encoding="utf-8") as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual(events.counts["action"], 100)
+        self.assertEqual([r["step"] for r in records], list(range(0, 100, 10)))
+        self.assertEqual(len(events.recent), 5)
+
+    def test_event_log_rotates(self):
+        """Test the JSONL sink is rotated at max_bytes"""
+        path = os.path.join(self.tmp.name, "events.jsonl")
+        events = EventStream(path, max_bytes=1024)
+
+        for i in range(100):
+            events.emit("action", organism="org", step=i)
+        events.close()
+
+        self.assertTrue(os.path.exists(path + ".1"))
+        self.assertLess(os.path.getsize(path), 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Tests for Real-Time Autonomous Task Generator
+Powered by HYPERAI Framework
+Creator: Nguyễn Đức Cường (alpha_prime_omega)
+Original Creation: October 30, 2025
+"""
+
+import sys
+import os
+import json
+import time
+import asyncio
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add parent directory to path
+repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, repo_root)
+sys.path.insert(0, os.path.join(repo_root, '.github', 'scripts'))
+
+# Import the generator
+try:
+    import realtime_task_generator
+except ImportError:
+    # Try alternative import path
+    import importlib.util
+    spec = importlib.util.spec_from_file_location(
+        "realtime_task_generator",
+        os.path.join(repo_root, '.github', 'scripts', 'realtime_task_generator.py')
+    )
+    realtime_task_generator = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(realtime_task_generator)
+
+RealtimeTaskGenerator = realtime_task_generator.RealtimeTaskGenerator
+GenerationRule = realtime_task_generator.GenerationRule
+Task = realtime_task_generator.Task
+TaskEventLog = realtime_task_generator.TaskEventLog
+
+
+class TestRuleEvaluation(unittest.TestCase):
+    """Test parallel rule evaluation and fingerprint caching"""
+
+    def setUp(self):
+        """Set up generator on an empty temporary repository"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name)
+        self.generator = RealtimeTaskGenerator(repo_path=self.repo)
+        self.calls = {}
+
+    def tearDown(self):
+        """Clean up temporary repository"""
+        self.tmp.cleanup()
+
+    def _rule(self, name, delay=0.0, fingerprint=None, **kwargs):
+        """Build a rule that records how often it ran"""
+        def check():
+            self.calls[name] = self.calls.get(name, 0) + 1
+            time.sleep(delay)
+            return [Task(title=name, description=name, action="true")]
+        check.__name__ = name
+        return GenerationRule(check, fingerprint, **kwargs)
+
+    def test_rules_run_concurrently(self):
+        """Test slow rules overlap instead of running in sequence"""
+        self.generator.generation_rules = [
+            self._rule(f"slow_{i}", delay=0.2) for i in range(4)
+        ]
+
+        start = time.monotonic()
+        tasks = self.generator.generate_tasks()
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([t.title for t in tasks], [f"slow_{i}" for i in range(4)])
+        self.assertLess(elapsed, 0.6)
+
+    def test_unchanged_fingerprint_reuses_result(self):
+        """Test a rule is not re-evaluated while its inputs are unchanged"""
+        state = {"value": 1}
+        self.generator.generation_rules = [
+            self._rule("cached", fingerprint=lambda: state["value"])
+        ]
+
+        first = self.generator.generate_tasks()
+        self.generator.task_queue = []
+        second = self.generator.generate_tasks()
+
+        self.assertEqual(self.calls["cached"], 1)
+        self.assertEqual([t.title for t in second], ["cached"])
+        self.assertIsNot(first[0], second[0])
+
+        state["value"] = 2
+        self.generator.task_queue = []
+        self.generator.generate_tasks()
+        self.assertEqual(self.calls["cached"], 2)
+
+    def test_edge_triggered_rule_emits_nothing_on_cache_hit(self):
+        """Test replay=False rules stay silent when inputs are unchanged"""
+        self.generator.generation_rules = [
+            self._rule("edge", fingerprint=lambda: "same", replay=False)
+        ]
+
+        self.assertEqual(len(self.generator.generate_tasks()), 1)
+        self.assertEqual(self.generator.generate_tasks(), [])
+        self.assertEqual(self.calls["edge"], 1)
+
+    def test_rule_timeout_is_skipped(self):
+        """Test a rule exceeding its timeout does not block the cycle"""
+        self.generator.generation_rules = [
+            self._rule("hung", delay=0.5, timeout=0.05),
+            self._rule("fast"),
+        ]
+
+        start = time.monotonic()
+        tasks = self.generator.generate_tasks()
+
+        self.assertLess(time.monotonic() - start, 0.4)
+        self.assertEqual([t.title for t in tasks], ["fast"])
+        self.assertEqual(self.generator.generation_rules[0].timeouts, 1)
+
+    def test_idle_repository_cycle_uses_cache(self):
+        """Test the built-in rules are all cache hits on an idle repository"""
+        # Warm up; the first cycle creates logs/ in the repository root
+        for _ in range(2):
+            self.generator.generate_tasks()
+            self.generator.task_queue = []
+        runs = [rule.runs for rule in self.generator.generation_rules]
+
+        self.generator.generate_tasks()
+
+        self.assertEqual([rule.runs for rule in self.generator.generation_rules], runs)
+
+    def test_python_file_change_invalidates_code_quality(self):
+        """Test editing a Python file re-runs the code quality rule"""
+        (self.repo / 'module.py').write_text("x = 1\n")
+        self.generator.generate_tasks()
+
+        (self.repo / 'module.py').write_text("x = 2  # changed\n")
+        tasks = self.generator.generate_tasks()
+
+        self.assertIn("Format module.py", [t.title for t in tasks])
+
+
+class TestWorkerPool(unittest.TestCase):
+    """Test concurrent task execution"""
+
+    def setUp(self):
+        """Set up generator on an empty temporary repository"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name)
+        self.generator = RealtimeTaskGenerator(repo_path=self.repo)
+
+    def tearDown(self):
+        """Clean up temporary repository"""
+        self.tmp.cleanup()
+
+    def _queue(self, count, action="sleep 0.3", resources=None, estimated_time=10):
+        """Queue identical tasks"""
+        for i in range(count):
+            self.generator.task_queue.append(Task(
+                title=f"task {i}",
+                description="test",
+                action=action,
+                estimated_time=estimated_time,
+                resources=resources
+            ))
+
+    def test_independent_tasks_run_in_parallel(self):
+        """Test throughput scales with the number of workers"""
+        self._queue(4)
+
+        start = time.monotonic()
+        started = asyncio.run(self.generator.drain_queue_async(workers=4))
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(started, 4)
+        self.assertEqual(self.generator.total_tasks_completed, 4)
+        self.assertLess(elapsed, 1.0)
+
+    def test_worker_cap_holds_across_drains(self):
+        """Test tasks outliving a drain still count against the worker limit"""
+        self._queue(6, action="sleep 1")
+
+        async def scenario():
+            loop = asyncio.get_running_loop()
+            peak = 0
+            for _ in range(3):
+                await self.generator.drain_queue_async(workers=2, until=loop.time() + 0.1)
+                peak = max(peak, len(self.generator.running_tasks))
+            await self.generator.drain_queue_async(workers=2)
+            return peak
+
+        peak = asyncio.run(scenario())
+
+        self.assertEqual(peak, 2)
+        self.assertEqual(self.generator.total_tasks_completed, 6)
+
+    def test_conflicting_tasks_are_serialized(self):
+        """Test tasks sharing a resource never overlap"""
+        self._queue(3, action="sleep 0.2", resources=["git"])
+
+        start = time.monotonic()
+        asyncio.run(self.generator.drain_queue_async(workers=3))
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.6)
+        self.assertEqual(self.generator.total_tasks_completed, 3)
+
+    def test_exclusive_task_conflicts_with_everything(self):
+        """Test '*' resources block any other task"""
+        exclusive = Task("commit", "test", "true", resources=['*'])
+        other = Task("format", "test", "true", resources=['module.py'])
+        free = Task("check", "test", "true")
+
+        self.assertTrue(exclusive.conflicts_with(free))
+        self.assertTrue(other.conflicts_with(exclusive))
+        self.assertFalse(other.conflicts_with(free))
+
+    def test_task_timeout_is_honored(self):
+        """Test a task exceeding estimated_time is killed and failed"""
+        self._queue(1, action="sleep 5", estimated_time=0.2)
+
+        start = time.monotonic()
+        asyncio.run(self.generator.drain_queue_async(workers=2))
+
+        self.assertLess(time.monotonic() - start, 2.0)
+        self.assertEqual(self.generator.failed_tasks[0].error, "Timeout")
+
+    def test_cancelled_task_kills_process_group(self):
+        """Test cancelling a running task kills its whole pipeline and records the failure"""
+        marker = self.repo / "marker"
+        task = Task("cancelled", "test", f"(sleep 0.5; touch {marker}) & wait")
+
+        async def scenario():
+            running = asyncio.ensure_future(self.generator.execute_task_async(task))
+            await asyncio.sleep(0.2)
+            running.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await running
+
+        asyncio.run(scenario())
+        time.sleep(0.6)
+
+        self.assertFalse(marker.exists())
+        self.assertEqual(self.generator.running_tasks, {})
+        self.assertEqual(self.generator.failed_tasks, [task])
+        self.assertEqual(task.error, "Cancelled (CancelledError)")
+
+    def test_completions_stream_into_log(self):
+        """Test each completion is recorded in the task log"""
+        self._queue(2, action="echo done")
+
+        asyncio.run(self.generator.drain_queue_async(workers=2))
+
+        self.assertTrue(list((self.repo / 'logs').glob('tasks_*')))
+        self.assertEqual(self.generator.running_tasks, {})
+        self.assertEqual(self.generator.completed_tasks[0].result.strip(), "done")
+
+
+class TestTaskEventLog(unittest.TestCase):
+    """Test the append-only task event log"""
+
+    def setUp(self):
+        """Set up generator on an empty temporary repository"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.repo = Path(self.tmp.name)
+        self.generator = RealtimeTaskGenerator(repo_path=self.repo)
+        self.generator.generation_rules = [GenerationRule(self._make_tasks)]
+
+    def tearDown(self):
+        """Clean up temporary repository"""
+        self.generator.event_log.close()
+        self.tmp.cleanup()
+
+    def _make_tasks(self):
+        """Rule producing one passing and one failing task"""
+        return [
+            Task("pass", "test", "true", priority=0),
+            Task("fail", "test", "false", priority=1),
+        ]
+
+    def _run_one_cycle(self):
+        """Generate, enqueue and execute the queue"""
+        self.generator.task_queue.extend(self.generator.generate_tasks())
+        while self.generator.task_queue:
+            self.generator.execute_task(self.generator.task_queue.pop(0))
+        self.generator.save_task_log()
+
+    def _read_events(self):
+        """Parse the current event log"""
+        with open(self.generator.event_log.log_file) as f:
+            return [json.loads(line) for line in f]
+
+    def test_events_are_appended(self):
+        """Test every state change is one appended line"""
+        self._run_one_cycle()
+
+        events = [e['event'] for e in self._read_events()]
+        self.assertEqual(events, [
+            'generated', 'generated',
+            'started', 'completed',
+            'started', 'failed',
+        ])
+
+    def test_idle_cycle_writes_nothing(self):
+        """Test saving the log without new events does not touch the files"""
+        self.generator.event_log.snapshot_every = 1000
+        self._run_one_cycle()
+        log_file = self.generator.event_log.log_file
+        snapshot_file = TaskEventLog.snapshot_path(log_file)
+        size = log_file.stat().st_size
+        snapshot_mtime = snapshot_file.stat().st_mtime_ns
+
+        for _ in range(5):
+            self.generator.save_task_log()
+
+        self.assertEqual(log_file.stat().st_size, size)
+        self.assertEqual(snapshot_file.stat().st_mtime_ns, snapshot_mtime)
+
+    def test_summary_derived_from_events(self):
+        """Test the streaming reader reproduces the in-memory summary"""
+        self._run_one_cycle()
+        self.generator.task_queue.append(Task("queued", "test", "true"))
+        self.generator.event_log.append('generated', self.generator.task_queue[0])
+
+        summary = TaskEventLog.read_summary(self.generator.event_log.log_file)
+
+        self.assertEqual(summary['total_generated'], 3)
+        self.assertEqual(summary['total_completed'], 1)
+        self.assertEqual(summary['total_failed'], 1)
+        self.assertEqual([t['title'] for t in summary['pending']], ["queued"])
+        self.assertEqual(summary['failed'][0]['status'], 'failed')
+
+    def test_snapshot_replays_only_later_events(self):
+        """Test the reader resumes from the snapshot offset"""
+        self._run_one_cycle()
+        self.generator.save_task_log(force=True)
+        self._run_one_cycle()
+
+        log_file = self.generator.event_log.log_file
+        snapshot = json.loads(TaskEventLog.snapshot_path(log_file).read_text())
+        summary = TaskEventLog.read_summary(log_file)
+
+        self.assertGreater(snapshot['offset'], 0)
+        self.assertEqual(snapshot['total_completed'], 1)
+        self.assertEqual(summary['total_completed'], 2)
+        self.assertEqual(summary['total_failed'], 2)
+        self.assertEqual(len(summary['completed']), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Tests for Sovereign Runner Daemon
+Powered by HYPERAI Framework
+Creator: Nguyễn Đức Cường (alpha_prime_omega)
+Original Creation: October 30, 2025
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+# Keep the daemon's logs and working directory out of the real workspace
+_sandbox = tempfile.mkdtemp(prefix="sovereign_")
+os.environ.setdefault("SOVEREIGN_BASE_DIR", _sandbox)
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sovereign_runner
+from sovereign_runner import SovereignRunner
+
+
+class TestBrainScheduler(unittest.TestCase):
+    """Test the heap-based brain scheduler"""
+
+    def setUp(self):
+        """Create a scratch directory for brain scripts"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scripts = Path(self.tmp.name)
+
+    def tearDown(self):
+        """Clean up brain scripts"""
+        self.tmp.cleanup()
+
+    def _brain(self, name, code, interval, **options):
+        """Write a brain script and return its config"""
+        path = self.scripts / f"{name}.py"
+        path.write_text(code)
+        return dict({"name": name, "path": path, "interval": interval, "last_run": 0}, **options)
+
+    def _run_for(self, runner, seconds):
+        """Run the scheduler for a fixed wall-clock time"""
+        async def scenario():
+            asyncio.get_running_loop().call_later(seconds, runner.stop)
+            await runner.run_async()
+        asyncio.run(scenario())
+        return runner.get_metrics()
+
+    def test_slow_brain_does_not_delay_others(self):
+        """Test brains run concurrently instead of in sequence"""
+        runner = SovereignRunner(brains=[
+            self._brain("slow", "import time; time.sleep(1.5)", interval=60),
+            self._brain("fast", "pass", interval=0.3),
+        ], python=sys.executable)
+
+        metrics = self._run_for(runner, 1.2)
+
+        self.assertGreaterEqual(metrics["fast"]["runs"], 3)
+        self.assertEqual(metrics["slow"]["runs"], 1)
+        self.assertLess(metrics["fast"]["max_latency"], 0.5)
+
+    def test_overlap_skip_counts_overruns(self):
+        """Test slots firing during a run are skipped and counted"""
+        runner = SovereignRunner(brains=[
+            self._brain("busy", "import time; time.sleep(0.8)", interval=0.2),
+        ], python=sys.executable)
+
+        metrics = self._run_for(runner, 0.7)
+
+        self.assertEqual(metrics["busy"]["runs"], 1)
+        self.assertGreater(metrics["busy"]["overruns"], 0)
+        self.assertEqual(metrics["busy"]["skipped"], metrics["busy"]["overruns"])
+
+    def test_overlap_queue_runs_once_after_busy_run(self):
+        """Test the queue policy keeps at most one pending run"""
+        runner = SovereignRunner(brains=[
+            self._brain("queued", "import time; time.sleep(0.5)", interval=0.1,
+                        overlap=sovereign_runner.OVERLAP_QUEUE),
+        ], python=sys.executable)
+
+        metrics = self._run_for(runner, 0.8)
+
+        # The first run plus exactly one queued run after it
+        self.assertEqual(metrics["queued"]["runs"], 2)
+        self.assertGreater(metrics["queued"]["skipped"], 0)
+
+    def test_timeout_kills_brain(self):
+        """Test a brain exceeding its timeout is killed"""
+        runner = SovereignRunner(brains=[
+            self._brain("hung", "import time; time.sleep(10)", interval=60, timeout=0.3),
+        ], python=sys.executable)
+
+        metrics = self._run_for(runner, 0.1)
+
+        self.assertEqual(metrics["hung"]["timeouts"], 1)
+        self.assertLess(metrics["hung"]["max_duration"], 2.0)
+
+    def test_cancelled_run_kills_brain(self):
+        """Test cancelling a run kills its brain instead of orphaning it"""
+        marker = self.scripts / "cancelled_finished"
+        brain = self._brain("cancelled", f"import time; time.sleep(1); open({str(marker)!r}, 'w')",
+                            interval=60)
+        runner = SovereignRunner(brains=[brain], python=sys.executable)
+
+        async def scenario():
+            task = asyncio.ensure_future(runner.execute_brain_async(brain))
+            await asyncio.sleep(0.3)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        asyncio.run(scenario())
+        time.sleep(1.5)
+
+        self.assertFalse(marker.exists())
+
+    def test_successful_brain_writes_pulse_log(self):
+        """Test brain output is recorded in its pulse log"""
+        runner = SovereignRunner(brains=[
+            self._brain("pulse", "print('alive')", interval=60),
+        ], python=sys.executable)
+
+        metrics = self._run_for(runner, 0.1)
+
+        self.assertEqual(metrics["pulse"]["successes"], 1)
+        pulse_log = sovereign_runner.LOG_DIR / "pulse_pulse.log"
+        self.assertIn("alive", pulse_log.read_text())
+
+
+@unittest.skipUnless(hasattr(os, "fork"), "warm workers need os.fork")
+class TestWarmWorkers(unittest.TestCase):
+    """Test persistent pre-imported brain workers"""
+
+    def setUp(self):
+        """Create a scratch directory for brain scripts"""
+        self.tmp = tempfile.TemporaryDirectory()
+        self.scripts = Path(self.tmp.name)
+
+    def tearDown(self):
+        """Clean up brain scripts"""
+        self.tmp.cleanup()
+
+    def _brain(self, name, code, **options):
+        """Write a brain script and return its config"""
+        path = self.scripts / f"{name}.py"
+        path.write_text(code)
+        return dict({"name": name, "path": path, "interval": 60, "last_run": 0}, **options)
+
+    def _run_brains(self, runner, *brains):
+        """Run brains one after another through the runner"""
+        async def scenario():
+            for brain in brains:
+                await runner.execute_brain_async(brain)
+            pids = [w.proc.pid for w in runner._idle_workers]
+            await runner.close_workers()
+            return pids
+        return asyncio.run(scenario())
+
+    def test_worker_is_reused_and_runs_are_isolated(self):
+        """Test one worker serves several runs without sharing state"""
+        runner = SovereignRunner(brains=[], python=sys.executable, warm=True)
+        code = (
+            "import sys\n"
+            "print('seen' if hasattr(sys, '_brain_marker') else 'fresh')\n"
+            "sys._brain_marker = True\n"
+        )
+        first = self._brain("first", code)
+        second = self._brain("second", code)
+
+        worker_pids = self._run_brains(runner, first, second)
+
+        self.assertEqual(len(worker_pids), 1)
+        self.assertEqual(runner.metrics["first"].successes, 1)
+        self.assertEqual(runner.metrics["second"].successes, 1)
+        pulse = (sovereign_runner.LOG_DIR / "second_pulse.log").read_text()
+        self.assertIn("fresh", pulse)
+        self.assertNotIn("seen", pulse)
+
+    def test_warm_timeout_kills_run_and_discards_worker(self):
+        """Test timeouts kill the forked run and the next run gets a fresh worker"""
+        runner = SovereignRunner(brains=[], python=sys.executable, warm=True)
+        hung = self._brain("warm_hung", "import time; time.sleep(10)", timeout=0.5)
+        after = self._brain("warm_after", "print('ok')")
+
+        worker_pids = self._run_brains(runner, hung, after)
+
+        self.assertEqual(runner.metrics["warm_hung"].timeouts, 1)
+        self.assertLess(runner.metrics["warm_hung"].max_duration, 3.0)
+        self.assertEqual(runner.metrics["warm_after"].successes, 1)
+        self.assertEqual(len(worker_pids), 1)
+
+    def test_early_timeout_does_not_leak_into_next_run(self):
+        """Test a brain timing out before its pid arrives is killed and its output discarded"""
+        runner = SovereignRunner(brains=[], python=sys.executable, warm=True)
+        marker = self.scripts / "hung_finished"
+        hung = self._brain("warm_early", f"import time; time.sleep(1); open({str(marker)!r}, 'w'); print('HUNG')",
+                           timeout=0.05)
+        after = self._brain("warm_next", "print('after')")
+
+        self._run_brains(runner, hung, after)
+        time.sleep(1.5)
+
+        self.assertEqual(runner.metrics["warm_early"].timeouts, 1)
+        self.assertLess(runner.metrics["warm_next"].max_duration, 1.0)
+        pulse = (sovereign_runner.LOG_DIR / "warm_next_pulse.log").read_text()
+        self.assertIn("after", pulse)
+        self.assertNotIn("HUNG", pulse)
+        self.assertFalse(marker.exists())
+
+    def test_failing_brain_reports_exit_code(self):
+        """Test non-zero exits and tracebacks are reported as failures"""
+        runner = SovereignRunner(brains=[], python=sys.executable, warm=True)
+        failing = self._brain("warm_fail", "raise RuntimeError('boom')")
+
+        self._run_brains(runner, failing)
+
+        self.assertEqual(runner.metrics["warm_fail"].failures, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
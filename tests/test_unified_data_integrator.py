@@ -0,0 +1,478 @@
+#!/usr/bin/env python3
+"""
+Tests for Unified Data Integrator
+Powered by HYPERAI Framework
+Creator: Nguyễn Đức Cường (alpha_prime_omega)
+Original Creation: October 30, 2025
+"""
+
+import sys
+import os
+import json
+import time
+import sqlite3
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime
+from unittest import mock
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import unified_data_integrator
+from unified_data_integrator import (
+    UnifiedDataIntegrator, UnifiedDataPoint, DataSource, ColumnarDataStore, SQLiteDataStore,
+    PRIVACY_LEVELS,
+    GitHubClient, GitHubRateLimitError
+)
+
+
+def offline(test):
+    """Run a test case without GITHUB_TOKEN so GitHub sources use mock data"""
+    patcher = mock.patch.dict(os.environ)
+    patcher.start()
+    os.environ.pop("GITHUB_TOKEN", None)
+    test.addCleanup(patcher.stop)
+
+
+def make_point(i, privacy_level="internal", data_type="bookmark"):
+    """Build a small data point"""
+    return UnifiedDataPoint(
+        source="Test Source",
+        source_type="chrome",
+        timestamp=datetime(2025, 10, 30, 12, 0, i % 60),
+        data_type=data_type,
+        content={"title": f"item {i}", "note": "dữ liệu"},
+        metadata={"seq": i},
+        compliance_tags=["personal_data"],
+        privacy_level=privacy_level
+    )
+
+
+class TestColumnarDataStore(unittest.TestCase):
+    """Test the columnar unified data store"""
+
+    def test_round_trip(self):
+        """Test a stored point materializes back unchanged"""
+        store = ColumnarDataStore()
+        point = make_point(7)
+
+        store.append(point)
+
+        self.assertEqual(len(store), 1)
+        self.assertEqual(store.point(0), point)
+        self.assertEqual(list(store), [point])
+
+    def test_categories_are_interned(self):
+        """Test repeated categories are stored once"""
+        store = ColumnarDataStore()
+        store.extend(make_point(i) for i in range(1000))
+
+        self.assertEqual(store.source.categories, ["Test Source"])
+        self.assertEqual(store.data_type.categories, ["bookmark"])
+        self.assertEqual(store.privacy_level.categories, PRIVACY_LEVELS)
+
+    def test_breakdown_uses_counters(self):
+        """Test breakdown counts match the appended points"""
+        store = ColumnarDataStore()
+        store.extend(make_point(i) for i in range(5))
+        store.extend(make_point(i, data_type="setting") for i in range(3))
+
+        self.assertEqual(store.breakdown(), {"chrome_bookmark": 5, "chrome_setting": 3})
+
+    def test_privacy_selection_over_many_points(self):
+        """Test privacy filtering is a mask over the privacy column"""
+        store = ColumnarDataStore()
+        store.extend(make_point(i, PRIVACY_LEVELS[i % 4]) for i in range(100000))
+
+        start = time.perf_counter()
+        rows = store.select_privacy("internal")
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(rows), 50000)
+        self.assertEqual(store.privacy_level[int(rows[1])], "internal")
+        self.assertLess(elapsed, 0.05)
+        # The view over the codes is released, so the store still grows
+        store.append(make_point(0))
+
+
+class TestUnifiedDataIntegrator(unittest.TestCase):
+    """Test reports and exports over the columnar store"""
+
+    def setUp(self):
+        """Create an integrator with mock data synced"""
+        offline(self)
+        self.integrator = UnifiedDataIntegrator()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove export files"""
+        self.tmp.cleanup()
+
+    def test_report_breakdown(self):
+        """Test the report breakdown reflects synced points"""
+        self.integrator.sync_data_source("chrome_bookmarks")
+
+        report = self.integrator.get_unified_data_report()
+
+        self.assertEqual(report["total_data_points"], 3)
+        self.assertEqual(report["data_breakdown"], {"chrome_bookmark": 3})
+
+    def test_export_applies_privacy_filter(self):
+        """Test exported points respect the privacy filter"""
+        self.integrator.unified_data.extend(
+            make_point(i, level) for i, level in enumerate(PRIVACY_LEVELS)
+        )
+        path = os.path.join(self.tmp.name, "export.json")
+
+        self.assertTrue(self.integrator.export_compliant_data(path, "internal"))
+
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data["metadata"]["data_points"], 2)
+        self.assertEqual([p["privacy_level"] for p in data["data_points"]], ["public", "internal"])
+        self.assertEqual(data["data_points"][0]["content"]["note"], "dữ liệu")
+
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Test change tokens and record fingerprints"""
+
+    def setUp(self):
+        """Create an integrator with a VSCode settings file source"""
+        offline(self)
+        self.integrator = UnifiedDataIntegrator()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.settings = os.path.join(self.tmp.name, "settings.json")
+        self._write_settings({"editor.fontSize": 14, "git.enabled": True})
+        self.integrator.data_sources["vscode_settings"] = DataSource(
+            name="VSCode Workspace Settings", type="vscode", path=self.settings
+        )
+
+    def tearDown(self):
+        """Remove the settings file"""
+        self.tmp.cleanup()
+
+    def _write_settings(self, settings):
+        with open(self.settings, 'w') as f:
+            json.dump(settings, f)
+
+    def test_unchanged_source_is_not_extracted(self):
+        """Test a resync with the same change token does no work"""
+        calls = []
+        extract = self.integrator._extract_chrome_data
+        self.integrator._extract_chrome_data = lambda source: calls.append(1) or extract(source)
+
+        self.assertTrue(self.integrator.sync_data_source("chrome_bookmarks"))
+        self.assertTrue(self.integrator.sync_data_source("chrome_bookmarks"))
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(self.integrator.unified_data), 3)
+
+    def test_only_changed_records_are_emitted(self):
+        """Test editing one setting appends just that setting"""
+        self.integrator.sync_data_source("vscode_settings")
+        first_hash = self.integrator.data_sources["vscode_settings"].data_hash
+
+        self._write_settings({"editor.fontSize": 16, "git.enabled": True})
+        os.utime(self.settings, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+        self.integrator.sync_data_source("vscode_settings")
+
+        values = [p.content["value"] for p in self.integrator.unified_data]
+        self.assertEqual(values, ["14", "True", "16"])
+        self.assertNotEqual(self.integrator.data_sources["vscode_settings"].data_hash, first_hash)
+        self.assertEqual(self.integrator.audit_log[-1]["unchanged_points"], 1)
+
+    def test_touched_file_with_same_records_adds_nothing(self):
+        """Test a new change token with identical records is deduplicated"""
+        self.integrator.sync_data_source("vscode_settings")
+        os.utime(self.settings, ns=(time.time_ns() + 10**9, time.time_ns() + 10**9))
+
+        self.integrator.sync_data_source("vscode_settings")
+
+        self.assertEqual(len(self.integrator.unified_data), 2)
+
+    def test_failed_stage_does_not_mark_records_stored(self):
+        """Test records dropped by a failing stage are stored by the next sync"""
+        with mock.patch.object(self.integrator, "_encrypt_data_point", side_effect=RuntimeError("boom")):
+            self.assertFalse(self.integrator.sync_data_source("vscode_settings"))
+
+        self.assertTrue(self.integrator.sync_data_source("vscode_settings"))
+
+        self.assertEqual(len(self.integrator.unified_data), 2)
+
+
+
+class TestSQLiteDataStore(unittest.TestCase):
+    """Test the persistent SQLite data store"""
+
+    def setUp(self):
+        """Create a temporary database path"""
+        offline(self)
+        self.tmp = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp.name, "unified.db")
+
+    def tearDown(self):
+        """Remove the database"""
+        self.tmp.cleanup()
+
+    def _integrator(self):
+        integrator = UnifiedDataIntegrator(db_path=self.db_path)
+        self.addCleanup(integrator.close)
+        return integrator
+
+    def test_round_trip(self):
+        """Test a stored point reads back unchanged"""
+        store = SQLiteDataStore(self.db_path)
+        self.addCleanup(store.close)
+        point = make_point(7)
+
+        store.append(point)
+
+        self.assertEqual(list(store), [point])
+        self.assertEqual(store.breakdown(), {"chrome_bookmark": 1})
+
+    def test_inserts_are_batched(self):
+        """Test points reach the database in batches"""
+        store = SQLiteDataStore(self.db_path, batch_size=10)
+        self.addCleanup(store.close)
+        store.extend(make_point(i) for i in range(15))
+
+        with sqlite3.connect(self.db_path) as db:
+            self.assertEqual(db.execute("SELECT COUNT(*) FROM data_points").fetchone()[0], 10)
+        self.assertEqual(len(store), 15)
+
+    def test_data_survives_restart(self):
+        """Test points, audits and fingerprints persist across integrators"""
+        first = self._integrator()
+        first.sync_data_source("chrome_bookmarks")
+        first.close()
+
+        second = self._integrator()
+        second.sync_data_source("chrome_bookmarks")
+        report = second.get_unified_data_report()
+
+        self.assertEqual(report["total_data_points"], 3)
+        self.assertEqual(report["audit_summary"]["total_audits"], 2)
+        self.assertEqual(second.audit_log[-1]["unchanged_points"], 3)
+
+    def test_unknown_privacy_level_matches_columnar_store(self):
+        """Test both backends keep unknown levels and never export them"""
+        sqlite_store = SQLiteDataStore(self.db_path)
+        self.addCleanup(sqlite_store.close)
+        for store in (ColumnarDataStore(), sqlite_store):
+            store.extend([make_point(1, "secret"), make_point(2, "public")])
+
+            self.assertEqual([p.privacy_level for p in store], ["secret", "public"])
+            self.assertEqual(store.count_privacy("restricted"), 1)
+            self.assertEqual([r["privacy_level"] for r in store.iter_export_records("restricted")], ["public"])
+
+    def test_in_memory_audit_log_is_bounded(self):
+        """Test the integrator keeps recent audits while the store counts all"""
+        integrator = self._integrator()
+        for i in range(unified_data_integrator.AUDIT_LOG_LIMIT + 10):
+            integrator._record_audit({"action": "test", "seq": i})
+
+        self.assertEqual(len(integrator.audit_log), unified_data_integrator.AUDIT_LOG_LIMIT)
+        self.assertEqual(integrator.audit_log[-1]["seq"], unified_data_integrator.AUDIT_LOG_LIMIT + 9)
+        self.assertEqual(integrator.unified_data.audit_count(), unified_data_integrator.AUDIT_LOG_LIMIT + 10)
+
+    def test_export_filters_in_sql(self):
+        """Test the privacy filter is applied by the query"""
+        integrator = self._integrator()
+        integrator.unified_data.extend(
+            make_point(i, PRIVACY_LEVELS[i % 4]) for i in range(2000)
+        )
+        path = os.path.join(self.tmp.name, "export.json")
+
+        self.assertTrue(integrator.export_compliant_data(path, "internal"))
+
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        self.assertEqual(data["metadata"]["data_points"], 1000)
+        self.assertEqual(len(data["data_points"]), 1000)
+        self.assertEqual({p["privacy_level"] for p in data["data_points"]}, {"public", "internal"})
+
+
+class TestSyncAll(unittest.TestCase):
+    """Test the concurrent multi-source sync pipeline"""
+
+    def setUp(self):
+        """Create an integrator whose extractors are slow"""
+        offline(self)
+        self.integrator = UnifiedDataIntegrator()
+        for extractor in ("_extract_chrome_data", "_extract_github_data"):
+            self._slow_down(extractor)
+
+    def _slow_down(self, name):
+        extract = getattr(self.integrator, name)
+
+        def slow(source):
+            time.sleep(0.3)
+            return extract(source)
+        setattr(self.integrator, name, slow)
+
+    def test_sources_sync_concurrently(self):
+        """Test total time is the slowest source, not the sum"""
+        start = time.perf_counter()
+        results = self.integrator.sync_all()
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results, {"chrome_bookmarks": True, "github_extension": True})
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(self.integrator.get_unified_data_report()["total_data_points"], 6)
+
+    def test_streamed_hash_matches_sequential_sync(self):
+        """Test the incremental hash is independent of concurrency"""
+        self.integrator.sync_all()
+        concurrent_hash = self.integrator.data_sources["chrome_bookmarks"].data_hash
+
+        sequential = UnifiedDataIntegrator()
+        sequential.sync_data_source("chrome_bookmarks")
+
+        self.assertEqual(sequential.data_sources["chrome_bookmarks"].data_hash, concurrent_hash)
+
+    def test_workers_share_one_github_client(self):
+        """Test concurrent first use builds a single client"""
+        real_client = unified_data_integrator.GitHubClient
+
+        def slow_client(token):
+            time.sleep(0.05)
+            return real_client(token)
+
+        with mock.patch.object(unified_data_integrator, "GitHubClient", side_effect=slow_client) as factory:
+            threads = [threading.Thread(target=lambda: self.integrator.github_client) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        self.assertEqual(factory.call_count, 1)
+
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    """Minimal GitHub API: ETag-aware notifications and issue comments"""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=None, headers=None):
+        payload = json.dumps(body).encode() if body is not None else b""
+        self.send_response(status)
+        for name, value in dict(self.server.extra_headers, **(headers or {})).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        self.server.requests.append((self.command, self.path, dict(self.headers), self.client_address))
+        if self.path != "/notifications":
+            return self._send(404, {"message": "Not Found"})
+        if self.headers.get("If-None-Match") == self.server.etag:
+            return self._send(304)
+        self._send(200, self.server.notifications, {"ETag": self.server.etag})
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length))
+        self.server.requests.append((self.command, self.path, body, self.client_address))
+        self._send(201, {"id": 1, "body": body["body"]})
+
+
+class TestGitHubClient(unittest.TestCase):
+    """Test the pooled GitHub client against a local mock server"""
+
+    def setUp(self):
+        """Start the mock GitHub API"""
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), MockGitHubHandler)
+        self.server.requests = []
+        self.server.extra_headers = {}
+        self.server.etag = '"v1"'
+        self.server.notifications = [{"id": "1", "subject": {"title": "Hello"}}]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = GitHubClient("test-token", base_url=self.base_url)
+
+    def tearDown(self):
+        """Stop the mock server"""
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_conditional_get_and_connection_reuse(self):
+        """Test repeat GETs revalidate with the ETag over one connection"""
+        first, changed = self.client.get_json("/notifications")
+        self.assertTrue(changed)
+
+        again, changed = self.client.get_json("/notifications")
+
+        self.assertFalse(changed)
+        self.assertEqual(again, first)
+        self.assertEqual(self.server.requests[1][2].get("If-None-Match"), '"v1"')
+        self.assertEqual(self.client.stats["not_modified"], 1)
+        self.assertEqual(len({request[3] for request in self.server.requests}), 1)
+
+        self.server.etag = '"v2"'
+        self.server.notifications = []
+        self.assertEqual(self.client.get_json("/notifications"), ([], True))
+
+    def test_poll_interval_is_honored(self):
+        """Test no request is sent inside X-Poll-Interval"""
+        self.server.extra_headers = {"X-Poll-Interval": "60"}
+
+        self.client.get_json("/notifications")
+        self.client.get_json("/notifications")
+
+        self.assertEqual(len(self.server.requests), 1)
+        self.assertEqual(self.client.stats["poll_interval_hits"], 1)
+
+    def test_token_bucket_spaces_requests(self):
+        """Test bursts beyond the bucket capacity are throttled"""
+        client = GitHubClient("test-token", base_url=self.base_url, rate=20, burst=2)
+
+        start = time.perf_counter()
+        for _ in range(6):
+            client.post_json("/repos/o/r/issues/1/comments", {"body": "hi"})
+        client.close()
+
+        self.assertGreaterEqual(time.perf_counter() - start, 0.18)
+        self.assertEqual(client.stats["throttled"], 4)
+
+    def test_exhausted_quota_fails_fast(self):
+        """Test no request is sent while the quota is exhausted"""
+        self.server.extra_headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+        self.client.get_json("/notifications")
+
+        with self.assertRaises(GitHubRateLimitError):
+            self.client.get_json("/notifications")
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_integrator_uses_shared_client(self):
+        """Test integrator GitHub calls go through the pooled client"""
+        integrator = UnifiedDataIntegrator()
+        integrator.symphony_control._validate_four_pillars = lambda solution: {
+            "safety": True, "long_term": True, "data_driven": True, "human_ai_risk_protection": True
+        }
+        with mock.patch.dict(os.environ, {"GITHUB_TOKEN": "test-token"}):
+            integrator._github_client = self.client
+
+            self.assertEqual(len(integrator.check_github_notifications()), 1)
+            self.assertEqual(len(integrator.check_github_notifications()), 1)
+            self.assertTrue(integrator.reply_to_github_notification("1", "Thanks", "o/r", 7))
+
+        self.assertEqual(self.client.stats["not_modified"], 1)
+        self.assertEqual(self.server.requests[-1][:3], ("POST", "/repos/o/r/issues/7/comments", {"body": "Thanks"}))
+        self.assertTrue(integrator.audit_log[1]["not_modified"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -20,21 +20,34 @@ import sqlite3
 import time
 import threading
 import hashlib
+import bisect
+import gzip
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Callable
+from types import MappingProxyType
+from typing import Dict, List, Any, Optional, Callable, Mapping, Iterable, Iterator, Set, Tuple, TextIO
 from dataclasses import dataclass, field
+from collections import deque
 from enum import Enum
 import sys
 import os
 import importlib
 import inspect
+from concurrent.futures import ThreadPoolExecutor, Future, wait
+from functools import partial
 
 # Import HYPERAI Framework components
 from digital_ai_organism_framework import SymphonyControlCenter, DigitalOrganism, DigitalEcosystem
 from unified_data_integrator import UnifiedDataIntegrator
 
+CON_MEMORY_DB = os.environ.get("HYPERAI_CON_MEMORY_DB", "/con-memory/con_memory.db")
+CON_MEMORY_JOB = "con_memory"  # Fan-out slot for the .con-memory sync
+CON_MEMORY_BATCH_HEARTBEATS = 5  # Heartbeat rows buffered per insert batch
+JOURNAL_DIR = os.environ.get("HYPERAI_JOURNAL_DIR")  # Spill evicted log entries here when set
+AUDIT_LOG_LIMIT = 1000
+COMMUNICATION_LOG_LIMIT = 100  # Per module
+
 class ModuleType(Enum):
     """Types of AI modules in the system"""
     FRAMEWORK = "framework"
@@ -68,6 +81,308 @@ class AIModule:
     metadata: Dict[str, Any] = field(default_factory=dict)
     capabilities: List[str] = field(default_factory=list)
 
+class RingLog:
+    """
+    Capped in-memory log with running counters
+    When a journal path is given, entries evicted from memory are appended
+    to it as compact JSON lines so the full history survives on disk
+    """
+
+    def __init__(self, maxlen: int, journal_path: Optional[Path] = None):
+        self.entries: deque = deque(maxlen=maxlen)
+        self.journal_path = Path(journal_path) if journal_path else None
+        self.total = 0
+        self.spilled = 0
+        self._journal = None
+        self._lock = threading.Lock()
+
+    def append(self, entry: Dict[str, Any]):
+        """Add an entry, spilling the oldest one if the buffer is full"""
+        with self._lock:
+            if self.journal_path and len(self.entries) == self.entries.maxlen:
+                self._spill(self.entries[0])
+            self.entries.append(entry)
+            self.total += 1
+
+    def _spill(self, entry: Dict[str, Any]):
+        """Append one evicted entry to the journal"""
+        if self._journal is None:
+            self.journal_path.parent.mkdir(parents=True, exist_ok=True)
+            self._journal = open(self.journal_path, 'a', encoding='utf-8')
+        self._journal.write(json.dumps(entry, separators=(',', ':'), ensure_ascii=False, default=str) + "\n")
+        self._journal.flush()
+        self.spilled += 1
+
+    def recent(self, count: int) -> List[Dict[str, Any]]:
+        """Return the newest entries, oldest first"""
+        with self._lock:
+            return list(self.entries)[-count:]
+
+    def close(self):
+        """Close the journal file"""
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def __iter__(self):
+        return iter(self.recent(len(self.entries)))
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (bucket bounds in seconds)"""
+
+    BOUNDS = (0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+              1.0, 2.0, 5.0, 10.0, 20.0, 60.0, float("inf"))
+
+    def __init__(self):
+        self.buckets = [0] * len(self.BOUNDS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def record(self, seconds: float):
+        self.buckets[bisect.bisect_left(self.BOUNDS, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (0-100)"""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for bound, hits in zip(self.BOUNDS, self.buckets):
+            seen += hits
+            if hits and seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.max,
+            "buckets": {
+                ("+inf" if bound == float("inf") else f"le_{bound}"): hits
+                for bound, hits in zip(self.BOUNDS, self.buckets) if hits
+            }
+        }
+
+@dataclass(frozen=True)
+class PoolSnapshot:
+    """Immutable view of the shared data pool at one version"""
+    version: int
+    data: Mapping[str, Any]
+
+class VersionedDataPool:
+    """
+    Copy-on-write shared data pool
+    Each publish installs a new version that shares every unchanged entry with
+    the previous one. Readers take the current snapshot without locking and
+    keep a consistent view while writers publish; published values must be
+    treated as read-only
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._current = PoolSnapshot(0, MappingProxyType({}))
+
+    def snapshot(self) -> PoolSnapshot:
+        """Current version; safe to hold across later publishes"""
+        return self._current
+
+    @property
+    def version(self) -> int:
+        return self._current.version
+
+    def publish(self, delta: Dict[str, Any]) -> PoolSnapshot:
+        """Replace top-level entries in one new version"""
+        with self._lock:
+            data = dict(self._current.data)
+            data.update(delta)
+            return self._install(data)
+
+    def merge(self, key: str, delta: Dict[str, Any]) -> PoolSnapshot:
+        """Update fields of one dict entry without mutating older versions"""
+        with self._lock:
+            data = dict(self._current.data)
+            data[key] = {**data.get(key, {}), **delta}
+            return self._install(data)
+
+    def _install(self, data: Dict[str, Any]) -> PoolSnapshot:
+        """Swap in the next version (caller holds the lock)"""
+        self._current = PoolSnapshot(self._current.version + 1, MappingProxyType(data))
+        return self._current
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._current.data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dict(self._current.data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._current.data[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._current.data
+
+    def __len__(self) -> int:
+        return len(self._current.data)
+
+class ConMemorySync:
+    """
+    Incremental sync with the .con-memory database shared by the 451 agents
+    Owns its connection (WAL mode), skips reads when no other connection has
+    committed since the last sync, reads new activities past a rowid
+    high-water mark and batches orchestrator heartbeat rows
+    """
+
+    AGENTS_SQL = "SELECT agent_id, capability_type, priority FROM agent_capabilities LIMIT 100"
+    ACTIVITIES_SINCE_SQL = (
+        "SELECT rowid, extension_id, activity_type, timestamp FROM extension_activities "
+        "WHERE datetime(timestamp) > datetime('now', '-1 day') AND rowid <= ? ORDER BY rowid"
+    )
+    MAX_ROWID_SQL = "SELECT COALESCE(MAX(rowid), 0) FROM extension_activities"
+    ACTIVITIES_AFTER_SQL = (
+        "SELECT rowid, extension_id, activity_type, timestamp FROM extension_activities "
+        "WHERE rowid > ? ORDER BY rowid"
+    )
+    INSERT_SQL = (
+        "INSERT INTO unified_data_points (source, source_type, data_type, content, timestamp) "
+        "VALUES (?, ?, ?, ?, ?)"
+    )
+    RECENT_LIMIT = 50
+
+    def __init__(self, db_path: str, logger: logging.Logger,
+                 batch_heartbeats: int = CON_MEMORY_BATCH_HEARTBEATS):
+        self.db_path = db_path
+        self.logger = logger
+        self.batch_heartbeats = batch_heartbeats
+        self.agents: List[Dict[str, Any]] = []
+        self.recent_activities: deque = deque(maxlen=self.RECENT_LIMIT)  # Newest first
+        self.activity_watermark: Optional[int] = None  # Highest rowid seen
+        self._data_version: Optional[int] = None
+        self._pending_rows: List[tuple] = []
+        self._db: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the connection on first use"""
+        if self._db is None:
+            # Used from whichever heartbeat worker runs the sync; _lock serializes access
+            self._db = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+        return self._db
+
+    def sync(self, content: str) -> Optional[Dict[str, Any]]:
+        """
+        Queue one heartbeat row and refresh agents/activities
+        Returns the shared-pool delta, or None when nothing changed
+        """
+        with self._lock:
+            db = self._connect()
+            try:
+                return self._refresh(db)
+            finally:
+                self._pending_rows.append(
+                    ("hyperai-orchestrator", "orchestrator", "heartbeat", content, datetime.now().isoformat())
+                )
+                if len(self._pending_rows) >= self.batch_heartbeats:
+                    self._flush(db)
+
+    def _refresh(self, db: sqlite3.Connection) -> Optional[Dict[str, Any]]:
+        """Re-read agents and new activities if another connection committed"""
+        # data_version only changes when a different connection commits
+        data_version = db.execute("PRAGMA data_version").fetchone()[0]
+        if data_version == self._data_version:
+            if self._trim_expired():
+                return {"recent_activities": list(self.recent_activities)}
+            return None
+
+        agents = db.execute(self.AGENTS_SQL).fetchall()
+        new_activities = self._read_new_activities(db)
+        self._data_version = data_version
+
+        self.agents = [{"agent_id": a[0], "type": a[1], "priority": a[2]} for a in agents]
+        self.logger.info(f"💚 Synced .con-memory: {len(agents)} agents, {len(new_activities)} new activities")
+        return {
+            "con_memory_agents": self.agents,
+            "recent_activities": list(self.recent_activities)
+        }
+
+    def _read_new_activities(self, db: sqlite3.Connection) -> List[tuple]:
+        """Read activities past the high-water mark into the recent window"""
+        if self.activity_watermark is None:
+            # Start the watermark at the current end of the table, so an empty
+            # first window does not leave the next read scanning from rowid 0
+            self.activity_watermark = db.execute(self.MAX_ROWID_SQL).fetchone()[0]
+            rows = db.execute(self.ACTIVITIES_SINCE_SQL, (self.activity_watermark,)).fetchall()
+        else:
+            rows = db.execute(self.ACTIVITIES_AFTER_SQL, (self.activity_watermark,)).fetchall()
+
+        for rowid, agent, activity, timestamp in rows:
+            self.recent_activities.appendleft({"agent": agent, "activity": activity, "time": timestamp})
+            self.activity_watermark = max(self.activity_watermark, rowid)
+
+        self._trim_expired()
+        return rows
+
+    @staticmethod
+    def _utc_time(timestamp: Any) -> Optional[datetime]:
+        """Parse a stored timestamp as SQLite's datetime() does: naive UTC, 'T' or space separated"""
+        try:
+            parsed = datetime.fromisoformat(str(timestamp).replace(' ', 'T'))
+        except ValueError:
+            return None
+        if parsed.tzinfo is not None:
+            parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+        return parsed
+
+    def _trim_expired(self) -> bool:
+        """Drop entries that aged out of the one-day window; True if any were dropped"""
+        # Same window as the SQL read: datetime('now', '-1 day') is UTC
+        cutoff = datetime.utcnow() - timedelta(days=1)
+        trimmed = False
+        while self.recent_activities:
+            parsed = self._utc_time(self.recent_activities[-1]["time"])
+            if parsed is not None and parsed > cutoff:
+                break
+            self.recent_activities.pop()
+            trimmed = True
+        return trimmed
+
+    def _flush(self, db: sqlite3.Connection):
+        """Insert the buffered heartbeat rows in one transaction"""
+        rows, self._pending_rows = self._pending_rows, []
+        try:
+            with db:
+                db.executemany(self.INSERT_SQL, rows)
+        except sqlite3.Error as e:
+            # Keep a bounded backlog to retry with the next batch
+            self._pending_rows = (rows + self._pending_rows)[-self.batch_heartbeats * 10:]
+            self.logger.warning(f"⚠️ .con-memory insert batch failed: {e}")
+
+    def flush(self):
+        """Write any buffered heartbeat rows now"""
+        with self._lock:
+            if self._pending_rows and self._db is not None:
+                self._flush(self._db)
+
+    def close(self):
+        """Flush buffered rows and close the connection"""
+        self.flush()
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
 @dataclass
 class UnifiedHeartbeat:
     """Unified heartbeat that synchronizes all AI modules"""
@@ -81,6 +396,8 @@ class UnifiedHeartbeat:
     health_metrics: Dict[str, float] = field(default_factory=dict)
     compliance_score: float = 1.0
     k_state: int = 0  # K-State for ecosystem coordination    symphony_signature: str = ""
+    shared_state: Optional[PoolSnapshot] = None  # Pool version pinned for this cycle
+    phase_durations: Dict[str, float] = field(default_factory=dict)
 
 class UnifiedAIOrchestrator:
     """
@@ -89,43 +406,91 @@ class UnifiedAIOrchestrator:
     """
 
     def __init__(self):
-        # HYPERAI Framework integration
-        self.symphony_control = SymphonyControlCenter()
+        # HYPERAI Framework integration (dependencies are created on first use)
+        self._symphony_control: Optional[SymphonyControlCenter] = None
+        self._data_integrator: Optional[UnifiedDataIntegrator] = None
+        self._modules: Optional[Dict[str, AIModule]] = None
+        self._lazy_lock = threading.RLock()
         self.creator = "Nguyễn Đức Cường (alpha_prime_omega)"
         self.framework_version = "1.0.0"
 
         # Core components
-        self.heartbeat_interval = 60  # seconds
-        self.modules: Dict[str, AIModule] = {}
+        self.heartbeat_interval = 60  # seconds, adapted to load after every cycle
+        self.min_heartbeat_interval = 10
+        self.max_heartbeat_interval = 300
+        self.phase_latency: Dict[str, LatencyHistogram] = {}
+        self._heartbeat_stop = threading.Event()
+        self.module_deadline = 15.0  # seconds a module may spend in one phase
+        self.max_module_workers = 8
         self.current_heartbeat: Optional[UnifiedHeartbeat] = None
         self.heartbeat_history: List[UnifiedHeartbeat] = []
 
         # Data and metadata sharing
-        self.shared_data_pool: Dict[str, Any] = {}
+        self.shared_data_pool = VersionedDataPool()
         self.metadata_registry: Dict[str, Dict[str, Any]] = {}
-        self.module_communications: Dict[str, List[Dict]] = {}
+        self.module_communications: Dict[str, RingLog] = {}
 
         # Health and monitoring
         self.system_health = 1.0
-        self.audit_log: List[Dict] = []
-
-        # Initialize data integrator for GitHub operations
-        self.data_integrator = UnifiedDataIntegrator()
-        # Connect to .con-memory database for 451 agent coordination
-        self.con_memory_db = sqlite3.connect("/con-memory/con_memory.db", check_same_thread=False)
-        self.con_memory_cursor = self.con_memory_db.cursor()
+        self.audit_log = RingLog(AUDIT_LOG_LIMIT, self._journal_path("audit_log"))
+        self.missed_slots: Dict[str, int] = {}
+        # (id, updated_at) of notifications already replied to; new activity changes updated_at
+        self._handled_notifications: Set[Tuple[Any, Any]] = set()
+        self._notification_lock = threading.Lock()
+
+        # Per-phase module fan-out
+        self._module_executor = ThreadPoolExecutor(
+            max_workers=self.max_module_workers, thread_name_prefix="hyperai-module"
+        )
+        self._module_inflight: Dict[str, Future] = {}
 
         # Setup logging
         self.logger = self._setup_logging()
 
-        # Initialize core modules
-        self._initialize_core_modules()
-
-        # Register with Symphony Control Center
-        self.symphony_control.register_component("unified_ai_orchestrator", self)
+        # Sync with .con-memory database for 451 agent coordination (connects on first sync)
+        self.con_memory = ConMemorySync(CON_MEMORY_DB, self.logger)
 
         self.logger.info("🎯 Unified AI Orchestrator initialized with unified heartbeat system")
 
+    @property
+    def symphony_control(self) -> SymphonyControlCenter:
+        """Symphony Control Center shared with the data integrator, registered on first use"""
+        if self._symphony_control is None:
+            with self._lazy_lock:
+                if self._symphony_control is None:
+                    symphony = SymphonyControlCenter()
+                    symphony.register_component("unified_ai_orchestrator", self)
+                    self._symphony_control = symphony
+        return self._symphony_control
+
+    @property
+    def data_integrator(self) -> UnifiedDataIntegrator:
+        """Data integrator for GitHub operations, created on first use"""
+        if self._data_integrator is None:
+            with self._lazy_lock:
+                if self._data_integrator is None:
+                    self._data_integrator = UnifiedDataIntegrator(symphony_control=self.symphony_control)
+        return self._data_integrator
+
+    @property
+    def modules(self) -> Dict[str, AIModule]:
+        """Registered AI modules, scanned on first use"""
+        if self._modules is None:
+            with self._lazy_lock:
+                if self._modules is None:
+                    # Publish only the complete dict; readers skip the lock once it is set
+                    self._modules = self._initialize_core_modules()
+        return self._modules
+
+    @modules.setter
+    def modules(self, modules: Dict[str, AIModule]):
+        self._modules = modules
+
+    @staticmethod
+    def _journal_path(name: str) -> Optional[Path]:
+        """Journal file for a ring log, or None when journaling is disabled"""
+        return Path(JOURNAL_DIR) / f"{name}.jsonl" if JOURNAL_DIR else None
+
     def _setup_logging(self) -> logging.Logger:
         """Setup comprehensive logging for orchestration"""
         logger = logging.getLogger("UnifiedAIOrchestrator")
@@ -141,8 +506,8 @@ class UnifiedAIOrchestrator:
 
         return logger
 
-    def _initialize_core_modules(self):
-        """Initialize and scan all AI modules in the system"""
+    def _initialize_core_modules(self) -> Dict[str, AIModule]:
+        """Initialize and scan all AI modules in the system; returns the registry"""
 
         # Define known AI modules
         core_modules = {
@@ -181,16 +546,19 @@ class UnifiedAIOrchestrator:
         }
 
         # Scan and register modules
+        modules: Dict[str, AIModule] = {}
         for module_name, config in core_modules.items():
             try:
-                self._register_ai_module(module_name, config)
+                self._register_ai_module(module_name, config, modules)
             except Exception as e:
                 self.logger.warning(f"Failed to register module {module_name}: {e}")
 
-        self.logger.info(f"Registered {len(self.modules)} AI modules")
+        self.logger.info(f"Registered {len(modules)} AI modules")
+        return modules
 
-    def _register_ai_module(self, module_name: str, config: Dict[str, Any]):
-        """Register an AI module with full metadata scanning"""
+    def _register_ai_module(self, module_name: str, config: Dict[str, Any],
+                            modules: Optional[Dict[str, AIModule]] = None):
+        """Register an AI module with full metadata scanning (into self.modules by default)"""
 
         module_path = f"/workspaces/DAIOF-Framework/{module_name}.py"
 
@@ -232,7 +600,9 @@ class UnifiedAIOrchestrator:
             }
         )
 
-        self.modules[module_name] = ai_module
+        if modules is None:
+            modules = self.modules
+        modules[module_name] = ai_module
         self.logger.info(f"✅ Registered AI module: {module_name} ({ai_module.module_type.value})")
 
     def start_unified_heartbeat(self):
@@ -243,55 +613,101 @@ class UnifiedAIOrchestrator:
         self._create_new_heartbeat()
 
         # Start heartbeat thread
+        self._heartbeat_stop.clear()
         heartbeat_thread = threading.Thread(target=self._heartbeat_loop, daemon=True)
         heartbeat_thread.start()
 
-        self.logger.info(f"🫀 Unified heartbeat started with {self.heartbeat_interval}s interval")
+        self.logger.info(
+            f"🫀 Unified heartbeat started with {self.heartbeat_interval}s interval "
+            f"(adaptive {self.min_heartbeat_interval}-{self.max_heartbeat_interval}s)"
+        )
+
+    def stop_unified_heartbeat(self):
+        """Stop the heartbeat loop after the current cycle"""
+        self._heartbeat_stop.set()
+        if self.con_memory is not None:
+            self.con_memory.flush()
 
     def _heartbeat_loop(self):
         """Main heartbeat loop that synchronizes all AI modules"""
-        while True:
+        next_beat = time.monotonic()
+        while not self._heartbeat_stop.is_set():
+            missed_before = sum(self.missed_slots.values())
             try:
                 # Execute heartbeat cycle
                 self._execute_heartbeat_cycle()
-
-                # Wait for next heartbeat
-                time.sleep(self.heartbeat_interval)
+                pending = self._has_pending_work(sum(self.missed_slots.values()) > missed_before)
 
             except Exception as e:
                 self.logger.error(f"Heartbeat cycle error: {e}")
-                time.sleep(self.heartbeat_interval / 2)  # Retry sooner on error
+                pending = True  # Retry sooner on error
+
+            self.heartbeat_interval = self._next_heartbeat_interval(pending)
+
+            # Fixed-rate cadence: the interval runs from the start of the cycle.
+            # After an overrun, start the next cycle now instead of catching up
+            next_beat += self.heartbeat_interval
+            now = time.monotonic()
+            if next_beat < now:
+                next_beat = now
+            self._heartbeat_stop.wait(next_beat - now)
+
+    def _has_pending_work(self, missed_slots: bool = False) -> bool:
+        """Whether the next heartbeat should come sooner"""
+        if missed_slots or self._unprocessed_notifications():
+            return True
+        return any(module.health_score < 0.7 for module in self.modules.values())
+
+    @staticmethod
+    def _notification_key(notification: Dict[str, Any]) -> Tuple[Any, Any]:
+        return notification.get("id"), notification.get("updated_at")
+
+    def _unprocessed_notifications(self) -> List[Dict[str, Any]]:
+        """Published notifications not replied to yet (cached unread lists repeat the same ones)"""
+        notifications = self.shared_data_pool.get("github_notifications") or []
+        with self._notification_lock:
+            return [n for n in notifications if self._notification_key(n) not in self._handled_notifications]
+
+    def _next_heartbeat_interval(self, pending: bool) -> float:
+        """Tighten the interval under pending work, back off while idle"""
+        if pending:
+            interval = self.heartbeat_interval / 2
+        else:
+            interval = self.heartbeat_interval * 1.5
+        return max(self.min_heartbeat_interval, min(self.max_heartbeat_interval, interval))
 
     def _execute_heartbeat_cycle(self):
-        """Execute a complete heartbeat cycle"""
-
-        # Phase 1: Initialization
-        self.current_heartbeat.phase = HeartbeatPhase.INITIALIZATION
-        self._initialize_heartbeat_data()
-
-        # Phase 2: Synchronization
-        self.current_heartbeat.phase = HeartbeatPhase.SYNCHRONIZATION
-        self._synchronize_all_modules()
-
-        # Phase 3: Execution
-        self.current_heartbeat.phase = HeartbeatPhase.EXECUTION
-        self._execute_module_operations()
-
-        # Phase 4: Monitoring
-        self.current_heartbeat.phase = HeartbeatPhase.MONITORING
-        self._monitor_system_health()
-
-        # Phase 5: Optimization
-        self.current_heartbeat.phase = HeartbeatPhase.OPTIMIZATION
-        self._optimize_system_performance()
-
-        # Phase 6: Evolution
-        self.current_heartbeat.phase = HeartbeatPhase.EVOLUTION
-        self._evolve_system_capabilities()
+        """Execute a complete heartbeat cycle, timing every phase"""
+        phases = [
+            (HeartbeatPhase.INITIALIZATION, self._initialize_heartbeat_data),
+            (HeartbeatPhase.SYNCHRONIZATION, self._synchronize_all_modules),
+            (HeartbeatPhase.EXECUTION, self._execute_module_operations),
+            (HeartbeatPhase.MONITORING, self._monitor_system_health),
+            (HeartbeatPhase.OPTIMIZATION, self._optimize_system_performance),
+            (HeartbeatPhase.EVOLUTION, self._evolve_system_capabilities),
+        ]
+        cycle_start = time.perf_counter()
+
+        for phase, run_phase in phases:
+            self.current_heartbeat.phase = phase
+            phase_start = time.perf_counter()
+            run_phase()
+            self._record_latency(phase.value, time.perf_counter() - phase_start)
+
+        self._record_latency("cycle", time.perf_counter() - cycle_start)
 
         # Complete heartbeat
         self._complete_heartbeat_cycle()
 
+    def _record_latency(self, name: str, seconds: float):
+        """Record a phase duration in its histogram and on the heartbeat"""
+        self.phase_latency.setdefault(name, LatencyHistogram()).record(seconds)
+        self.current_heartbeat.phase_durations[name] = seconds
+
+    def get_phase_latency_report(self) -> Dict[str, Dict[str, Any]]:
+        """Latency histograms per heartbeat phase (plus whole cycles)"""
+        return {name: histogram.to_dict() for name, histogram in self.phase_latency.items()}
+
     def _create_new_heartbeat(self):
         """Create a new heartbeat cycle"""
         cycle_id = f"heartbeat_{int(time.time())}"
@@ -307,6 +723,9 @@ class UnifiedAIOrchestrator:
 
     def _initialize_heartbeat_data(self):
         """Initialize heartbeat data and metadata pools"""
+        # Every module reads this cycle's pool version, whatever is published meanwhile
+        self.current_heartbeat.shared_state = self.shared_data_pool.snapshot()
+
         self.current_heartbeat.data_flow = {
             "input_streams": {},
             "output_streams": {},
@@ -329,85 +748,113 @@ class UnifiedAIOrchestrator:
         self.current_heartbeat.symphony_signature = self.symphony_control.meta_data.get_symphony_signature()
 
 
-    def _sync_with_con_memory(self):
+    def _sync_with_con_memory(self, heartbeat: Optional[UnifiedHeartbeat]):
         """Sync với .con-memory database: đọc 451 agents activities, ghi orchestrator decisions"""
-        if not hasattr(self, 'con_memory_db'):
+        if self.con_memory is None:
             return
         try:
-            cursor = self.con_memory_db.cursor()
-            cursor.execute(
-                "SELECT agent_id, capability_type, priority FROM agent_capabilities LIMIT 100"
-            )
-            agents = cursor.fetchall()
-            self.shared_data_pool["con_memory_agents"] = [
-                {"agent_id": a[0], "type": a[1], "priority": a[2]} for a in agents
-            ]
-            cursor.execute(
-                "SELECT extension_id, activity_type, timestamp FROM extension_activities WHERE datetime(timestamp) > datetime('now', '-1 day') ORDER BY timestamp DESC LIMIT 50"
-            )
-            activities = cursor.fetchall()
-            self.shared_data_pool["recent_activities"] = [
-                {"agent": a[0], "activity": a[1], "time": a[2]} for a in activities
-            ]
-            cursor.execute(
-                "INSERT INTO unified_data_points (source, source_type, data_type, content, timestamp) VALUES (?, ?, ?, ?, ?)",
-                ("hyperai-orchestrator", "orchestrator", "heartbeat", f"K-State: {self.current_heartbeat.k_state if self.current_heartbeat else 0}", datetime.now().isoformat())
-            )
-            self.con_memory_db.commit()
-            cursor.close()
-            self.logger.info(f"💚 Synced .con-memory: {len(agents)} agents, {len(activities)} activities")
+            k_state = heartbeat.k_state if heartbeat else 0
+            delta = self.con_memory.sync(f"K-State: {k_state}")
+            if delta:
+                self.shared_data_pool.publish(delta)
         except Exception as e:
             self.logger.warning(f"⚠️ .con-memory sync failed: {e}")
 
+    def _fan_out(self, jobs: Dict[str, Callable[[], Any]]) -> Dict[str, Any]:
+        """
+        Run one job per module concurrently and wait at the phase barrier
+        Jobs still running after module_deadline miss their slot; the module
+        is skipped in later phases until the straggler finishes. Jobs are
+        bound to their heartbeat and phase at submit time, so a straggler
+        never writes into a later cycle
+        """
+        futures: Dict[str, Future] = {}
+        for name, job in jobs.items():
+            previous = self._module_inflight.get(name)
+            if previous is not None and not previous.done():
+                self._miss_slot(name, "still busy with an earlier slot")
+                continue
+            futures[name] = self._module_inflight[name] = self._module_executor.submit(job)
+
+        _, pending = wait(futures.values(), timeout=self.module_deadline)
+
+        results = {}
+        for name, future in futures.items():
+            if future in pending:
+                self._miss_slot(name, f"exceeded {self.module_deadline}s deadline")
+                continue
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                self.logger.warning(f"Module job {name} failed: {e}")
+        return results
+
+    def _miss_slot(self, name: str, reason: str):
+        """Record a module that missed its heartbeat slot"""
+        self.missed_slots[name] = self.missed_slots.get(name, 0) + 1
+        self.logger.warning(f"⏱️ {name} missed {self.current_heartbeat.phase.value} slot: {reason}")
+
     def _synchronize_all_modules(self):
         """Synchronize all AI modules to the heartbeat"""
-        # Sync with .con-memory database
-        self._sync_with_con_memory()
-        synchronized = 0
+        heartbeat = self.current_heartbeat
+        jobs = {
+            module_name: partial(self._synchronize_module, heartbeat, heartbeat.phase, module_name, module)
+            for module_name, module in self.modules.items()
+        }
+        # Sync with .con-memory database alongside the modules
+        jobs[CON_MEMORY_JOB] = partial(self._sync_with_con_memory, heartbeat)
 
-        for module_name, module in self.modules.items():
-            try:
-                # Update module heartbeat
-                module.last_heartbeat = datetime.now()
-                module.health_score = self._assess_module_health(module)
-
-                # Share metadata
-                self.current_heartbeat.metadata_pool["module_states"][module_name] = {
-                    "health": module.health_score,
-                    "last_heartbeat": module.last_heartbeat.isoformat(),
-                    "capabilities": module.capabilities
-                }
+        results = self._fan_out(jobs)
+        synchronized = sum(1 for name in self.modules if results.get(name))
+
+        heartbeat.active_modules = synchronized
+        self.logger.info(f"🔄 Synchronized {synchronized}/{len(self.modules)} AI modules")
 
-                # Synchronize data
-                self._synchronize_module_data(module_name, module)
+    def _synchronize_module(self, heartbeat: UnifiedHeartbeat, phase: HeartbeatPhase,
+                            module_name: str, module: AIModule) -> bool:
+        """Synchronize one AI module to the heartbeat"""
+        try:
+            # Update module heartbeat
+            module.last_heartbeat = datetime.now()
+            module.health_score = self._assess_module_health(module)
 
-                synchronized += 1
+            # Share metadata
+            heartbeat.metadata_pool["module_states"][module_name] = {
+                "health": module.health_score,
+                "last_heartbeat": module.last_heartbeat.isoformat(),
+                "capabilities": module.capabilities
+            }
 
-            except Exception as e:
-                self.logger.warning(f"Failed to synchronize module {module_name}: {e}")
-                module.health_score = 0.0
+            # Synchronize data
+            self._synchronize_module_data(heartbeat, phase, module_name, module)
+            return True
 
-        self.current_heartbeat.active_modules = synchronized
-        self.logger.info(f"🔄 Synchronized {synchronized}/{len(self.modules)} AI modules")
+        except Exception as e:
+            self.logger.warning(f"Failed to synchronize module {module_name}: {e}")
+            module.health_score = 0.0
+            return False
 
-    def _synchronize_module_data(self, module_name: str, module: AIModule):
+    def _synchronize_module_data(self, heartbeat: UnifiedHeartbeat, phase: HeartbeatPhase,
+                                 module_name: str, module: AIModule):
         """Synchronize data and metadata for a specific module"""
 
         # Create data synchronization point
         sync_data = {
             "module_name": module_name,
             "timestamp": datetime.now().isoformat(),
-            "shared_data": self.shared_data_pool.get(module_name, {}),
+            "shared_data": heartbeat.shared_state.data.get(module_name, {}),
             "metadata": self.metadata_registry.get(module_name, {}),
-            "heartbeat_phase": self.current_heartbeat.phase.value
+            "heartbeat_phase": phase.value
         }
 
         # Add to heartbeat data flow
-        self.current_heartbeat.data_flow["cross_module_data"][module_name] = sync_data
+        heartbeat.data_flow["cross_module_data"][module_name] = sync_data
 
         # Update module communications log
         if module_name not in self.module_communications:
-            self.module_communications[module_name] = []
+            self.module_communications[module_name] = RingLog(
+                COMMUNICATION_LOG_LIMIT, self._journal_path(f"communications_{module_name}")
+            )
 
         self.module_communications[module_name].append({
             "timestamp": datetime.now().isoformat(),
@@ -418,37 +865,45 @@ class UnifiedAIOrchestrator:
     def _execute_module_operations(self):
         """Execute coordinated operations across all modules"""
 
-        # Execute operations based on module capabilities
-        operations_executed = 0
+        # Execute operations based on module capabilities, skipping unhealthy modules
+        heartbeat = self.current_heartbeat
+        jobs = {
+            module_name: partial(self._execute_operations_for, heartbeat, heartbeat.phase, module_name, module)
+            for module_name, module in self.modules.items()
+            if module.health_score >= 0.5
+        }
 
-        for module_name, module in self.modules.items():
-            if module.health_score < 0.5:
-                continue  # Skip unhealthy modules
+        operations_executed = sum(self._fan_out(jobs).values())
+        self.logger.info(f"⚡ Executed {operations_executed} coordinated operations")
 
-            try:
-                operations = self._get_module_operations(module)
-                for operation in operations:
-                    self._execute_module_operation(module_name, operation)
-                    operations_executed += 1
+    def _execute_operations_for(self, heartbeat: UnifiedHeartbeat, phase: HeartbeatPhase,
+                                module_name: str, module: AIModule) -> int:
+        """Execute one module's operations in order, returning how many ran"""
+        operations_executed = 0
+        try:
+            operations = self._get_module_operations(module, phase)
+            for operation in operations:
+                self._execute_module_operation(heartbeat, module_name, operation)
+                operations_executed += 1
 
-            except Exception as e:
-                self.logger.warning(f"Failed to execute operations for {module_name}: {e}")
+        except Exception as e:
+            self.logger.warning(f"Failed to execute operations for {module_name}: {e}")
 
-        self.logger.info(f"⚡ Executed {operations_executed} coordinated operations")
+        return operations_executed
 
-    def _get_module_operations(self, module: AIModule) -> List[Dict[str, Any]]:
+    def _get_module_operations(self, module: AIModule, phase: HeartbeatPhase) -> List[Dict[str, Any]]:
         """Get operations to execute for a module based on heartbeat phase"""
 
         operations = []
 
-        if self.current_heartbeat.phase == HeartbeatPhase.MONITORING:
+        if phase == HeartbeatPhase.MONITORING:
             if "health_monitoring" in module.capabilities:
                 operations.append({
                     "type": "health_check",
                     "function": "check_health"
                 })
 
-        elif self.current_heartbeat.phase == HeartbeatPhase.EXECUTION:
+        elif phase == HeartbeatPhase.EXECUTION:
             if "performance_evaluation" in module.capabilities:
                 operations.append({
                     "type": "evaluation",
@@ -470,7 +925,7 @@ class UnifiedAIOrchestrator:
                     "function": "control_copilot_settings"
                 })
 
-        elif self.current_heartbeat.phase == HeartbeatPhase.EVOLUTION:
+        elif phase == HeartbeatPhase.EVOLUTION:
             if "evolution" in module.capabilities:
                 operations.append({
                     "type": "evolution",
@@ -479,7 +934,7 @@ class UnifiedAIOrchestrator:
 
         return operations
 
-    def _execute_module_operation(self, module_name: str, operation: Dict[str, Any]):
+    def _execute_module_operation(self, heartbeat: UnifiedHeartbeat, module_name: str, operation: Dict[str, Any]):
         """Execute a specific operation on a module"""
 
         # Handle special operations for unified_data_integrator
@@ -488,20 +943,25 @@ class UnifiedAIOrchestrator:
                 notifications = self.data_integrator.check_github_notifications()
                 self.logger.info(f"Checked {len(notifications)} GitHub notifications")
                 # Store in shared data pool
-                self.shared_data_pool["github_notifications"] = notifications
+                self.shared_data_pool.publish({"github_notifications": notifications})
+                with self._notification_lock:
+                    # Forget notifications GitHub no longer lists
+                    self._handled_notifications &= {self._notification_key(n) for n in notifications}
                 operation_record = {
                     "module": module_name,
                     "operation": operation,
                     "timestamp": datetime.now().isoformat(),
-                    "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                    "heartbeat_cycle": heartbeat.cycle_id,
                     "status": f"checked_{len(notifications)}_notifications"
                 }
 
             elif operation["type"] == "github_reply":
-                # For demo, reply to first notification if available
-                notifications = self.shared_data_pool.get("github_notifications", [])
+                # For demo, reply to the first notification not replied to yet
+                notifications = self._unprocessed_notifications()
                 if notifications:
                     notification = notifications[0]
+                    with self._notification_lock:
+                        self._handled_notifications.add(self._notification_key(notification))
                     repo = notification.get("repository", {}).get("full_name", "NguyenCuong1989/DAIOF-Framework")
                     issue_url = notification.get("subject", {}).get("url", "")
                     issue_number = issue_url.split("/")[-1] if issue_url else "1"
@@ -513,7 +973,7 @@ class UnifiedAIOrchestrator:
                         "module": module_name,
                         "operation": operation,
                         "timestamp": datetime.now().isoformat(),
-                        "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                        "heartbeat_cycle": heartbeat.cycle_id,
                         "status": "reply_success" if success else "reply_failed"
                     }
                 else:
@@ -521,7 +981,7 @@ class UnifiedAIOrchestrator:
                         "module": module_name,
                         "operation": operation,
                         "timestamp": datetime.now().isoformat(),
-                        "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                        "heartbeat_cycle": heartbeat.cycle_id,
                         "status": "no_notifications_to_reply"
                     }
 
@@ -532,7 +992,7 @@ class UnifiedAIOrchestrator:
                     "module": module_name,
                     "operation": operation,
                     "timestamp": datetime.now().isoformat(),
-                    "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                    "heartbeat_cycle": heartbeat.cycle_id,
                     "status": "copilot_checked" if success else "copilot_check_failed"
                 }
 
@@ -542,7 +1002,7 @@ class UnifiedAIOrchestrator:
                     "module": module_name,
                     "operation": operation,
                     "timestamp": datetime.now().isoformat(),
-                    "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                    "heartbeat_cycle": heartbeat.cycle_id,
                     "status": "simulated_execution"
                 }
         else:
@@ -551,7 +1011,7 @@ class UnifiedAIOrchestrator:
                 "module": module_name,
                 "operation": operation,
                 "timestamp": datetime.now().isoformat(),
-                "heartbeat_cycle": self.current_heartbeat.cycle_id,
+                "heartbeat_cycle": heartbeat.cycle_id,
                 "status": "simulated_execution"
             }
 
@@ -559,14 +1019,13 @@ class UnifiedAIOrchestrator:
         self.audit_log.append(operation_record)
 
         # Update shared data pool
-        if module_name not in self.shared_data_pool:
-            self.shared_data_pool[module_name] = {}
-
-        self.shared_data_pool[module_name][operation["type"]] = {
-            "last_execution": datetime.now().isoformat(),
-            "status": operation_record["status"],
-            "heartbeat_cycle": self.current_heartbeat.cycle_id
-        }
+        self.shared_data_pool.merge(module_name, {
+            operation["type"]: {
+                "last_execution": datetime.now().isoformat(),
+                "status": operation_record["status"],
+                "heartbeat_cycle": heartbeat.cycle_id
+            }
+        })
 
     def _monitor_system_health(self):
         """Monitor overall system health"""
@@ -772,7 +1231,7 @@ class UnifiedAIOrchestrator:
             "heartbeat_interval": self.heartbeat_interval,
             "shared_data_items": len(self.shared_data_pool),
             "metadata_entries": len(self.metadata_registry),
-            "audit_entries": len(self.audit_log),
+            "audit_entries": self.audit_log.total,
             "creator": self.creator,
             "framework_version": self.framework_version
         }
@@ -796,13 +1255,19 @@ class UnifiedAIOrchestrator:
                 "current_cycle": self.current_heartbeat.cycle_id if self.current_heartbeat else None,
                 "total_cycles": len(self.heartbeat_history),
                 "active_modules": self.current_heartbeat.active_modules if self.current_heartbeat else 0,
-                "total_modules": len(self.modules)
+                "total_modules": len(self.modules),
+                "interval": self.heartbeat_interval,
+                "phase_latency": self.get_phase_latency_report()
             },
             "module_breakdown": {},
             "data_flow_analysis": {
                 "shared_data_pool_size": len(self.shared_data_pool),
                 "metadata_registry_size": len(self.metadata_registry),
-                "communication_logs": sum(len(logs) for logs in self.module_communications.values())
+                "communication_logs": sum(logs.total for logs in self.module_communications.values()),
+                "audit_entries": self.audit_log.total,
+                "journaled_entries": self.audit_log.spilled + sum(
+                    logs.spilled for logs in self.module_communications.values()
+                )
             },
             "four_pillars_check": dr_result["four_pillars_check"],
             "symphony_signature": self.symphony_control.meta_data.get_symphony_signature(),
@@ -816,13 +1281,20 @@ class UnifiedAIOrchestrator:
                 "health": module.health_score,
                 "capabilities": module.capabilities,
                 "last_heartbeat": module.last_heartbeat.isoformat() if module.last_heartbeat else None,
-                "communication_count": len(self.module_communications.get(module_name, []))
+                "communication_count": self.module_communications[module_name].total
+                if module_name in self.module_communications else 0
             }
 
         return report
 
-    def export_unified_system_data(self, output_path: str):
-        """Export comprehensive unified system data"""
+    def export_unified_system_data(self, output_path: str, fmt: Optional[str] = None,
+                                   compress: Optional[bool] = None):
+        """
+        Export comprehensive unified system data
+        Sections are serialized one item at a time, so memory stays bounded by
+        the largest single item. fmt is "json" or "jsonl" (default from the
+        suffix); compress gzips the output (default: path ends in .gz)
+        """
 
         # Apply D&R Protocol for export
         dr_result = self.symphony_control.apply_dr_protocol(
@@ -834,45 +1306,103 @@ class UnifiedAIOrchestrator:
             self.logger.error("4 Pillars check failed for system data export")
             return False
 
-        # Compile export data
-        export_data = {
-            "metadata": {
-                "creator": self.creator,
-                "export_timestamp": datetime.now().isoformat(),
-                "system_health": self.system_health,
-                "compliance_score": self._calculate_compliance_score(),
-                "symphony_signature": self.symphony_control.meta_data.get_symphony_signature()
-            },
-            "modules": {
-                name: {
-                    "type": module.module_type.value,
-                    "capabilities": module.capabilities,
-                    "health_score": module.health_score,
-                    "metadata": module.metadata
-                }
-                for name, module in self.modules.items()
-            },
-            "heartbeat_history": [
-                {
-                    "cycle_id": hb.cycle_id,
-                    "timestamp": hb.timestamp.isoformat(),
-                    "active_modules": hb.active_modules,
-                    "health_metrics": hb.health_metrics,
-                    "compliance_score": hb.compliance_score
-                }
-                for hb in self.heartbeat_history[-10:]  # Last 10 heartbeats
-            ],
-            "shared_data_pool": self.shared_data_pool,
-            "metadata_registry": self.metadata_registry,
-            "audit_log": self.audit_log[-100:]  # Last 100 audit entries
-        }
+        suffixes = Path(output_path).suffixes
+        if compress is None:
+            compress = suffixes[-1:] == [".gz"]
+        if fmt is None:
+            fmt = "jsonl" if ".jsonl" in suffixes else "json"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        # Stream into a sibling temp file so readers never see a partial export
+        target = Path(output_path)
+        tmp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        opener = gzip.open if compress else open
+        try:
+            with opener(tmp_path, 'wt', encoding='utf-8') as f:
+                if fmt == "jsonl":
+                    self._write_jsonl_export(f, self._export_sections())
+                else:
+                    self._write_json_export(f, self._export_sections())
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
 
         self.logger.info(f"✅ Exported unified system data to {output_path}")
         return True
 
+    def _export_sections(self) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Yield (section, kind, payload) for the export; kind is "value", or
+        "object"/"array" for payloads that are iterated lazily
+        """
+        yield "metadata", "value", {
+            "creator": self.creator,
+            "export_timestamp": datetime.now().isoformat(),
+            "system_health": self.system_health,
+            "compliance_score": self._calculate_compliance_score(),
+            "symphony_signature": self.symphony_control.meta_data.get_symphony_signature()
+        }
+        yield "modules", "object", (
+            (name, {
+                "type": module.module_type.value,
+                "capabilities": module.capabilities,
+                "health_score": module.health_score,
+                "metadata": module.metadata
+            })
+            for name, module in list(self.modules.items())
+        )
+        yield "heartbeat_history", "array", (
+            {
+                "cycle_id": hb.cycle_id,
+                "timestamp": hb.timestamp.isoformat(),
+                "active_modules": hb.active_modules,
+                "health_metrics": hb.health_metrics,
+                "phase_durations": hb.phase_durations,
+                "compliance_score": hb.compliance_score
+            }
+            for hb in self.heartbeat_history[-10:]  # Last 10 heartbeats
+        )
+        # Snapshot iteration is safe while the heartbeat keeps publishing
+        yield "shared_data_pool", "object", self.shared_data_pool.snapshot().data.items()
+        yield "metadata_registry", "object", list(self.metadata_registry.items())
+        yield "audit_log", "array", self.audit_log.recent(100)  # Last 100 audit entries
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        return json.dumps(value, ensure_ascii=False, default=str)
+
+    def _write_json_export(self, f: TextIO, sections: Iterable[Tuple[str, str, Any]]):
+        """Write sections as one JSON document, item by item"""
+        f.write("{")
+        for index, (name, kind, payload) in enumerate(sections):
+            f.write(("," if index else "") + f"\n  {self._dumps(name)}: ")
+            if kind == "value":
+                f.write(self._dumps(payload))
+                continue
+
+            opening, closing = ("{", "}") if kind == "object" else ("[", "]")
+            f.write(opening)
+            for item_index, item in enumerate(payload):
+                f.write(("," if item_index else "") + "\n    ")
+                if kind == "object":
+                    key, item = item
+                    f.write(f"{self._dumps(key)}: ")
+                f.write(self._dumps(item))
+            f.write("\n  " + closing)
+        f.write("\n}\n")
+
+    def _write_jsonl_export(self, f: TextIO, sections: Iterable[Tuple[str, str, Any]]):
+        """Write one JSON line per section item"""
+        for name, kind, payload in sections:
+            if kind == "value":
+                f.write(self._dumps({"section": name, "data": payload}) + "\n")
+            elif kind == "object":
+                for key, item in payload:
+                    f.write(self._dumps({"section": name, "key": key, "data": item}) + "\n")
+            else:
+                for item in payload:
+                    f.write(self._dumps({"section": name, "data": item}) + "\n")
+
 def main():
     """Main function demonstrating unified AI orchestration"""
 
@@ -17,14 +17,21 @@ Copyright (c) 2025 Nguyễn Đức Cường (alpha_prime_omega)
 
 import json
 import os
+import time
 import hashlib
 import logging
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, deque
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
 import sqlite3
 import base64
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from dataclasses import dataclass, field
 
 # Import HYPERAI Framework components
@@ -41,6 +48,7 @@ class DataSource:
     data_hash: Optional[str] = None
     privacy_score: float = 1.0
     audit_trail: List[Dict] = field(default_factory=list)
+    change_token: Optional[Any] = None  # Extractor change token at the last sync
 
 @dataclass
 class UnifiedDataPoint:
@@ -54,24 +62,542 @@ class UnifiedDataPoint:
     compliance_tags: List[str] = field(default_factory=list)
     privacy_level: str = "internal"  # 'public', 'internal', 'confidential', 'restricted'
 
+PRIVACY_LEVELS = ["public", "internal", "confidential", "restricted"]  # Least to most sensitive
+GITHUB_API_URL = os.environ.get("GITHUB_API_URL", "https://api.github.com")
+DATA_DB = os.environ.get("HYPERAI_DATA_DB")  # Persist data points and audits here when set
+AUDIT_LOG_LIMIT = 1000  # Audit entries kept in memory; the store counts them all
+
+class GitHubRateLimitError(requests.RequestException):
+    """Raised instead of calling GitHub while the rate-limit quota is exhausted"""
+
+class TokenBucket:
+    """Token-bucket limiter: `rate` requests per second with bursts up to `capacity`"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until one is available; returns the time waited"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+        return wait
+
+@dataclass
+class CachedResponse:
+    """Last successful GET for a URL with its validators"""
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    poll_until: float = 0.0  # monotonic time before which GitHub asked us not to poll
+
+class GitHubClient:
+    """
+    Shared GitHub REST client for the integrator
+    Reuses pooled keep-alive connections, revalidates GETs with
+    If-None-Match/If-Modified-Since (304 responses do not count against the
+    quota), honors X-Poll-Interval and the rate-limit headers, and spaces
+    requests with a token bucket
+    """
+
+    def __init__(self, token: str, base_url: str = GITHUB_API_URL, rate: float = 1.0,
+                 burst: int = 20, pool_size: int = 10, timeout: float = 10.0):
+        self.token = token
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'Authorization': f'token {token}',
+            'Accept': 'application/vnd.github.v3+json'
+        })
+        self.bucket = TokenBucket(rate, burst)
+        self.rate_limit_remaining: Optional[int] = None
+        self.rate_limit_reset: Optional[float] = None  # epoch seconds
+        self.stats: Counter = Counter()
+        self._cache: Dict[str, CachedResponse] = {}
+        self._lock = threading.Lock()
+
+    def get_json(self, path: str, params: Optional[Dict[str, Any]] = None) -> Tuple[Any, bool]:
+        """
+        Conditional GET; returns (data, changed)
+        Within the poll interval, or on 304, the cached data is returned unchanged
+        """
+        url = self.base_url + path
+        key = url + ('?' + '&'.join(f"{k}={v}" for k, v in sorted(params.items())) if params else '')
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached and time.monotonic() < cached.poll_until:
+            self.stats["poll_interval_hits"] += 1
+            return cached.data, False
+
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+
+        response = self._request('GET', url, headers=headers, params=params)
+        if response.status_code == 304 and cached:
+            self.stats["not_modified"] += 1
+            cached.poll_until = self._poll_until(response)
+            return cached.data, False
+
+        response.raise_for_status()
+        data = response.json()
+        with self._lock:
+            self._cache[key] = CachedResponse(
+                data=data,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                poll_until=self._poll_until(response)
+            )
+        return data, True
+
+    def validator(self, path: str) -> Optional[str]:
+        """ETag (or Last-Modified) of the cached response for a path"""
+        cached = self._cache.get(self.base_url + path)
+        if cached is None:
+            return None
+        return cached.etag or cached.last_modified
+
+    def post_json(self, path: str, payload: Dict[str, Any]) -> Any:
+        """POST a JSON payload and return the decoded response"""
+        response = self._request('POST', self.base_url + path, json=payload)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send one request through the limiter and record the quota headers"""
+        if (self.rate_limit_remaining == 0 and self.rate_limit_reset
+                and time.time() < self.rate_limit_reset):
+            self.stats["rate_limited"] += 1
+            raise GitHubRateLimitError(
+                f"GitHub rate limit exhausted until {datetime.fromtimestamp(self.rate_limit_reset).isoformat()}"
+            )
+
+        if self.bucket.acquire():
+            self.stats["throttled"] += 1
+        response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+        self.stats["requests"] += 1
+
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is not None:
+            self.rate_limit_remaining = int(remaining)
+        if reset is not None:
+            self.rate_limit_reset = float(reset)
+        return response
+
+    @staticmethod
+    def _poll_until(response: requests.Response) -> float:
+        interval = response.headers.get('X-Poll-Interval')
+        return time.monotonic() + int(interval) if interval else 0.0
+
+    def close(self):
+        self.session.close()
+
+class CategoryColumn:
+    """Interned column: each distinct value is stored once and rows hold its code"""
+
+    def __init__(self, typecode: str = 'H', categories: Iterable[Any] = ()):
+        self.codes = array(typecode)
+        self.categories: List[Any] = []
+        self._index: Dict[Any, int] = {}
+        for category in categories:
+            self.intern(category)
+
+    def intern(self, value: Any) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(value)
+        return code
+
+    def append(self, value: Any):
+        self.codes.append(self.intern(value))
+
+    def __getitem__(self, row: int) -> Any:
+        return self.categories[self.codes[row]]
+
+class ColumnarDataStore:
+    """
+    Columnar in-memory store for unified data points
+    Categories (source, type, privacy level, tags) are interned into small
+    integer columns, content and metadata are JSON blobs addressed by offsets
+    into one byte arena, and per-category counters are kept on append so
+    breakdown reports never scan the rows
+    """
+
+    def __init__(self):
+        self.source = CategoryColumn()
+        self.source_type = CategoryColumn('B')
+        self.data_type = CategoryColumn()
+        # Pre-interned so a privacy code equals its index in PRIVACY_LEVELS
+        self.privacy_level = CategoryColumn('B', PRIVACY_LEVELS)
+        self.compliance_tags = CategoryColumn()
+        self.timestamps = array('d')
+        self.offsets = array('Q', [0])
+        self.arena = bytearray()
+        self.type_counts: Counter = Counter()  # (source_type, data_type) -> points
+        self.privacy_counts: Counter = Counter()
+        self.audits = 0
+        self._lock = threading.Lock()
+
+    def append(self, point: UnifiedDataPoint):
+        """Add one data point"""
+        blob = json.dumps(
+            [point.content, point.metadata], ensure_ascii=False, default=str, separators=(',', ':')
+        ).encode('utf-8')
+        with self._lock:
+            self.source.append(point.source)
+            self.source_type.append(point.source_type)
+            self.data_type.append(point.data_type)
+            self.privacy_level.append(point.privacy_level)
+            self.compliance_tags.append(tuple(point.compliance_tags))
+            self.timestamps.append(point.timestamp.timestamp())
+            self.arena += blob
+            self.offsets.append(len(self.arena))
+            self.type_counts[(point.source_type, point.data_type)] += 1
+            self.privacy_counts[point.privacy_level] += 1
+
+    def extend(self, points: Iterable[UnifiedDataPoint]) -> int:
+        """Add data points, returning how many were added"""
+        added = 0
+        for point in points:
+            self.append(point)
+            added += 1
+        return added
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def __iter__(self) -> Iterator[UnifiedDataPoint]:
+        return (self.point(row) for row in range(len(self)))
+
+    def point(self, row: int) -> UnifiedDataPoint:
+        """Materialize one row as a UnifiedDataPoint"""
+        content, metadata = json.loads(self.arena[self.offsets[row]:self.offsets[row + 1]])
+        return UnifiedDataPoint(
+            source=self.source[row],
+            source_type=self.source_type[row],
+            timestamp=datetime.fromtimestamp(self.timestamps[row]),
+            data_type=self.data_type[row],
+            content=content,
+            metadata=metadata,
+            compliance_tags=list(self.compliance_tags[row]),
+            privacy_level=self.privacy_level[row]
+        )
+
+    def breakdown(self) -> Dict[str, int]:
+        """Point counts keyed by "<source_type>_<data_type>" """
+        return {f"{source_type}_{data_type}": count
+                for (source_type, data_type), count in self.type_counts.items()}
+
+    def select_privacy(self, max_level: str) -> np.ndarray:
+        """Row indices whose privacy level is at most max_level"""
+        limit = PRIVACY_LEVELS.index(max_level)
+        with self._lock:
+            # Zero-copy view of the codes; released before the lock is
+            codes = np.frombuffer(self.privacy_level.codes, dtype=np.uint8)
+            rows = np.flatnonzero(codes <= limit)
+            del codes
+        return rows
+
+    def export_record(self, row: int) -> Dict[str, Any]:
+        """Export representation of one row"""
+        point = self.point(row)
+        return {
+            "source": point.source,
+            "source_type": point.source_type,
+            "timestamp": point.timestamp.isoformat(),
+            "data_type": point.data_type,
+            "content": point.content,
+            "compliance_tags": point.compliance_tags,
+            "privacy_level": point.privacy_level
+        }
+
+    def count_privacy(self, max_level: str) -> int:
+        """Number of points whose privacy level is at most max_level"""
+        return sum(self.privacy_counts[level] for level in PRIVACY_LEVELS[:PRIVACY_LEVELS.index(max_level) + 1])
+
+    def iter_export_records(self, max_level: str) -> Iterator[Dict[str, Any]]:
+        """Export records whose privacy level is at most max_level"""
+        for row in self.select_privacy(max_level):
+            yield self.export_record(int(row))
+
+    # Nothing outlives the process: fingerprints live in the integrator and
+    # recent audits in its bounded audit_log
+    def load_fingerprints(self, source: str) -> set:
+        return set()
+
+    def add_fingerprints(self, source: str, fingerprints: List[bytes]):
+        pass
+
+    def record_audit(self, entry: Dict[str, Any]):
+        self.audits += 1
+
+    def audit_count(self) -> int:
+        return self.audits
+
+    def flush(self):
+        pass
+
+    def close(self):
+        pass
+
+class SQLiteDataStore:
+    """
+    Persistent store for unified data points and audit entries
+    Same interface as ColumnarDataStore; points are indexed by source,
+    type, timestamp and privacy rank, inserts are buffered and written in
+    batches, and reports/exports run as queries rather than list scans
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS data_points (
+            id INTEGER PRIMARY KEY,
+            source TEXT NOT NULL,
+            source_type TEXT NOT NULL,
+            data_type TEXT NOT NULL,
+            privacy_rank INTEGER NOT NULL,
+            timestamp REAL NOT NULL,
+            content TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            compliance_tags TEXT NOT NULL,
+            privacy_level TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_points_source ON data_points(source);
+        CREATE INDEX IF NOT EXISTS idx_points_type ON data_points(source_type, data_type);
+        CREATE INDEX IF NOT EXISTS idx_points_timestamp ON data_points(timestamp);
+        CREATE INDEX IF NOT EXISTS idx_points_privacy ON data_points(privacy_rank);
+        CREATE TABLE IF NOT EXISTS record_fingerprints (
+            source TEXT NOT NULL,
+            fingerprint BLOB NOT NULL,
+            PRIMARY KEY (source, fingerprint)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS audit_log (
+            id INTEGER PRIMARY KEY,
+            timestamp TEXT NOT NULL,
+            action TEXT NOT NULL,
+            entry TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp);
+    """
+    INSERT_POINT_SQL = (
+        "INSERT INTO data_points (source, source_type, data_type, privacy_rank, timestamp, "
+        "content, metadata, compliance_tags, privacy_level) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+    INSERT_AUDIT_SQL = "INSERT INTO audit_log (timestamp, action, entry) VALUES (?, ?, ?)"
+    SELECT_COLUMNS = (
+        "source, source_type, data_type, privacy_rank, timestamp, content, metadata, compliance_tags, privacy_level"
+    )
+    FETCH_SIZE = 500
+
+    def __init__(self, db_path: str, batch_size: int = 500):
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._db = sqlite3.connect(db_path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(self.SCHEMA)
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(data_points)")}
+        if "privacy_level" not in columns:  # Database created before the column existed
+            self._db.execute("ALTER TABLE data_points ADD COLUMN privacy_level TEXT")
+        self._pending_points: List[tuple] = []
+        self._pending_audits: List[tuple] = []
+        self._lock = threading.RLock()
+
+    def append(self, point: UnifiedDataPoint):
+        """Buffer one data point, writing a batch when the buffer is full"""
+        row = (
+            point.source, point.source_type, point.data_type,
+            self._privacy_rank(point.privacy_level), point.timestamp.timestamp(),
+            json.dumps(point.content, ensure_ascii=False, default=str, separators=(',', ':')),
+            json.dumps(point.metadata, ensure_ascii=False, default=str, separators=(',', ':')),
+            json.dumps(point.compliance_tags, ensure_ascii=False),
+            point.privacy_level
+        )
+        with self._lock:
+            self._pending_points.append(row)
+            if len(self._pending_points) >= self.batch_size:
+                self._flush()
+
+    @staticmethod
+    def _privacy_rank(privacy_level: str) -> int:
+        """Index in PRIVACY_LEVELS; unknown levels rank above all of them, as in ColumnarDataStore"""
+        try:
+            return PRIVACY_LEVELS.index(privacy_level)
+        except ValueError:
+            return len(PRIVACY_LEVELS)
+
+    def extend(self, points: Iterable[UnifiedDataPoint]) -> int:
+        """Add data points, returning how many were added"""
+        added = 0
+        for point in points:
+            self.append(point)
+            added += 1
+        return added
+
+    def record_audit(self, entry: Dict[str, Any]):
+        """Buffer one audit entry"""
+        with self._lock:
+            self._pending_audits.append((
+                entry.get("timestamp", datetime.now().isoformat()), entry.get("action", ""),
+                json.dumps(entry, ensure_ascii=False, default=str)
+            ))
+            if len(self._pending_audits) >= self.batch_size:
+                self._flush()
+
+    def load_fingerprints(self, source: str) -> set:
+        """Fingerprints of records already stored for a source"""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT fingerprint FROM record_fingerprints WHERE source = ?", (source,)
+            ).fetchall()
+        return {bytes(row[0]) for row in rows}
+
+    def add_fingerprints(self, source: str, fingerprints: List[bytes]):
+        """Persist fingerprints of newly stored records"""
+        if not fingerprints:
+            return
+        with self._lock:
+            self._flush()
+            with self._db:
+                self._db.executemany(
+                    "INSERT OR IGNORE INTO record_fingerprints (source, fingerprint) VALUES (?, ?)",
+                    [(source, fingerprint) for fingerprint in fingerprints]
+                )
+
+    def flush(self):
+        """Write buffered points and audit entries"""
+        with self._lock:
+            self._flush()
+
+    def _flush(self):
+        if not (self._pending_points or self._pending_audits):
+            return
+        points, self._pending_points = self._pending_points, []
+        audits, self._pending_audits = self._pending_audits, []
+        with self._db:
+            self._db.executemany(self.INSERT_POINT_SQL, points)
+            self._db.executemany(self.INSERT_AUDIT_SQL, audits)
+
+    def _query(self, sql: str, params: tuple = ()) -> List[tuple]:
+        with self._lock:
+            self._flush()
+            return self._db.execute(sql, params).fetchall()
+
+    def _stream(self, sql: str, params: tuple = ()) -> Iterator[tuple]:
+        """Yield query rows in chunks without holding the lock between chunks"""
+        with self._lock:
+            self._flush()
+            cursor = self._db.cursor()
+            cursor.execute(sql, params)
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(self.FETCH_SIZE)
+            if not rows:
+                cursor.close()
+                return
+            yield from rows
+
+    def __len__(self) -> int:
+        return self._query("SELECT COUNT(*) FROM data_points")[0][0]
+
+    def __iter__(self) -> Iterator[UnifiedDataPoint]:
+        for row in self._stream(f"SELECT {self.SELECT_COLUMNS} FROM data_points ORDER BY id"):
+            yield self._point(row)
+
+    @staticmethod
+    def _point(row: tuple) -> UnifiedDataPoint:
+        source, source_type, data_type, privacy_rank, timestamp, content, metadata, tags, privacy_level = row
+        return UnifiedDataPoint(
+            source=source,
+            source_type=source_type,
+            timestamp=datetime.fromtimestamp(timestamp),
+            data_type=data_type,
+            content=json.loads(content),
+            metadata=json.loads(metadata),
+            compliance_tags=json.loads(tags),
+            privacy_level=privacy_level or PRIVACY_LEVELS[privacy_rank]
+        )
+
+    def breakdown(self) -> Dict[str, int]:
+        """Point counts keyed by "<source_type>_<data_type>" """
+        rows = self._query(
+            "SELECT source_type, data_type, COUNT(*) FROM data_points GROUP BY source_type, data_type"
+        )
+        return {f"{source_type}_{data_type}": count for source_type, data_type, count in rows}
+
+    def count_privacy(self, max_level: str) -> int:
+        """Number of points whose privacy level is at most max_level"""
+        return self._query(
+            "SELECT COUNT(*) FROM data_points WHERE privacy_rank <= ?", (PRIVACY_LEVELS.index(max_level),)
+        )[0][0]
+
+    def iter_export_records(self, max_level: str) -> Iterator[Dict[str, Any]]:
+        """Export records whose privacy level is at most max_level, streamed from disk"""
+        rows = self._stream(
+            f"SELECT {self.SELECT_COLUMNS} FROM data_points WHERE privacy_rank <= ? ORDER BY id",
+            (PRIVACY_LEVELS.index(max_level),)
+        )
+        for row in rows:
+            point = self._point(row)
+            yield {
+                "source": point.source,
+                "source_type": point.source_type,
+                "timestamp": point.timestamp.isoformat(),
+                "data_type": point.data_type,
+                "content": point.content,
+                "compliance_tags": point.compliance_tags,
+                "privacy_level": point.privacy_level
+            }
+
+    def audit_count(self) -> int:
+        return self._query("SELECT COUNT(*) FROM audit_log")[0][0]
+
+    def close(self):
+        """Flush buffers and close the database"""
+        with self._lock:
+            self._flush()
+            self._db.close()
+
 class UnifiedDataIntegrator:
     """
     Main integrator class ensuring 4 Pillars compliance
     """
 
-    def __init__(self):
-        # HYPERAI Framework integration
-        self.symphony_control = SymphonyControlCenter()
+    def __init__(self, symphony_control: Optional[SymphonyControlCenter] = None,
+                 db_path: Optional[str] = DATA_DB):
+        # HYPERAI Framework integration (reuse the caller's control center when given)
+        self.symphony_control = symphony_control or SymphonyControlCenter()
         self.creator = "Nguyễn Đức Cường (alpha_prime_omega)"
         self.framework_version = "1.0.0"
 
         # Data sources
         self.data_sources: Dict[str, DataSource] = {}
-        self.unified_data: List[UnifiedDataPoint] = []
+        # Persistent SQLite store when a database path is configured, else in-memory columns
+        self.unified_data = SQLiteDataStore(db_path) if db_path else ColumnarDataStore()
+        self._record_fingerprints: Dict[str, set] = {}  # Per source, records already stored
 
         # Compliance and security
         self.encryption_key = self._generate_encryption_key()
-        self.audit_log: List[Dict] = []
+        self.audit_log: deque = deque(maxlen=AUDIT_LOG_LIMIT)  # Recent entries; the store keeps count
+        self._github_client: Optional[GitHubClient] = None
+        self._github_client_lock = threading.Lock()
 
         # Setup logging
         self.logger = self._setup_logging()
@@ -84,6 +610,19 @@ class UnifiedDataIntegrator:
 
         self.logger.info("🎯 Unified Data Integrator initialized with 4 Pillars compliance")
 
+    @property
+    def github_client(self) -> GitHubClient:
+        """Pooled GitHub client for the current GITHUB_TOKEN"""
+        token = os.getenv('GITHUB_TOKEN')
+        client = self._github_client
+        if client is None or client.token != token:
+            # sync_all workers must share one client: its session, ETag cache and rate limiter
+            with self._github_client_lock:
+                client = self._github_client
+                if client is None or client.token != token:
+                    client = self._github_client = GitHubClient(token)
+        return client
+
     def _setup_logging(self) -> logging.Logger:
         """Setup secure logging with compliance tracking"""
         logger = logging.getLogger("UnifiedDataIntegrator")
@@ -152,6 +691,13 @@ class UnifiedDataIntegrator:
         source = self.data_sources[source_name]
 
         try:
+            # Skip extraction entirely when the source reports no change
+            change_token = self._change_token(source)
+            if change_token is not None and change_token == source.change_token:
+                source.last_sync = datetime.now()
+                self.logger.info(f"⏭️ {source_name} unchanged since last sync")
+                return True
+
             # Apply D&R Protocol before sync
             sync_context = f"sync_{source_name}"
             dr_result = self.symphony_control.apply_dr_protocol(
@@ -176,41 +722,128 @@ class UnifiedDataIntegrator:
                 self.logger.error(f"Unknown source type: {source.type}")
                 return False
 
-            # Validate and standardize data
-            validated_points = []
-            for point in data_points:
-                if self._validate_data_point(point):
-                    validated_points.append(point)
-
-            # Encrypt sensitive data
-            encrypted_points = [self._encrypt_data_point(point) for point in validated_points]
-
-            # Add to unified data store
-            self.unified_data.extend(encrypted_points)
+            # Stream points through validate -> dedup -> encrypt into the store;
+            # the integrity hash is updated as each record passes through
+            digest = hashlib.sha256()
+            stats = {"records": 0, "new": []}
+            pipeline = self._encrypt_stage(
+                self._dedup_stage(source_name, self._validate_stage(data_points), digest, stats)
+            )
+            added = self.unified_data.extend(pipeline)
+            # Commit fingerprints only once the store write went through, so a
+            # failing stage never marks records as stored that were not
+            self.unified_data.add_fingerprints(source_name, stats["new"])
+            self._record_fingerprints[source_name].update(stats["new"])
+            unchanged = stats["records"] - added
 
             # Update source metadata
             source.last_sync = datetime.now()
-            source.data_hash = self._calculate_data_hash(encrypted_points)
+            source.data_hash = digest.hexdigest()
+            source.change_token = change_token
 
             # Audit trail
             audit_entry = {
                 "timestamp": datetime.now().isoformat(),
                 "action": "sync",
                 "source": source_name,
-                "data_points": len(encrypted_points),
+                "data_points": added,
+                "unchanged_points": unchanged,
                 "compliance_score": source.compliance_level,
                 "creator_signature": self.symphony_control.meta_data.get_symphony_signature()
             }
             source.audit_trail.append(audit_entry)
-            self.audit_log.append(audit_entry)
+            self._record_audit(audit_entry)
 
-            self.logger.info(f"✅ Synced {len(encrypted_points)} data points from {source_name}")
+            self.logger.info(f"✅ Synced {added} new data points from {source_name} ({unchanged} unchanged)")
             return True
 
         except Exception as e:
             self.logger.error(f"❌ Sync failed for {source_name}: {e}")
             return False
 
+    def sync_all(self, max_workers: Optional[int] = None) -> Dict[str, bool]:
+        """
+        Sync every data source concurrently
+        Extraction (file reads, GitHub API calls) overlaps across sources;
+        each source streams its points through the stage pipeline
+        """
+        source_names = list(self.data_sources)
+        if not source_names:
+            return {}
+
+        workers = max_workers or len(source_names)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hyperai-sync") as executor:
+            results = dict(zip(source_names, executor.map(self.sync_data_source, source_names)))
+
+        synced = sum(results.values())
+        self.logger.info(f"🔄 Synced {synced}/{len(source_names)} data sources concurrently")
+        return results
+
+    def _validate_stage(self, points: Iterable[UnifiedDataPoint]) -> Iterator[UnifiedDataPoint]:
+        """Pass through points that pass validation"""
+        for point in points:
+            if self._validate_data_point(point):
+                yield point
+
+    def _dedup_stage(self, source_name: str, points: Iterable[UnifiedDataPoint],
+                     digest: Any, stats: Dict[str, int]) -> Iterator[UnifiedDataPoint]:
+        """Hash every record and pass through only those not already stored
+
+        New fingerprints are collected in stats["new"]; the caller commits
+        them after the store write succeeds.
+        """
+        stored = self._record_fingerprints.get(source_name)
+        if stored is None:
+            stored = self._record_fingerprints[source_name] = self.unified_data.load_fingerprints(source_name)
+        seen = set()  # Repeats within this sync
+        for point in points:
+            fingerprint = self._record_fingerprint(point)
+            digest.update(fingerprint)
+            stats["records"] += 1
+            if fingerprint not in stored and fingerprint not in seen:
+                seen.add(fingerprint)
+                stats["new"].append(fingerprint)
+                yield point
+
+    def _encrypt_stage(self, points: Iterable[UnifiedDataPoint]) -> Iterator[UnifiedDataPoint]:
+        """Encrypt sensitive points on their way to the store"""
+        for point in points:
+            yield self._encrypt_data_point(point)
+
+    def _change_token(self, source: DataSource) -> Optional[Any]:
+        """
+        Cheap token that changes whenever the source's records may have changed
+        None means the source cannot tell, so it is always re-extracted
+        """
+        if source.type == "vscode":
+            try:
+                stat = os.stat(source.path)
+            except OSError:
+                return None
+            return (stat.st_mtime_ns, stat.st_size)
+
+        if source.type == "github" and os.getenv('GITHUB_TOKEN'):
+            # Live API: a conditional GET (free when answered with 304) yields the
+            # notifications ETag; without one, re-extract and let fingerprints drop repeats
+            try:
+                self.github_client.get_json('/notifications')
+            except requests.RequestException:
+                return None
+            validator = self.github_client.validator('/notifications')
+            return ("etag", validator) if validator else None
+
+        # Mock sources are static
+        return ("mock", source.type, source.path)
+
+    @staticmethod
+    def _record_fingerprint(point: UnifiedDataPoint) -> bytes:
+        """Identity of a record's data, ignoring when it was extracted"""
+        record = json.dumps(
+            [point.source, point.data_type, point.privacy_level, point.content],
+            sort_keys=True, default=str, separators=(',', ':')
+        )
+        return hashlib.blake2b(record.encode('utf-8'), digest_size=16).digest()
+
     def _extract_chrome_data(self, source: DataSource) -> List[UnifiedDataPoint]:
         """Extract data from Chrome bookmarks (mock data for demo)"""
         data_points = []
@@ -402,26 +1035,20 @@ class UnifiedDataIntegrator:
             self.logger.warning("No GITHUB_TOKEN found, using mock notifications")
             return self._get_mock_notifications()
 
-        headers = {
-            'Authorization': f'token {github_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-
         try:
-            response = requests.get('https://api.github.com/notifications', headers=headers)
-            response.raise_for_status()
-
-            notifications = response.json()
-            self.logger.info(f"✅ Retrieved {len(notifications)} GitHub notifications")
+            notifications, changed = self.github_client.get_json('/notifications')
+            if changed:
+                self.logger.info(f"✅ Retrieved {len(notifications)} GitHub notifications")
 
             # Audit the access
             audit_entry = {
                 "timestamp": datetime.now().isoformat(),
                 "action": "github_notifications_check",
                 "notifications_count": len(notifications),
+                "not_modified": not changed,
                 "compliance_score": 1.0
             }
-            self.audit_log.append(audit_entry)
+            self._record_audit(audit_entry)
 
             return notifications
 
@@ -449,17 +1076,10 @@ class UnifiedDataIntegrator:
             self.logger.error("No GITHUB_TOKEN found for reply")
             return False
 
-        headers = {
-            'Authorization': f'token {github_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-
         comment_data = {'body': reply_text}
 
         try:
-            url = f'https://api.github.com/repos/{repo_full_name}/issues/{issue_number}/comments'
-            response = requests.post(url, headers=headers, json=comment_data)
-            response.raise_for_status()
+            self.github_client.post_json(f'/repos/{repo_full_name}/issues/{issue_number}/comments', comment_data)
 
             self.logger.info(f"✅ Posted reply to {repo_full_name}#{issue_number}")
 
@@ -472,7 +1092,7 @@ class UnifiedDataIntegrator:
                 "reply_length": len(reply_text),
                 "compliance_score": 1.0
             }
-            self.audit_log.append(audit_entry)
+            self._record_audit(audit_entry)
 
             return True
 
@@ -501,23 +1121,17 @@ class UnifiedDataIntegrator:
             self.logger.error("No GITHUB_TOKEN found for Copilot control")
             return False
 
-        headers = {
-            'Authorization': f'token {github_token}',
-            'Accept': 'application/vnd.github.v3+json'
-        }
-
         try:
             if action == 'check_status':
                 # Check Copilot usage for the repo
-                url = f'https://api.github.com/repos/{repo_full_name}/copilot/usage'
-                response = requests.get(url, headers=headers)
-                if response.status_code == 200:
-                    usage = response.json()
-                    self.logger.info(f"✅ Copilot status for {repo_full_name}: {usage}")
-                    return True
-                else:
+                try:
+                    usage, changed = self.github_client.get_json(f'/repos/{repo_full_name}/copilot/usage')
+                except requests.HTTPError:
                     self.logger.warning(f"Copilot not available for {repo_full_name}")
                     return False
+                if changed:
+                    self.logger.info(f"✅ Copilot status for {repo_full_name}: {usage}")
+                return True
 
             elif action in ['enable', 'disable']:
                 # Note: GitHub API doesn't have direct enable/disable for Copilot
@@ -604,11 +1218,6 @@ class UnifiedDataIntegrator:
 
         return point
 
-    def _calculate_data_hash(self, data_points: List[UnifiedDataPoint]) -> str:
-        """Calculate hash of data points for integrity checking"""
-        data_str = json.dumps([point.content for point in data_points], sort_keys=True)
-        return hashlib.sha256(data_str.encode()).hexdigest()
-
     def _has_restricted_access(self) -> bool:
         """Check if current context has access to restricted data"""
         # In production, this would check user permissions, context, etc.
@@ -636,34 +1245,29 @@ class UnifiedDataIntegrator:
             },
             "data_breakdown": {},
             "audit_summary": {
-                "total_audits": len(self.audit_log),
+                "total_audits": self.unified_data.audit_count(),
                 "last_sync": max((s.last_sync for s in self.data_sources.values() if s.last_sync), default=None)
             },
             "symphony_signature": self.symphony_control.meta_data.get_symphony_signature(),
             "socratic_reflection": dr_result["socratic_reflection"]
         }
 
-        # Data breakdown by source and type
-        for point in self.unified_data:
-            source_key = f"{point.source_type}_{point.data_type}"
-            if source_key not in report["data_breakdown"]:
-                report["data_breakdown"][source_key] = 0
-            report["data_breakdown"][source_key] += 1
+        # Data breakdown by source and type, from the store's running counters
+        report["data_breakdown"] = self.unified_data.breakdown()
 
         return report
 
     def export_compliant_data(self, output_path: str, privacy_filter: str = "internal"):
         """Export data with compliance filtering"""
 
-        # Filter data based on privacy level
-        filtered_data = [
-            point for point in self.unified_data
-            if self._privacy_level_allows_export(point.privacy_level, privacy_filter)
-        ]
+        # Filter data based on privacy level (vectorized over the privacy column)
+        if privacy_filter not in PRIVACY_LEVELS:
+            raise ValueError(f"Unknown privacy filter: {privacy_filter}")
+        exported = self.unified_data.count_privacy(privacy_filter)
 
         # Apply D&R Protocol for export
         dr_result = self.symphony_control.apply_dr_protocol(
-            f"Export {len(filtered_data)} data points with privacy filter {privacy_filter}",
+            f"Export {exported} data points with privacy filter {privacy_filter}",
             "data_export"
         )
 
@@ -672,51 +1276,51 @@ class UnifiedDataIntegrator:
         if pillars_passed < 3:  # Require at least 3/4 pillars
             self.logger.warning(f"4 Pillars check partially failed for data export ({pillars_passed}/4), proceeding with caution")
 
-        # Export data
-        export_data = {
-            "metadata": {
-                "creator": self.creator,
-                "export_timestamp": datetime.now().isoformat(),
-                "privacy_filter": privacy_filter,
-                "data_points": len(filtered_data),
-                "compliance_signature": self.symphony_control.meta_data.get_symphony_signature()
-            },
-            "data_points": [
-                {
-                    "source": point.source,
-                    "source_type": point.source_type,
-                    "timestamp": point.timestamp.isoformat(),
-                    "data_type": point.data_type,
-                    "content": point.content,
-                    "compliance_tags": point.compliance_tags,
-                    "privacy_level": point.privacy_level
-                }
-                for point in filtered_data
-            ]
+        # Export data, one data point at a time
+        metadata = {
+            "creator": self.creator,
+            "export_timestamp": datetime.now().isoformat(),
+            "privacy_filter": privacy_filter,
+            "data_points": exported,
+            "compliance_signature": self.symphony_control.meta_data.get_symphony_signature()
         }
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+            f.write('{\n  "metadata": ' + json.dumps(metadata, ensure_ascii=False) + ',\n  "data_points": [')
+            for index, record in enumerate(self.unified_data.iter_export_records(privacy_filter)):
+                f.write(("," if index else "") + "\n    ")
+                f.write(json.dumps(record, ensure_ascii=False, default=str))
+            f.write("\n  ]\n}\n")
 
         # Audit export
         audit_entry = {
             "timestamp": datetime.now().isoformat(),
             "action": "export",
             "output_path": output_path,
-            "data_points": len(filtered_data),
+            "data_points": exported,
             "privacy_filter": privacy_filter,
             "creator_signature": self.symphony_control.meta_data.get_symphony_signature()
         }
-        self.audit_log.append(audit_entry)
+        self._record_audit(audit_entry)
 
-        self.logger.info(f"✅ Exported {len(filtered_data)} data points to {output_path}")
+        self.logger.info(f"✅ Exported {exported} data points to {output_path}")
         return True
 
+    def _record_audit(self, entry: Dict[str, Any]):
+        """Record an audit entry in the store and the bounded in-memory window"""
+        self.audit_log.append(entry)
+        self.unified_data.record_audit(entry)
+
+    def close(self):
+        """Flush and close the data store and the GitHub client"""
+        self.unified_data.close()
+        if self._github_client is not None:
+            self._github_client.close()
+
     def _privacy_level_allows_export(self, data_level: str, filter_level: str) -> bool:
         """Check if data privacy level allows export under given filter"""
-        levels = ["public", "internal", "confidential", "restricted"]
-        data_index = levels.index(data_level)
-        filter_index = levels.index(filter_level)
+        data_index = PRIVACY_LEVELS.index(data_level)
+        filter_index = PRIVACY_LEVELS.index(filter_level)
         return data_index <= filter_index
 
 def main():
@@ -731,10 +1335,7 @@ def main():
     integrator = UnifiedDataIntegrator()
 
     # Sync all available data sources
-    synced_sources = 0
-    for source_name in integrator.data_sources.keys():
-        if integrator.sync_data_source(source_name):
-            synced_sources += 1
+    synced_sources = sum(integrator.sync_all().values())
 
     print(f"✅ Synced {synced_sources}/{len(integrator.data_sources)} data sources")
 